@@ -6,11 +6,25 @@ from .investor_brain import (
     HowardMarksBrain,
     GeorgeSorosBrain,
     create_investor_brain,
+    register_brain,
+    resolve_investor_id,
+    registered_brains,
+    BrainSpec,
     Company,
     MarketContext,
     MarketPhase,
-    InvestorDecision
+    InvestorDecision,
+    BatchDecision,
+    PreparedContext,
+    company_columns
 )
+from .brain_registry import BrainRegistry, BrainSnapshot
+from .pattern_matcher import MultiPatternMatcher, PatternMatch
+# backtester / simulation 은 pandas 가 필요하므로 패키지 import 시 로드하지 않는다.
+# 사용처에서 advanced_ai.backtester, advanced_ai.simulation 을 직접 import 할 것.
+from .universe import CompanyUniverse, CompanyView
+from .scenarios import ScenarioEngine, ScenarioResult, ScenarioSet
+from .sensitivity import SensitivityAnalyzer, SensitivityResult
 
 __all__ = [
     'InvestorBrain',
@@ -19,9 +33,27 @@ __all__ = [
     'HowardMarksBrain',
     'GeorgeSorosBrain',
     'create_investor_brain',
+    'register_brain',
+    'resolve_investor_id',
+    'registered_brains',
+    'BrainSpec',
     'Company',
     'MarketContext',
     'MarketPhase',
-    'InvestorDecision'
+    'InvestorDecision',
+    'BatchDecision',
+    'PreparedContext',
+    'company_columns',
+    'BrainRegistry',
+    'BrainSnapshot',
+    'MultiPatternMatcher',
+    'PatternMatch',
+    'CompanyUniverse',
+    'CompanyView',
+    'ScenarioEngine',
+    'ScenarioResult',
+    'ScenarioSet',
+    'SensitivityAnalyzer',
+    'SensitivityResult'
 ]
 
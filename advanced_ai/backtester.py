@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+"""
+🕰️ 이벤트 기반 백테스터
+거장 인사이트와 뇌의 투자 결정을 실제 가격 이력에 다시 돌려 선행 수익률/적중률/낙폭 계산
+"""
+
+import json
+import re
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .investor_brain import InvestorDecision
+
+# 뇌 결정 방향 (avoid는 '안 산 게 맞았나'로 본다)
+ACTION_DIRECTION = {'buy': 1, 'hold': 0, 'sell': -1, 'avoid': -1}
+
+# 티커로 보이는 표기 (AAPL, BRK.B, 3333.HK)
+TICKER_PATTERN = re.compile(r'^[A-Z0-9][A-Z0-9.\-]{0,9}$')
+
+def sentiment_direction(sentiment: str) -> int:
+    """인사이트 감성 -> 방향 (+1 매수, -1 매도, 0 중립)"""
+    sentiment = (sentiment or '').lower()
+    if 'bearish' in sentiment:
+        return -1
+    if 'bullish' in sentiment or 'optimistic' in sentiment:
+        return 1
+    return 0
+
+@dataclass
+class BacktestEvent:
+    """백테스트 이벤트 (이 날짜에 이 투자자가 이 종목을 이 방향으로 봤다)"""
+    date: str
+    ticker: str
+    investor: str
+    direction: int  # +1, -1, 0
+    confidence: float = 1.0
+    source: str = 'insight'  # insight, decision
+    event_id: str = ''
+
+def events_from_insights(data_dir: str = "data/investors",
+                         resolve: Optional[Callable[[str], Optional[str]]] = None) -> List[BacktestEvent]:
+    """data/investors/*.json 인사이트를 이벤트로 변환
+
+    companies_mentioned 중 티커 표기는 그대로 쓰고, 회사명은 resolve(이름 -> 티커)로 바꾼다.
+    """
+    events = []
+    for path in sorted(Path(data_dir).glob("*.json")):
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+
+        for insight in data.get('insights', []):
+            tickers = []
+            for mention in insight.get('companies_mentioned', []):
+                ticker = mention if TICKER_PATTERN.match(mention) else (resolve(mention) if resolve else None)
+                if ticker and ticker != 'PRIVATE' and ticker not in tickers:
+                    tickers.append(ticker)
+
+            direction = sentiment_direction(insight.get('sentiment', 'neutral'))
+            for ticker in tickers:
+                events.append(BacktestEvent(
+                    date=insight['date_said'],
+                    ticker=ticker,
+                    investor=path.stem,
+                    direction=direction,
+                    confidence=insight.get('confidence_score', 0.5),
+                    source='insight',
+                    event_id=insight.get('id', '')
+                ))
+    return events
+
+def events_from_decisions(records: Iterable[Tuple[str, str, str, InvestorDecision]]) -> List[BacktestEvent]:
+    """(날짜, 티커, 투자자, InvestorDecision) 기록을 이벤트로 변환"""
+    return [
+        BacktestEvent(
+            date=str(date),
+            ticker=ticker,
+            investor=investor,
+            direction=ACTION_DIRECTION.get(decision.action, 0),
+            confidence=decision.confidence,
+            source='decision',
+            event_id=f"{investor}:{ticker}:{date}"
+        )
+        for date, ticker, investor, decision in records
+    ]
+
+@dataclass
+class BacktestResult:
+    """백테스트 결과 (이벤트별 표 + 투자자별 요약)"""
+    events: pd.DataFrame
+    summary: pd.DataFrame
+    horizons: Tuple[int, ...]
+    skipped: Dict[str, int] = field(default_factory=dict)  # 사유 -> 건수
+
+    def by(self, column: str) -> pd.DataFrame:
+        """임의 열(ticker, source 등) 기준 요약"""
+        return summarize(self.events, self.horizons, column)
+
+def summarize(events: pd.DataFrame, horizons: Sequence[int], column: str = 'investor') -> pd.DataFrame:
+    """그룹별 이벤트 수, 기간별 적중률/평균 방향 수익률, 낙폭"""
+    if events.empty:
+        return pd.DataFrame()
+
+    frame = events.copy()
+    aggregations = {'events': ('ticker', 'size'), 'worst_drawdown': ('max_drawdown', 'min'),
+                    'avg_drawdown': ('max_drawdown', 'mean')}
+    directional = frame['direction'] != 0
+    for horizon in horizons:
+        signed = frame[f'signed_{horizon}d']
+        # 중립 이벤트와 아직 결과가 없는 이벤트는 적중률에서 뺀다
+        frame[f'_hit_{horizon}d'] = (signed > 0).where(directional & signed.notna())
+        aggregations[f'hit_rate_{horizon}d'] = (f'_hit_{horizon}d', 'mean')
+        aggregations[f'avg_return_{horizon}d'] = (f'signed_{horizon}d', 'mean')
+        aggregations[f'median_return_{horizon}d'] = (f'signed_{horizon}d', 'median')
+    return frame.groupby(column).agg(**aggregations)
+
+class Backtester:
+    """가격 행렬 위에서 이벤트를 한꺼번에 재생하는 백테스터
+
+    진입은 이벤트 날짜 당일 또는 그 다음 첫 거래일 종가이며, 기간 h의 수익률은
+    h 거래일 뒤 종가 기준이다. 모든 이벤트의 진입/청산 위치를 searchsorted와
+    팬시 인덱싱으로 한 번에 구하므로 이벤트 수만큼 파이썬 루프를 돌지 않는다.
+    """
+
+    def __init__(self, prices: pd.DataFrame, horizons: Sequence[int] = (21, 63, 252),
+                 chunk_size: int = 20000):
+        index = pd.DatetimeIndex(prices.index)
+        if index.tz is not None:
+            index = index.tz_localize(None)
+        order = np.argsort(index.values, kind='stable')
+        self.dates = index.values[order].astype('datetime64[D]')
+        self.matrix = prices.to_numpy(dtype=float)[order]  # 거래일 x 티커
+        self.ticker_index = {ticker: i for i, ticker in enumerate(prices.columns)}
+        self.horizons = tuple(horizons)
+        self.chunk_size = chunk_size
+
+    @classmethod
+    def from_provider(cls, provider, tickers: Iterable[str], period: str = "max", **kwargs) -> 'Backtester':
+        """시장 데이터 제공자에서 가격 이력을 받아 생성"""
+        from market_data import MarketDataUnavailable, SnapshotEngine
+
+        engine = SnapshotEngine(provider, period=period)
+        try:
+            snapshot = engine.fetch(list(dict.fromkeys(tickers)))
+        finally:
+            engine.close()
+        if snapshot.prices.empty:
+            raise MarketDataUnavailable(f"가격 이력 없음: {snapshot.failures}")
+        return cls(snapshot.prices, **kwargs)
+
+    def _drawdowns(self, entry: np.ndarray, cols: np.ndarray, direction: np.ndarray) -> np.ndarray:
+        """보유 기간(최장 horizon) 동안 방향 기준 최대 낙폭"""
+        span = max(self.horizons) + 1
+        out = np.full(len(entry), np.nan)
+        steps = np.arange(span)
+
+        for start in range(0, len(entry), self.chunk_size):
+            stop = start + self.chunk_size
+            rows = entry[start:stop, None] + steps
+            inside = rows < len(self.dates)
+            path = self.matrix[np.minimum(rows, len(self.dates) - 1), cols[start:stop, None]]
+            path = np.where(inside, path, np.nan)
+
+            # 매수는 가격, 매도는 가격 하락이 이익인 자산 곡선 (중립은 매수로 본다)
+            sign = np.where(direction[start:stop] < 0, -1.0, 1.0)[:, None]
+            equity = np.maximum(1 + sign * (path / path[:, :1] - 1), 0.0)  # 0 = 전액 손실
+            peak = np.fmax.accumulate(equity, axis=1)
+            with np.errstate(invalid='ignore'):
+                out[start:stop] = np.nanmin(equity / peak - 1, axis=1)
+        return out
+
+    def run(self, events: Sequence[BacktestEvent]) -> BacktestResult:
+        """이벤트 전체 재생"""
+        frame = pd.DataFrame([vars(event) for event in events],
+                             columns=list(BacktestEvent.__dataclass_fields__))
+        skipped = {'unknown_ticker': 0, 'no_price': 0}
+
+        cols = frame['ticker'].map(self.ticker_index)
+        known = cols.notna().to_numpy()
+        skipped['unknown_ticker'] = int((~known).sum())
+
+        event_dates = pd.to_datetime(frame['date'], errors='coerce').to_numpy().astype('datetime64[D]')
+        entry = np.searchsorted(self.dates, event_dates, side='left')
+        valid = known & ~np.isnat(event_dates) & (entry < len(self.dates))
+
+        cols = cols.fillna(0).to_numpy(dtype=np.int64)
+        entry_price = np.full(len(frame), np.nan)
+        entry_price[valid] = self.matrix[entry[valid], cols[valid]]
+        priced = valid & ~np.isnan(entry_price)
+        skipped['no_price'] = int((known & ~priced).sum())
+
+        frame = frame[priced].reset_index(drop=True)
+        entry, cols, entry_price = entry[priced], cols[priced], entry_price[priced]
+        direction = frame['direction'].to_numpy()
+
+        frame['entry_date'] = self.dates[entry]
+        frame['entry_price'] = entry_price
+        for horizon in self.horizons:
+            exit_row = entry + horizon
+            inside = exit_row < len(self.dates)
+            exit_price = np.where(inside, self.matrix[np.minimum(exit_row, len(self.dates) - 1), cols], np.nan)
+            forward = exit_price / entry_price - 1
+            frame[f'return_{horizon}d'] = forward
+            frame[f'signed_{horizon}d'] = np.where(direction != 0, direction * forward, np.nan)
+        frame['max_drawdown'] = self._drawdowns(entry, cols, direction)
+
+        return BacktestResult(
+            events=frame,
+            summary=summarize(frame, self.horizons),
+            horizons=self.horizons,
+            skipped=skipped
+        )
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+🗂️ Brain Registry - 프로세스 전역 거장 뇌 인스턴스 관리
+
+"뇌는 한 번만 만들고, 배운 것은 요청이 바뀌어도 잊지 않는다"
+"""
+
+import copy
+import threading
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterable, Optional
+
+from .investor_brain import InvestorBrain, InvestorDecision, create_investor_brain, resolve_investor_id
+
+@dataclass
+class BrainSnapshot:
+    """요청 단위 뇌 스냅샷 (요청 처리 중 보정값이 바뀌지 않음)"""
+    brains: Dict[str, InvestorBrain]  # 정규 투자자 ID -> 뇌 (요청 순서, 중복 제거)
+    calibration: Dict[str, float]  # 정규 투자자 ID -> confidence_calibration
+    version: int  # 스냅샷 시점의 레지스트리 보정 버전
+
+class BrainRegistry:
+    """거장 뇌 레지스트리
+
+    읽기는 잠금 없이 현재 사전을 참조하고, 생성과 학습은 잠금 아래에서
+    새 사전을 만들어 통째로 교체한다 (copy-on-write). 등록된 뇌 인스턴스는
+    공개된 뒤 변경되지 않으므로 스냅샷으로 받은 뇌는 안전하게 공유된다.
+    뇌는 별칭이 아닌 정규 투자자 ID로 보관한다 ('buffett'과 'warren_buffett'은 같은 뇌).
+    """
+
+    def __init__(self, factory: Callable[[str], InvestorBrain] = create_investor_brain,
+                 resolver: Callable[[str], Optional[str]] = resolve_investor_id):
+        self._factory = factory
+        self._resolver = resolver
+        self._brains: Dict[str, InvestorBrain] = {}
+        self._lock = threading.Lock()
+        self.version = 0  # confidence_calibration이 바뀔 때마다 증가
+
+    def _key(self, investor_type: str) -> str:
+        """정규 투자자 ID (알 수 없는 타입은 ValueError)"""
+        key = self._resolver(investor_type)
+        if key is None:
+            raise ValueError(f"Unknown investor type: {investor_type}")
+        return key
+
+    def get(self, investor_type: str) -> InvestorBrain:
+        """투자자 타입의 공유 뇌 (처음 한 번만 생성, 알 수 없는 타입은 ValueError)"""
+        key = self._key(investor_type)
+        brain = self._brains.get(key)
+        if brain is not None:
+            return brain
+
+        with self._lock:
+            brain = self._brains.get(key)
+            if brain is None:
+                brain = self._factory(key)
+                brains = dict(self._brains)
+                brains[key] = brain
+                self._brains = brains
+        return brain
+
+    def snapshot(self, investor_types: Iterable[str]) -> BrainSnapshot:
+        """요청 단위 스냅샷 생성 (알 수 없는 투자자 타입은 건너뜀)"""
+        current = self._brains
+        version = self.version
+        brains = {}
+
+        for investor_type in investor_types:
+            key = self._resolver(investor_type)
+            if key is None or key in brains:
+                continue
+            brain = current.get(key)
+            if brain is None:
+                brain = self.get(key)
+            brains[key] = brain
+
+        return BrainSnapshot(
+            brains=brains,
+            calibration={key: brain.confidence_calibration for key, brain in brains.items()},
+            version=version
+        )
+
+    def learn_from_outcome(self, investor_type: str, decision: InvestorDecision, actual_outcome: float) -> float:
+        """결정 결과를 공유 뇌에 학습시키고 새 confidence_calibration 반환"""
+        key = self._key(investor_type)
+        self.get(investor_type)
+
+        with self._lock:
+            brain = self._brains[key]
+            learned = copy.copy(brain)
+            learned.memory = copy.copy(brain.memory)
+            learned.learn_from_outcome(decision, actual_outcome)
+
+            brains = dict(self._brains)
+            brains[key] = learned
+            self._brains = brains
+            if learned.confidence_calibration != brain.confidence_calibration:
+                self.version += 1
+
+        return learned.confidence_calibration
+
+    def calibrations(self) -> Dict[str, float]:
+        """등록된 모든 뇌의 현재 confidence_calibration"""
+        return {key: brain.confidence_calibration for key, brain in self._brains.items()}
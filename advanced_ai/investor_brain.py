@@ -11,6 +11,7 @@ from dataclasses import dataclass
 from enum import Enum
 import json
 import re
+import time
 from datetime import datetime, timedelta
 
 class MarketPhase(Enum):
@@ -54,12 +55,223 @@ class InvestorDecision:
     key_factors: List[str]
     time_horizon: str
 
+@dataclass
+class BatchDecision:
+    """일괄 투자 결정 (기업별 배열)"""
+    actions: np.ndarray  # buy, sell, hold, avoid
+    confidences: np.ndarray  # 0-1
+    scores: np.ndarray  # 최종 점수 (스칼라 경로의 final_score, 계산되지 않으면 NaN)
+
+    def __len__(self) -> int:
+        return len(self.actions)
+
+@dataclass
+class PreparedContext:
+    """뇌별로 미리 계산한 시장 상황 항목 (기업과 무관, MarketContext당 한 번 계산)"""
+    context: MarketContext
+    brain_class: type
+    terms: Dict[str, float]
+
+# 일괄 분석에 사용하는 기업 필드
+COMPANY_NUMERIC_FIELDS = (
+    'pe_ratio', 'pb_ratio', 'roe', 'debt_equity', 'revenue_growth',
+    'business_complexity', 'moat_strength'
+)
+COMPANY_TEXT_FIELDS = ('ticker', 'name', 'sector', 'growth_stage')
+
+def _has_field(frame, field: str) -> bool:
+    """structured array / DataFrame / dict 공통 필드 존재 확인"""
+    names = getattr(getattr(frame, 'dtype', None), 'names', None)
+    if names is not None:
+        return field in names
+    if hasattr(frame, 'columns'):
+        return field in frame.columns
+    return field in frame
+
+def company_columns(frame) -> Dict[str, np.ndarray]:
+    """기업 데이터를 열(column) 배열 사전으로 변환
+
+    NumPy structured array, pandas DataFrame, 열 사전(dict of arrays),
+    Company 리스트, CompanyUniverse를 모두 받는다. ticker/name 열은 없으면 빈 문자열로 채운다.
+    """
+    if hasattr(frame, 'company_columns'):
+        return frame.company_columns()
+    if isinstance(frame, (list, tuple)):
+        columns = {
+            field: np.array([getattr(c, field) for c in frame], dtype=float)
+            for field in COMPANY_NUMERIC_FIELDS
+        }
+        for field in COMPANY_TEXT_FIELDS:
+            columns[field] = np.array([getattr(c, field) for c in frame], dtype=object)
+        return columns
+
+    columns = {field: np.asarray(frame[field], dtype=float) for field in COMPANY_NUMERIC_FIELDS}
+    size = len(columns['pe_ratio'])
+    for field in COMPANY_TEXT_FIELDS:
+        if _has_field(frame, field):
+            values = np.asarray(frame[field])
+            # 고정 폭 문자열 배열은 그대로 (np.unique가 object 배열보다 훨씬 빠름)
+            columns[field] = values if values.dtype.kind == 'U' else np.asarray(values, dtype=object)
+        elif field in ('ticker', 'name'):
+            columns[field] = np.full(size, '', dtype=object)
+        else:
+            raise KeyError(f"Missing company field: {field}")
+    return columns
+
+def iter_companies(columns: Dict[str, np.ndarray]):
+    """열 배열 사전을 Company 객체로 순회"""
+    for i in range(len(columns['pe_ratio'])):
+        yield Company(
+            ticker=columns['ticker'][i],
+            name=columns['name'][i],
+            sector=columns['sector'][i],
+            pe_ratio=float(columns['pe_ratio'][i]),
+            pb_ratio=float(columns['pb_ratio'][i]),
+            roe=float(columns['roe'][i]),
+            debt_equity=float(columns['debt_equity'][i]),
+            revenue_growth=float(columns['revenue_growth'][i]),
+            business_complexity=float(columns['business_complexity'][i]),
+            moat_strength=float(columns['moat_strength'][i]),
+            growth_stage=columns['growth_stage'][i]
+        )
+
+def map_categories(values: np.ndarray, mapper, dtype=float) -> np.ndarray:
+    """범주형 열을 고유값 단위로 한 번씩만 변환 (섹터 점수표 등)"""
+    uniques, inverse = np.unique(values, return_inverse=True)
+    table = np.array([mapper(v) for v in uniques], dtype=dtype)
+    return table[inverse.reshape(-1)]
+
+def builtin_max(bound: float, values) -> np.ndarray:
+    """스칼라 경로의 max(bound, x)와 같은 결과 (x가 NaN이면 bound, np.maximum은 NaN을 퍼뜨림)"""
+    values = np.asarray(values, dtype=float)
+    return np.where(values > bound, values, bound)
+
+def builtin_min(bound: float, values) -> np.ndarray:
+    """스칼라 경로의 min(bound, x)와 같은 결과 (x가 NaN이면 bound)"""
+    values = np.asarray(values, dtype=float)
+    return np.where(values < bound, values, bound)
+
+def decision_quality(actions: np.ndarray, outcomes: np.ndarray) -> np.ndarray:
+    """결정 품질 일괄 평가 (InvestorBrain.evaluate_decision_quality와 같은 규칙)"""
+    actions = np.asarray(actions)
+    outcomes = np.asarray(outcomes, dtype=float)
+    quality = builtin_max(0.0, 1 - np.abs(outcomes) * 10)
+    quality = np.where((actions == 'avoid') & (outcomes < -0.1), 0.8, quality)
+    quality = np.where((actions == 'sell') & (outcomes < -0.05), 1.0, quality)
+    return np.where((actions == 'buy') & (outcomes > 0.05), 1.0, quality)
+
+# 기억에 저장하는 행동 코드
+ACTIONS = ('buy', 'hold', 'sell', 'avoid')
+ACTION_CODES = {action: code for code, action in enumerate(ACTIONS)}
+
+class DecisionMemory:
+    """고정 용량 결정 기억 (원형 버퍼)
+
+    행동 코드/신뢰도/수익률/품질/시각을 열 배열로 보관한다. 추가는 O(1)이며
+    용량을 넘으면 가장 오래된 기억을 덮어쓴다. 순회/인덱싱은 오래된 것부터다.
+    """
+
+    def __init__(self, capacity: int = 100):
+        self.capacity = capacity
+        self.action_codes = np.full(capacity, -1, dtype=np.int8)
+        self.confidences = np.zeros(capacity)
+        self.outcomes = np.zeros(capacity)
+        self.qualities = np.zeros(capacity)
+        self.timestamps = np.zeros(capacity)  # epoch 초
+        self._next = 0  # 다음에 쓸 위치
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def _order(self) -> np.ndarray:
+        """오래된 것부터의 슬롯 번호"""
+        return (self._next - self._size + np.arange(self._size)) % self.capacity
+
+    def append(self, action: str, confidence: float, outcome: float, quality: float,
+               timestamp: Optional[float] = None) -> None:
+        """기억 하나 추가"""
+        if self.capacity == 0:
+            return
+        slot = self._next
+        self.action_codes[slot] = ACTION_CODES.get(action, -1)
+        self.confidences[slot] = confidence
+        self.outcomes[slot] = outcome
+        self.qualities[slot] = quality
+        self.timestamps[slot] = time.time() if timestamp is None else timestamp
+        self._next = (slot + 1) % self.capacity
+        self._size = min(self._size + 1, self.capacity)
+
+    def extend(self, actions: np.ndarray, confidences: np.ndarray, outcomes: np.ndarray,
+               qualities: np.ndarray, timestamp: Optional[float] = None) -> None:
+        """기억 여러 개 추가 (남을 마지막 capacity개만 기록)"""
+        count = min(len(actions), self.capacity)
+        if count == 0:
+            return
+        slots = (self._next + np.arange(count)) % self.capacity
+        self.action_codes[slots] = map_categories(np.asarray(actions)[-count:],
+                                                  lambda a: ACTION_CODES.get(a, -1), dtype=np.int8)
+        self.confidences[slots] = np.asarray(confidences, dtype=float)[-count:]
+        self.outcomes[slots] = np.asarray(outcomes, dtype=float)[-count:]
+        self.qualities[slots] = np.asarray(qualities, dtype=float)[-count:]
+        self.timestamps[slots] = time.time() if timestamp is None else timestamp
+        self._next = (self._next + count) % self.capacity
+        self._size = min(self._size + count, self.capacity)
+
+    def column(self, name: str) -> np.ndarray:
+        """열 하나를 오래된 것부터 (action_codes, confidences, outcomes, qualities, timestamps)"""
+        return getattr(self, name)[self._order()]
+
+    def __getitem__(self, index: int) -> Dict:
+        if not -self._size <= index < self._size:
+            raise IndexError("memory index out of range")
+        slot = (self._next - self._size + index % self._size) % self.capacity
+        code = int(self.action_codes[slot])
+        return {
+            'action': ACTIONS[code] if code >= 0 else 'unknown',
+            'confidence': float(self.confidences[slot]),
+            'outcome': float(self.outcomes[slot]),
+            'quality': float(self.qualities[slot]),
+            'timestamp': datetime.fromtimestamp(self.timestamps[slot])
+        }
+
+    def __iter__(self):
+        for index in range(self._size):
+            yield self[index]
+
+    def summary(self) -> Dict:
+        """기억 요약 통계 (평균 수익률/품질/신뢰도, 적중률, 행동 분포)"""
+        if self._size == 0:
+            return {'count': 0}
+        order = self._order()
+        qualities = self.qualities[order]
+        counts = np.bincount(self.action_codes[order][self.action_codes[order] >= 0], minlength=len(ACTIONS))
+        return {
+            'count': self._size,
+            'mean_outcome': float(self.outcomes[order].mean()),
+            'mean_quality': float(qualities.mean()),
+            'mean_confidence': float(self.confidences[order].mean()),
+            'hit_rate': float((qualities > 0.7).mean()),
+            'actions': {action: int(counts[code]) for code, action in enumerate(ACTIONS)}
+        }
+
+    def clear(self) -> None:
+        self._next = 0
+        self._size = 0
+
+    def __copy__(self) -> 'DecisionMemory':
+        # 뇌 레지스트리의 copy-on-write 교체용 (배열까지 복사)
+        clone = DecisionMemory.__new__(DecisionMemory)
+        clone.__dict__.update({key: value.copy() if isinstance(value, np.ndarray) else value
+                               for key, value in self.__dict__.items()})
+        return clone
+
 class InvestorBrain:
     """거장 뇌 기반 클래스"""
 
-    def __init__(self, name: str):
+    def __init__(self, name: str, memory_capacity: int = 100):
         self.name = name
-        self.memory = []  # 과거 결정 기억
+        self.memory = DecisionMemory(memory_capacity)  # 과거 결정 기억 (최근 memory_capacity개)
         self.confidence_calibration = 0.5  # 신뢰도 보정
         self.learning_rate = 0.1
 
@@ -72,10 +284,48 @@ class InvestorBrain:
             'emotional_volatility': 0.5
         }
 
+    def prepare_context(self, context) -> PreparedContext:
+        """시장 상황에만 의존하는 항목을 한 번 계산 - 같은 상황의 여러 기업 분석에 재사용
+
+        analyze_company/analyze_companies는 MarketContext 대신 이 결과를 받을 수 있다.
+        이미 이 뇌가 준비한 PreparedContext면 그대로 돌려준다.
+        """
+        if isinstance(context, PreparedContext):
+            if context.brain_class is type(self):
+                return context
+            context = context.context
+        return PreparedContext(context=context, brain_class=type(self), terms=self.context_terms(context))
+
+    def context_terms(self, context: MarketContext) -> Dict[str, float]:
+        """기업과 무관한 점수 항목 - 각 거장 클래스에서 오버라이드"""
+        return {}
+
     def analyze_company(self, company: Company, context: MarketContext) -> InvestorDecision:
         """기업 분석 - 각 거장 클래스에서 오버라이드"""
         raise NotImplementedError
 
+    def analyze_companies(self, frame, context: MarketContext) -> BatchDecision:
+        """여러 기업 일괄 분석 - 기본 구현은 analyze_company 반복, 각 거장 클래스에서 벡터화"""
+        columns = company_columns(frame)
+        prepared = self.prepare_context(context)
+        decisions = [self.analyze_company(company, prepared) for company in iter_companies(columns)]
+        return BatchDecision(
+            actions=np.array([d.action for d in decisions], dtype='<U5'),
+            confidences=np.array([d.confidence for d in decisions], dtype=float),
+            scores=np.full(len(decisions), np.nan)
+        )
+
+    def evaluate_decision_quality(self, decision: InvestorDecision, actual_outcome: float) -> float:
+        """결정 품질 평가 (0-1) - 실제 수익률 대비 행동의 적절성"""
+        if decision.action == 'buy' and actual_outcome > 0.05:
+            return 1.0
+        elif decision.action == 'sell' and actual_outcome < -0.05:
+            return 1.0
+        elif decision.action == 'avoid' and actual_outcome < -0.1:
+            return 0.8
+        else:
+            return max(0, 1 - abs(actual_outcome) * 10)
+
     def learn_from_outcome(self, decision: InvestorDecision, actual_outcome: float) -> None:
         """결정 결과로부터 학습"""
         outcome_quality = self.evaluate_decision_quality(decision, actual_outcome)
@@ -86,17 +336,26 @@ class InvestorBrain:
         elif outcome_quality < 0.3:
             self.confidence_calibration = max(0.1, self.confidence_calibration - 0.05)
 
-        # 기억에 추가
-        self.memory.append({
-            'decision': decision,
-            'outcome': actual_outcome,
-            'quality': outcome_quality,
-            'timestamp': datetime.now()
-        })
+        # 기억에 추가 (용량을 넘으면 가장 오래된 기억을 덮어씀)
+        self.memory.append(decision.action, decision.confidence, actual_outcome, outcome_quality)
 
-        # 기억 관리 (최근 100개만 유지)
-        if len(self.memory) > 100:
-            self.memory = self.memory[-100:]
+    def learn_from_outcomes(self, actions: np.ndarray, confidences: np.ndarray, outcomes: np.ndarray) -> np.ndarray:
+        """결정 결과 여러 개로부터 순서대로 학습 (learn_from_outcome 반복과 같은 결과)
+
+        품질은 한 번에 계산하고, 보정값만 순서대로 갱신한다. 결정별 품질 배열을 반환한다.
+        """
+        actions = np.asarray(actions)
+        confidences = np.asarray(confidences, dtype=float)
+        outcomes = np.asarray(outcomes, dtype=float)
+        quality = decision_quality(actions, outcomes)
+
+        calibration = self.confidence_calibration
+        for up in (quality[(quality > 0.7) | (quality < 0.3)] > 0.7).tolist():
+            calibration = min(1.0, calibration + 0.05) if up else max(0.1, calibration - 0.05)
+        self.confidence_calibration = calibration
+
+        self.memory.extend(actions, confidences, outcomes, quality)
+        return quality
 
 class WarrenBuffettBrain(InvestorBrain):
     """워런 버핏 뇌 모델"""
@@ -131,8 +390,19 @@ class WarrenBuffettBrain(InvestorBrain):
             'cyclical_volatility': 0.5
         }
 
+    def context_terms(self, context: MarketContext) -> Dict[str, float]:
+        """버핏의 시장 상황 조정 (불황은 기회, 과열은 조심)"""
+        context_adjustment = 1.0
+        if context.phase == MarketPhase.BEAR_MARKET:
+            context_adjustment = 1.2  # 불황일 때 기회
+        elif context.phase == MarketPhase.BULL_MARKET and context.valuation_level > 0.7:
+            context_adjustment = 0.6  # 과열 상황에서는 조심
+        return {'context_adjustment': context_adjustment}
+
     def analyze_company(self, company: Company, context: MarketContext) -> InvestorDecision:
         """버핏 방식으로 기업 분석"""
+        prepared = self.prepare_context(context)
+        context = prepared.context
 
         # 1. 사업 이해도 평가
         understandability = max(0, 1 - company.business_complexity)
@@ -181,13 +451,7 @@ class WarrenBuffettBrain(InvestorBrain):
             avoidance_penalty += self.avoidance_factors['high_complexity'] * 0.3
 
         # 4. 시장 상황 고려
-        context_adjustment = 1.0
-        if context.phase == MarketPhase.BEAR_MARKET:
-            context_adjustment = 1.2  # 불황일 때 기회
-        elif context.phase == MarketPhase.BULL_MARKET and context.valuation_level > 0.7:
-            context_adjustment = 0.6  # 과열 상황에서는 조심
-
-        final_score = max(0, (total_score - avoidance_penalty) * context_adjustment)
+        final_score = max(0, (total_score - avoidance_penalty) * prepared.terms['context_adjustment'])
 
         # 5. 결정
         if final_score > 0.7:
@@ -218,6 +482,51 @@ class WarrenBuffettBrain(InvestorBrain):
                 time_horizon="long_term"
             )
 
+    def analyze_companies(self, frame, context: MarketContext) -> BatchDecision:
+        """버핏 방식 일괄 분석 (analyze_company와 동일한 규칙을 배열 연산으로)"""
+        c = company_columns(frame)
+        prepared = self.prepare_context(context)
+        calibration = self.confidence_calibration
+
+        # 1. 사업 이해도 평가
+        understandability = builtin_max(0, 1 - c['business_complexity'])
+        too_complex = understandability < 0.7
+
+        # 2. 핵심 원칙 기반 점수 계산 (스칼라 경로와 같은 덧셈 순서)
+        total_score = understandability * self.core_principles['business_understanding']
+        total_score = total_score + c['moat_strength'] * self.core_principles['moat_strength']
+        total_score = total_score + builtin_min(1.0, c['roe'] / 20.0) * 0.3
+        total_score = total_score + (1 - builtin_min(0.5, c['debt_equity'] / 2.0)) * 0.3
+        mature = map_categories(c['growth_stage'], lambda stage: stage in ['mature', 'declining'], bool)
+        growth_score = np.where(
+            mature,
+            c['revenue_growth'] / 20.0,
+            builtin_min(0.5, c['revenue_growth'] / 30.0)
+        )
+        total_score = total_score + growth_score * 0.2
+
+        # 3. 회피 요소 확인
+        avoidance_penalty = np.where(c['pe_ratio'] > 30, self.avoidance_factors['excessive_valuation'] * 0.5, 0.0)
+        avoidance_penalty = avoidance_penalty + np.where(
+            c['business_complexity'] > 0.7, self.avoidance_factors['high_complexity'] * 0.3, 0.0
+        )
+
+        # 4. 시장 상황 고려
+        final_score = builtin_max(0, (total_score - avoidance_penalty) * prepared.terms['context_adjustment'])
+
+        # 5. 결정
+        buy = ~too_complex & (final_score > 0.7)
+        hold = ~too_complex & ~buy & (final_score > 0.5)
+        return BatchDecision(
+            actions=np.select([buy, hold], ['buy', 'hold'], 'avoid'),
+            confidences=np.select(
+                [too_complex, buy, hold],
+                [0.9, builtin_min(0.95, final_score) * calibration, 0.7 * calibration],
+                0.8 * calibration
+            ),
+            scores=np.where(too_complex, np.nan, final_score)
+        )
+
     def generate_buffett_reasoning(self, scores: Dict[str, float], company: Company, context: MarketContext) -> str:
         """버핏 스타일의 추론 생성"""
         reasons = []
@@ -278,8 +587,25 @@ class PeterLynchBrain(InvestorBrain):
             }
         }
 
+        # 관찰 용이한 섹터
+        self.observable_sectors = {
+            'consumer_staples': 0.9,
+            'retail': 0.9,
+            'restaurants': 0.95,
+            'technology': 0.7,
+            'healthcare': 0.6,
+            'finance': 0.5,
+            'industrial': 0.4,
+            'energy': 0.3
+        }
+
+    def context_terms(self, context: MarketContext) -> Dict[str, float]:
+        """린치의 시장 상황 가산점 (하락장은 기회)"""
+        return {'bear_market_bonus': 0.2 if context.phase == MarketPhase.BEAR_MARKET else 0.0}
+
     def analyze_company(self, company: Company, context: MarketContext) -> InvestorDecision:
         """린치 방식으로 기업 분석"""
+        prepared = self.prepare_context(context)
 
         # 1. 성장 카테고리 분류
         category = self.classify_growth_category(company)
@@ -306,8 +632,8 @@ class PeterLynchBrain(InvestorBrain):
         )
 
         # 린치 특유의 시장 상황 고려
-        if context.phase == MarketPhase.BEAR_MARKET:
-            total_score += 0.2  # 하락장은 기회
+        if prepared.terms['bear_market_bonus']:
+            total_score += prepared.terms['bear_market_bonus']  # 하락장은 기회
         elif company.pe_ratio < 10:
             total_score += 0.15  # 저PER는 매력적
 
@@ -340,6 +666,63 @@ class PeterLynchBrain(InvestorBrain):
                 time_horizon="medium_term"
             )
 
+    def analyze_companies(self, frame, context: MarketContext) -> BatchDecision:
+        """린치 방식 일괄 분석 (analyze_company와 동일한 규칙을 배열 연산으로)"""
+        c = company_columns(frame)
+        prepared = self.prepare_context(context)
+        calibration = self.confidence_calibration
+        growth, pe, roe = c['revenue_growth'], c['pe_ratio'], c['roe']
+        complexity, debt = c['business_complexity'], c['debt_equity']
+
+        # 1. 성장 카테고리 분류
+        category_score = np.select(
+            [(growth > 20) & (pe < 40), (growth > 10) & (pe < 20), (growth > 5) & (pe < 15)],
+            [0.9, 0.8, 0.7],
+            0.4
+        )
+
+        # 2. 일상 관찰 가능성 평가
+        sector_score = map_categories(c['sector'], lambda sector: self.observable_sectors.get(sector.lower(), 0.5))
+        observability = builtin_max(0, sector_score - complexity * 0.3)
+
+        # 3. 성장 스토리 평가
+        growth_story_score = np.select([growth > 20, growth > 10, growth > 5], [0.3, 0.2, 0.1], 0.0)
+        growth_story_score = growth_story_score + np.select([roe > 20, roe > 15], [0.2, 0.1], 0.0)
+        growth_story_score = growth_story_score + np.select([complexity < 0.3, complexity < 0.5], [0.3, 0.2], 0.0)
+        growth_story_score = builtin_min(1.0, growth_story_score)
+
+        # 4. 재무 건전성
+        financial_health = 1.0 - np.select([debt > 2.0, debt > 1.0], [0.4, 0.2], 0.0)
+        financial_health = financial_health - np.select([roe < 5, roe < 10], [0.3, 0.1], 0.0)
+        financial_health = financial_health - np.where(c['pb_ratio'] > 10, 0.2, 0.0)
+        financial_health = builtin_max(0, financial_health)
+
+        # 5. 분석가 커버리지
+        analyst_interest = 0.5
+
+        total_score = (
+            category_score * 0.3 +
+            observability * 0.2 +
+            growth_story_score * 0.25 +
+            financial_health * 0.15 +
+            analyst_interest * 0.1
+        )
+
+        # 린치 특유의 시장 상황 고려
+        if prepared.terms['bear_market_bonus']:
+            total_score = total_score + prepared.terms['bear_market_bonus']
+        else:
+            total_score = total_score + np.where(pe < 10, 0.15, 0.0)
+
+        # 결정
+        buy = total_score > 0.75
+        hold = ~buy & (total_score > 0.5)
+        return BatchDecision(
+            actions=np.select([buy, hold], ['buy', 'hold'], 'avoid'),
+            confidences=np.select([buy, hold], [0.85 * calibration, 0.6 * calibration], 0.7 * calibration),
+            scores=total_score
+        )
+
     def classify_growth_category(self, company: Company) -> Dict:
         """린치의 성장 카테고리 분류"""
 
@@ -371,19 +754,7 @@ class PeterLynchBrain(InvestorBrain):
     def assess_observability(self, company: Company) -> float:
         """일상에서 관찰 가능성 평가 (린치 철학)"""
 
-        # 관찰 용이한 섹터
-        observable_sectors = {
-            'consumer_staples': 0.9,
-            'retail': 0.9,
-            'restaurants': 0.95,
-            'technology': 0.7,
-            'healthcare': 0.6,
-            'finance': 0.5,
-            'industrial': 0.4,
-            'energy': 0.3
-        }
-
-        sector_score = observable_sectors.get(company.sector.lower(), 0.5)
+        sector_score = self.observable_sectors.get(company.sector.lower(), 0.5)
 
         # 복잡도 감점
         complexity_penalty = company.business_complexity * 0.3
@@ -487,14 +858,30 @@ class HowardMarksBrain(InvestorBrain):
             'downside_protection': 0.9
         }
 
+    def context_terms(self, context: MarketContext) -> Dict[str, float]:
+        """막스의 사이클/감성 평가와 시장 상황 조정 (모두 기업과 무관)"""
+        context_adjustment = 1.0
+        if context.sentiment_score > 0.7:  # 과도한 낙관주의
+            context_adjustment = 0.6  # 매우 보수적
+        elif context.sentiment_score < -0.5:  # 과도한 비관주의
+            context_adjustment = 1.4  # 공격적
+
+        return {
+            'cycle_score': self.assess_cycle_positioning(None, context),
+            'sentiment_score': self.assess_sentiment_extremes(None, context),
+            'context_adjustment': context_adjustment
+        }
+
     def analyze_company(self, company: Company, context: MarketContext) -> InvestorDecision:
         """막스 방식으로 기업 분석"""
+        prepared = self.prepare_context(context)
+        context = prepared.context
 
         # 1. 시장 사이클 위치 평가
-        cycle_score = self.assess_cycle_positioning(company, context)
+        cycle_score = prepared.terms['cycle_score']
 
         # 2. 감성 극단 평가
-        sentiment_score = self.assess_sentiment_extremes(company, context)
+        sentiment_score = prepared.terms['sentiment_score']
 
         # 3. 가치 규율 평가
         valuation_score = self.assess_valuation_discipline(company)
@@ -511,13 +898,7 @@ class HowardMarksBrain(InvestorBrain):
         )
 
         # 막스 특유의 시장 상황 조정
-        context_adjustment = 1.0
-        if context.sentiment_score > 0.7:  # 과도한 낙관주의
-            context_adjustment = 0.6  # 매우 보수적
-        elif context.sentiment_score < -0.5:  # 과도한 비관주의
-            context_adjustment = 1.4  # 공격적
-
-        final_score = max(0, total_score * context_adjustment)
+        final_score = max(0, total_score * prepared.terms['context_adjustment'])
 
         # 결정
         if final_score > 0.7:
@@ -548,6 +929,46 @@ class HowardMarksBrain(InvestorBrain):
                 time_horizon="medium_term"
             )
 
+    def analyze_companies(self, frame, context: MarketContext) -> BatchDecision:
+        """막스 방식 일괄 분석 (analyze_company와 동일한 규칙을 배열 연산으로)"""
+        c = company_columns(frame)
+        prepared = self.prepare_context(context)
+        calibration = self.confidence_calibration
+        pe, pb = c['pe_ratio'], c['pb_ratio']
+
+        # 1-2. 시장 사이클/감성 평가는 기업과 무관
+        cycle_score = prepared.terms['cycle_score']
+        sentiment_score = prepared.terms['sentiment_score']
+
+        # 3. 가치 규율 평가
+        valuation_score = 0.5 + np.select([pe < 15, pe > 30], [0.3, -0.3], 0.0)
+        valuation_score = valuation_score + np.select([pb < 2, pb > 5], [0.2, -0.2], 0.0)
+        valuation_score = builtin_max(0, builtin_min(1, valuation_score))
+
+        # 4. 하방 리스크 평가
+        risk_score = 1.0 - np.select([c['debt_equity'] > 2.0, c['debt_equity'] > 1.0], [0.4, 0.2], 0.0)
+        risk_score = risk_score - np.where(c['roe'] < 10, 0.3, 0.0)
+        risk_score = builtin_max(0, risk_score)
+
+        # 5. 종합 점수 계산
+        total_score = (
+            cycle_score * self.core_principles['cycle_positioning'] +
+            sentiment_score * self.core_principles['contrarian_thinking'] +
+            valuation_score * self.core_principles['valuation_discipline'] +
+            risk_score * self.core_principles['risk_control']
+        )
+
+        final_score = builtin_max(0, total_score * prepared.terms['context_adjustment'])
+
+        # 결정
+        buy = final_score > 0.7
+        hold = ~buy & (final_score > 0.5)
+        return BatchDecision(
+            actions=np.select([buy, hold], ['buy', 'hold'], 'avoid'),
+            confidences=np.select([buy, hold], [0.75 * calibration, 0.65 * calibration], 0.85 * calibration),
+            scores=final_score
+        )
+
     def assess_cycle_positioning(self, company: Company, context: MarketContext) -> float:
         """시장 사이클 위치 평가"""
         score = 0.5
@@ -663,17 +1084,40 @@ class GeorgeSorosBrain(InvestorBrain):
             'narrative_reality_divergence': 0.6
         }
 
+        # 거시 민감 섹터
+        self.macro_sectors = {
+            'rate_sensitive': ['finance', 'real_estate', 'utilities'],  # 통화/금리 민감
+            'cyclical': ['industrial', 'materials', 'energy']  # 경기 순환
+        }
+
+    def context_terms(self, context: MarketContext) -> Dict[str, float]:
+        """소로스의 시장 반사성 신호, 피드백 루프/인지 편향 평가, 시장 상황 조정"""
+        context_adjustment = 1.0
+        if context.volatility > 0.7:  # 높은 변동성 = 반사성 기회
+            context_adjustment = 1.3
+        elif len(context.key_themes) > 3:  # 복잡한 시장 = 반사성 증가
+            context_adjustment = 1.2
+
+        return {
+            'reflexivity_base': self.market_reflexivity(context),
+            'feedback_score': self.assess_feedback_loops(None, context),
+            'bias_score': self.assess_cognitive_biases(None, context),
+            'context_adjustment': context_adjustment
+        }
+
     def analyze_company(self, company: Company, context: MarketContext) -> InvestorDecision:
         """소로스 방식으로 기업 분석"""
+        prepared = self.prepare_context(context)
+        context = prepared.context
 
         # 1. 반사성 상황 식별
-        reflexivity_score = self.identify_reflexivity(company, context)
+        reflexivity_score = self.identify_reflexivity(company, prepared)
 
         # 2. 피드백 루프 강도 평가
-        feedback_score = self.assess_feedback_loops(company, context)
+        feedback_score = prepared.terms['feedback_score']
 
         # 3. 인지적 편향 기회 평가
-        bias_score = self.assess_cognitive_biases(company, context)
+        bias_score = prepared.terms['bias_score']
 
         # 4. 거시 동향 예측
         macro_score = self.anticipate_macro_trends(company, context)
@@ -687,13 +1131,7 @@ class GeorgeSorosBrain(InvestorBrain):
         )
 
         # 소로스 특유의 시장 상황 조정
-        context_adjustment = 1.0
-        if context.volatility > 0.7:  # 높은 변동성 = 반사성 기회
-            context_adjustment = 1.3
-        elif len(context.key_themes) > 3:  # 복잡한 시장 = 반사성 증가
-            context_adjustment = 1.2
-
-        final_score = max(0, total_score * context_adjustment)
+        final_score = max(0, total_score * prepared.terms['context_adjustment'])
 
         # 결정 (더 공격적)
         if final_score > 0.6:
@@ -714,8 +1152,51 @@ class GeorgeSorosBrain(InvestorBrain):
             time_horizon="short_term"
         )
 
-    def identify_reflexivity(self, company: Company, context: MarketContext) -> float:
-        """반사성 상황 식별"""
+    def analyze_companies(self, frame, context: MarketContext) -> BatchDecision:
+        """소로스 방식 일괄 분석 (analyze_company와 동일한 규칙을 배열 연산으로)"""
+        c = company_columns(frame)
+        prepared = self.prepare_context(context)
+        calibration = self.confidence_calibration
+        pe = c['pe_ratio']
+
+        # 1. 반사성 상황 식별 (시장 신호 먼저, 기업 신호 나중 - 스칼라 경로와 같은 순서)
+        reflexivity_score = prepared.terms['reflexivity_base']
+        reflexivity_score = reflexivity_score + np.where(c['business_complexity'] > 0.6, 0.2, 0.0)
+        reflexivity_score = reflexivity_score + np.where((pe > 40) | (pe < 8), 0.2, 0.0)
+        reflexivity_score = builtin_max(0, builtin_min(1, reflexivity_score))
+
+        # 2-3. 피드백 루프/인지 편향은 기업과 무관
+        feedback_score = prepared.terms['feedback_score']
+        bias_score = prepared.terms['bias_score']
+
+        # 4. 거시 동향 예측
+        macro_score = 0.5 + map_categories(
+            c['sector'], lambda sector: 0.2 if sector.lower() in self.macro_sectors['rate_sensitive'] else 0.0
+        )
+        macro_score = macro_score + map_categories(
+            c['sector'], lambda sector: 0.2 if sector.lower() in self.macro_sectors['cyclical'] else 0.0
+        )
+        macro_score = builtin_max(0, builtin_min(1, macro_score))
+
+        # 5. 종합 점수 계산
+        total_score = (
+            reflexivity_score * self.core_principles['reflexivity_identification'] +
+            feedback_score * self.core_principles['feedback_loop_monitoring'] +
+            bias_score * self.core_principles['cognitive_bias_exploitation'] +
+            macro_score * self.core_principles['macro_trend_anticipation']
+        )
+
+        final_score = builtin_max(0, total_score * prepared.terms['context_adjustment'])
+
+        # 결정 (더 공격적)
+        return BatchDecision(
+            actions=np.select([final_score > 0.6, final_score < 0.4], ['buy', 'sell'], 'hold'),
+            confidences=builtin_min(0.95, final_score * 1.2) * calibration,
+            scores=final_score
+        )
+
+    def market_reflexivity(self, context: MarketContext) -> float:
+        """시장 쪽 반사성 신호 (기업과 무관한 부분)"""
         score = 0.3
 
         # 높은 변동성은 반사성 신호
@@ -726,6 +1207,12 @@ class GeorgeSorosBrain(InvestorBrain):
         if abs(context.sentiment_score) > 0.6:
             score += 0.3
 
+        return score
+
+    def identify_reflexivity(self, company: Company, context: MarketContext) -> float:
+        """반사성 상황 식별"""
+        score = self.prepare_context(context).terms['reflexivity_base']
+
         # 복잡한 비즈니스 모델은 반사성 가능성
         if company.business_complexity > 0.6:
             score += 0.2
@@ -770,11 +1257,11 @@ class GeorgeSorosBrain(InvestorBrain):
         score = 0.5
 
         # 통화/금리 민감도
-        if company.sector.lower() in ['finance', 'real_estate', 'utilities']:
+        if company.sector.lower() in self.macro_sectors['rate_sensitive']:
             score += 0.2
 
         # 경기 순환성
-        if company.sector.lower() in ['industrial', 'materials', 'energy']:
+        if company.sector.lower() in self.macro_sectors['cyclical']:
             score += 0.2
 
         return max(0, min(1, score))
@@ -800,19 +1287,84 @@ class GeorgeSorosBrain(InvestorBrain):
         return ". ".join(reasons) + ". This reflects the reflexive dynamics I've identified in the market."
 
 # 거장 뇌 팩토리
+@dataclass(frozen=True)
+class BrainSpec:
+    """등록된 거장 뇌 정보"""
+    investor_id: str  # 정규 ID (warren_buffett)
+    brain_class: type
+    name: str
+    aliases: Tuple[str, ...] = ()
+    title: str = ""
+    philosophy: str = ""
+    style: str = ""
+
+_BRAIN_SPECS: Dict[str, BrainSpec] = {}  # 정규 ID -> 정보 (등록 순서)
+_BRAIN_ALIASES: Dict[str, str] = {}  # 정규화된 별칭 -> 정규 ID
+
+def normalize_investor_key(value: str) -> str:
+    """별칭 비교용 정규화 ('Warren Buffett', 'warren-buffett' -> 'warren_buffett')"""
+    return re.sub(r'[\s\-]+', '_', value.strip().lower())
+
+def register_brain(investor_id: str, brain_class: type, name: str, aliases: Tuple[str, ...] = (),
+                   title: str = "", philosophy: str = "", style: str = "") -> BrainSpec:
+    """거장 뇌 클래스 등록 (정규 ID, 이름, 별칭 모두로 찾을 수 있음)"""
+    investor_id = normalize_investor_key(investor_id)
+    keys = {normalize_investor_key(key) for key in (investor_id, name, *aliases)}
+    for key in keys:
+        owner = _BRAIN_ALIASES.get(key)
+        if owner is not None and owner != investor_id:
+            raise ValueError(f"Alias '{key}' already registered for {owner}")
+
+    spec = BrainSpec(investor_id, brain_class, name, tuple(aliases), title, philosophy, style)
+    _BRAIN_SPECS[investor_id] = spec
+    for key in keys:
+        _BRAIN_ALIASES[key] = investor_id
+    return spec
+
+def resolve_investor_id(investor_type: str) -> Optional[str]:
+    """별칭을 정규 ID로 변환 (모르는 투자자는 None)"""
+    return _BRAIN_ALIASES.get(normalize_investor_key(investor_type))
+
+def get_brain_spec(investor_type: str) -> Optional[BrainSpec]:
+    """별칭으로 등록 정보 조회 (모르는 투자자는 None)"""
+    investor_id = resolve_investor_id(investor_type)
+    return _BRAIN_SPECS.get(investor_id) if investor_id else None
+
+def registered_brains() -> List[BrainSpec]:
+    """등록된 모든 거장 (등록 순서)"""
+    return list(_BRAIN_SPECS.values())
+
+register_brain(
+    "warren_buffett", WarrenBuffettBrain, "Warren Buffett", aliases=("buffett",),
+    title="Chairman & CEO, Berkshire Hathaway",
+    philosophy="Value investing with focus on moats",
+    style="Long-term, conservative"
+)
+register_brain(
+    "peter_lynch", PeterLynchBrain, "Peter Lynch", aliases=("lynch",),
+    title="Former Manager, Fidelity Magellan Fund",
+    philosophy="Growth investing, invest in what you know",
+    style="Medium-term, growth-oriented"
+)
+register_brain(
+    "howard_marks", HowardMarksBrain, "Howard Marks", aliases=("marks",),
+    title="Co-Chairman, Oaktree Capital",
+    philosophy="Cycle awareness and risk management",
+    style="Contrarian, risk-focused"
+)
+register_brain(
+    "george_soros", GeorgeSorosBrain, "George Soros", aliases=("soros", "sorros"),
+    title="Chairman, Soros Fund Management",
+    philosophy="Reflexivity theory and macro investing",
+    style="Short-term, aggressive"
+)
+
 def create_investor_brain(investor_type: str) -> InvestorBrain:
-    """거장 유형에 맞는 뇌 생성"""
-
-    if investor_type.lower() in ['warren buffett', 'buffett']:
-        return WarrenBuffettBrain()
-    elif investor_type.lower() in ['peter lynch', 'lynch']:
-        return PeterLynchBrain()
-    elif investor_type.lower() in ['howard marks', 'marks']:
-        return HowardMarksBrain()
-    elif investor_type.lower() in ['george soros', 'sorros']:
-        return GeorgeSorosBrain()
-    else:
+    """거장 유형에 맞는 뇌 생성 (정규 ID 또는 별칭)"""
+    spec = get_brain_spec(investor_type)
+    if spec is None:
         raise ValueError(f"Unknown investor type: {investor_type}")
+    return spec.brain_class()
 
 # 데모 실행
 def demo_investor_brains():
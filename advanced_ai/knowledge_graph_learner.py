@@ -6,13 +6,26 @@
 
 import networkx as nx
 import numpy as np
-from typing import Dict, List, Set, Tuple, Optional
+from typing import Dict, Iterable, Iterator, List, Set, Tuple, Optional
 from dataclasses import dataclass
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
 import json
+import heapq
+import itertools
+import time
 from datetime import datetime, timedelta
-import sqlite3
 from collections import defaultdict, deque
 
+try:
+    from .investor_brain import decision_quality
+    from .learning_store import LearningStore
+    from .pattern_matcher import MultiPatternMatcher
+except ImportError:  # 스크립트로 직접 실행할 때
+    from investor_brain import decision_quality
+    from learning_store import LearningStore
+    from pattern_matcher import MultiPatternMatcher
+
 @dataclass
 class KnowledgeTriple:
     """지식 트리플 (주어-관계-객체)"""
@@ -42,13 +55,27 @@ class KnowledgeGraph:
         self.confidence_decay = 0.995  # 시간에 따른 신뢰도 감쇠
         self.min_confidence = 0.1
 
+        # 유사 상황 검색용 역색인 (엣지 추가 시 갱신)
+        self.theme_index: Dict[str, Set[Tuple[str, str]]] = defaultdict(set)
+        self.phase_index: Dict[str, Set[Tuple[str, str]]] = defaultdict(set)
+        self.edge_order: Dict[Tuple[str, str], int] = {}  # 동점 정렬용 추가 순서 (엣지는 지우지 않음)
+
+    def _index_edge(self, edge_id: Tuple[str, str], context: Dict) -> None:
+        """새 엣지를 테마/시장 국면 역색인에 등록"""
+        self.edge_order[edge_id] = len(self.edge_order)
+
+        for theme in set(context.get('key_themes', [])):
+            self.theme_index[theme].add(edge_id)
+
+        self.phase_index[context.get('market_phase')].add(edge_id)
+
     def add_knowledge(self, triple: KnowledgeTriple) -> None:
         """지식 추가"""
         edge_id = (triple.subject, triple.object)
 
         if self.graph.has_edge(*edge_id):
             # 기존 엣지 업데이트
-            existing = self.graph[edge_id[0][edge_id[1]]
+            existing = self.graph[edge_id[0]][edge_id[1]]
             # 가중 평균으로 신뢰도 업데이트
             total_weight = existing['weight'] + triple.confidence
             new_confidence = (existing['confidence'] * existing['weight'] +
@@ -70,6 +97,7 @@ class KnowledgeGraph:
                 context=triple.context,
                 recent_sources=[triple.source]
             )
+            self._index_edge(edge_id, triple.context or {})
 
     def get_relationships(self, entity: str, predicate: str = None) -> List[Dict]:
         """특정 개체의 관계 조회"""
@@ -88,151 +116,131 @@ class KnowledgeGraph:
         return relationships
 
     def find_similar_situations(self, current_context: Dict, top_k: int = 5) -> List[Dict]:
-        """과거 유사 상황 찾기"""
-        similar_situations = []
+        """과거 유사 상황 찾기
 
+        유사도 = 겹치는 테마 수 * 0.7 + 시장 국면 일치 * 0.3 이고 임계치가 0.3이므로,
+        테마가 하나라도 겹치는 엣지만 후보가 된다. 역색인으로 후보만 훑고 힙으로 top_k를 고른다.
+        """
         # 현재 컨텍스트에서 핵심 키워드 추출
         current_keywords = set(current_context.get('key_themes', []))
         current_phase = current_context.get('market_phase')
 
-        for subject, obj, data in self.graph.edges(data=True):
-            context = data.get('context', {})
-            past_keywords = set(context.get('key_themes', []))
-            past_phase = context.get('market_phase')
-
-            # 유사도 계산
-            keyword_overlap = len(current_keywords & past_keywords)
-            phase_match = 1.0 if past_phase == current_phase else 0.0
-
-            similarity = (keyword_overlap * 0.7 + phase_match * 0.3)
-
-            if similarity > 0.3:  # 최소 유사도 임계치
-                similar_situations.append({
-                    'subject': subject,
-                    'object': obj,
-                    'similarity': similarity,
-                    'context': context,
-                    'confidence': data.get('confidence', 0),
-                    'timestamp': data.get('timestamp')
-                })
-
-        # 유사도 순 정렬
-        similar_situations.sort(key=lambda x: x['similarity'], reverse=True)
-        return similar_situations[:top_k]
-
-class ContinuousLearningSystem:
-    """지속적 학습 시스템"""
-
-    def __init__(self, db_path: str = "learning_system.db"):
-        self.knowledge_graph = KnowledgeGraph()
-        self.db_path = db_path
-        self.learning_history = deque(maxlen=1000)  # 최근 1000개 경험
-
-        self.init_database()
+        # 후보 엣지별 겹치는 테마 수
+        keyword_overlap = defaultdict(int)
+        for keyword in current_keywords:
+            for edge_id in self.theme_index.get(keyword, ()):
+                keyword_overlap[edge_id] += 1
 
-    def init_database(self) -> None:
-        """데이터베이스 초기화"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS learning_experiences (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                investor_id TEXT NOT NULL,
-                prediction TEXT NOT NULL,
-                actual_outcome TEXT NOT NULL,
-                accuracy_score REAL,
-                situation_context TEXT,
-                timestamp DATETIME DEFAULT CURRENT_TIMESTAMP
-            )
-        ''')
-
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS knowledge_triples (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                subject TEXT NOT NULL,
-                predicate TEXT NOT NULL,
-                object TEXT NOT NULL,
-                confidence REAL NOT NULL,
-                source TEXT NOT NULL,
-                context TEXT,
-                timestamp DATETIME DEFAULT CURRENT_TIMESTAMP
-            )
-        ''')
+        phase_edges = self.phase_index.get(current_phase, ())
 
-        conn.commit()
-        conn.close()
+        candidates = []
+        for edge_id, overlap in keyword_overlap.items():
+            phase_match = 1.0 if edge_id in phase_edges else 0.0
 
-    def learn_from_quote(self, investor_id: str, quote: str, context: Dict) -> None:
-        """인용문으로부터 학습"""
+            # 유사도 계산
+            similarity = (overlap * 0.7 + phase_match * 0.3)
 
-        # 1. 엔티티 추출 (간단 버전)
-        entities = self.extract_entities(quote)
+            if similarity > 0.3:  # 최소 유사도 임계치
+                candidates.append((similarity, -self.edge_order[edge_id], edge_id))
 
-        # 2. 관계 추론
-        relationships = self.infer_relationships(quote, entities, investor_id)
+        # 유사도 순 상위 top_k (동점이면 먼저 추가된 엣지 우선)
+        similar_situations = []
+        for similarity, _, (subject, obj) in heapq.nlargest(top_k, candidates):
+            data = self.graph[subject][obj]
+            similar_situations.append({
+                'subject': subject,
+                'object': obj,
+                'similarity': similarity,
+                'context': data.get('context', {}),
+                'confidence': data.get('confidence', 0),
+                'timestamp': data.get('timestamp')
+            })
 
-        # 3. 지식 그래프에 추가
-        for rel in relationships:
-            triple = KnowledgeTriple(
-                subject=rel['subject'],
-                predicate=rel['predicate'],
-                object=rel['object'],
-                confidence=rel['confidence'],
-                source=f"quote_{investor_id}_{datetime.now().strftime('%Y%m%d')}",
-                timestamp=datetime.now(),
-                context=context
-            )
-            self.knowledge_graph.add_knowledge(triple)
-            self.save_knowledge_to_db(triple)
+        return similar_situations
 
-    def extract_entities(self, text: str) -> Dict[str, List[str]]:
-        """텍스트에서 엔티티 추출"""
-        entities = {
-            'companies': [],
-            'concepts': [],
-            'emotions': [],
-            'timeframes': []
-        }
+class QuoteExtractor:
+    """인용문 엔티티/감성/관계 추출기 (DB 없이 동작하므로 워커 프로세스에서도 사용)"""
 
-        # 간단한 키워드 기반 추출
-        company_patterns = [
+    def __init__(self):
+        # 간단한 키워드 기반 추출 패턴
+        self.company_patterns = [
             'Apple', 'AAPL', 'Microsoft', 'MSFT', 'Google', 'GOOGL',
             'Tesla', 'TSLA', 'Amazon', 'AMZN', 'Berkshire', 'BRK'
         ]
 
-        concept_patterns = [
+        self.concept_patterns = [
             'moat', 'growth', 'value', 'dividend', 'debt', 'cash flow',
             'intrinsic value', 'margin of safety', 'competitive advantage'
         ]
 
-        emotion_patterns = [
+        self.emotion_patterns = [
             'bullish', 'bearish', 'optimistic', 'pessimistic', 'cautious',
             'excited', 'worried', 'confident', 'doubtful'
         ]
 
-        text_lower = text.lower()
+        # 감성 단어
+        self.positive_words = ['great', 'wonderful', 'excellent', 'fantastic', 'love', 'excited']
+        self.negative_words = ['terrible', 'awful', 'worried', 'concerned', 'avoid', 'scared']
+
+        # 모든 사전을 한 오토마톤으로 (엔티티는 단어 경계, 감성 단어는 부분 문자열 매칭)
+        self.matcher = MultiPatternMatcher()
+        self.matcher.add_many(self.company_patterns, 'companies')
+        self.matcher.add_many(self.concept_patterns, 'concepts')
+        self.matcher.add_many(self.emotion_patterns, 'emotions')
+        self.matcher.add_many(self.positive_words, 'positive', word_boundary=False)
+        self.matcher.add_many(self.negative_words, 'negative', word_boundary=False)
+        self.matcher.build()
+
+        # 엔티티는 사전에 적힌 순서로 반환
+        self.pattern_rank = {}
+        for kind, patterns in (('companies', self.company_patterns),
+                               ('concepts', self.concept_patterns),
+                               ('emotions', self.emotion_patterns)):
+            for rank, pattern in enumerate(patterns):
+                self.pattern_rank.setdefault((kind, pattern), rank)
+
+    def _scan(self, text_lower: str) -> Tuple[Dict[str, List[str]], str]:
+        """소문자 텍스트를 한 번 훑어 엔티티와 감성을 함께 추출"""
+        found = {'companies': set(), 'concepts': set(), 'emotions': set(), 'positive': set(), 'negative': set()}
+        for match in self.matcher.find_all_lower(text_lower):
+            found[match.kind].add(match.value)
 
-        for pattern in company_patterns:
-            if pattern.lower() in text_lower:
-                entities['companies'].append(pattern)
+        entities = {
+            kind: sorted(found[kind], key=lambda pattern: self.pattern_rank[(kind, pattern)])
+            for kind in ('companies', 'concepts', 'emotions')
+        }
+        entities['timeframes'] = []
 
-        for pattern in concept_patterns:
-            if pattern in text_lower:
-                entities['concepts'].append(pattern)
+        positive_count = len(found['positive'])
+        negative_count = len(found['negative'])
+        if positive_count > negative_count:
+            sentiment = 'bullish'
+        elif negative_count > positive_count:
+            sentiment = 'bearish'
+        else:
+            sentiment = 'neutral'
 
-        for pattern in emotion_patterns:
-            if pattern in text_lower:
-                entities['emotions'].append(pattern)
+        return entities, sentiment
 
-        return entities
+    def extract_entities(self, text: str) -> Dict[str, List[str]]:
+        """텍스트에서 엔티티 추출"""
+        return self._scan(text.lower())[0]
+
+    def analyze_sentiment(self, text: str) -> str:
+        """감성 분석"""
+        return self._scan(text.lower())[1]
 
     def infer_relationships(self, quote: str, entities: Dict, investor_id: str) -> List[Dict]:
         """관계 추론"""
+        quote_lower = quote.lower()
+        return self._relationships_from_lower(quote_lower, entities, investor_id, self._scan(quote_lower)[1])
+
+    def _relationships_from_lower(self, quote_lower: str, entities: Dict, investor_id: str,
+                                  sentiment: str) -> List[Dict]:
+        """소문자로 바꾼 인용문에서 관계 추론"""
         relationships = []
 
         # 감성-기업 관계
-        sentiment = self.analyze_sentiment(quote)
         for company in entities['companies']:
             relationships.append({
                 'subject': investor_id,
@@ -244,7 +252,7 @@ class ContinuousLearningSystem:
         # 개념-기업 관계
         for concept in entities['concepts']:
             for company in entities['companies']:
-                if f'{concept} {company}'.lower() in quote.lower():
+                if f'{concept} {company}'.lower() in quote_lower:
                     relationships.append({
                         'subject': company,
                         'predicate': 'has',
@@ -254,22 +262,177 @@ class ContinuousLearningSystem:
 
         return relationships
 
-    def analyze_sentiment(self, text: str) -> str:
-        """감성 분석"""
-        positive_words = ['great', 'wonderful', 'excellent', 'fantastic', 'love', 'excited']
-        negative_words = ['terrible', 'awful', 'worried', 'concerned', 'avoid', 'scared']
+    def extract_relationships(self, quote: str, investor_id: str) -> List[Dict]:
+        """인용문 하나에서 관계 추출 (소문자 변환은 한 번만)"""
+        quote_lower = quote.lower()
+        entities, sentiment = self._scan(quote_lower)
+        return self._relationships_from_lower(quote_lower, entities, investor_id, sentiment)
+
+# 워커 프로세스별 추출기 (처음 사용할 때 생성)
+_worker_extractor: Optional[QuoteExtractor] = None
+
+def _extract_quote_chunk(chunk: List[Tuple[str, str]]) -> List[List[Dict]]:
+    """(투자자, 인용문) 묶음의 관계 추출 - 워커 프로세스에서 실행"""
+    global _worker_extractor
+    if _worker_extractor is None:
+        _worker_extractor = QuoteExtractor()
+    return [_worker_extractor.extract_relationships(quote, investor_id) for investor_id, quote in chunk]
+
+def iter_investor_quotes(data_dir: str = "data/investors") -> Iterator[Dict]:
+    """data/investors/*.json의 모든 인사이트를 학습용 인용문으로 순회"""
+    for path in sorted(Path(data_dir).glob('*.json')):
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+
+        investor_name = data.get('investor_info', {}).get('name', path.stem)
+        for insight in data.get('insights', []):
+            yield {
+                'investor': investor_name,
+                'quote': insight['content'],
+                'context': {
+                    'key_themes': insight.get('investment_themes', []),
+                    'mentioned_companies': insight.get('companies_mentioned', []),
+                    'sentiment': insight.get('sentiment', 'neutral'),
+                    'date_said': insight.get('date_said')
+                }
+            }
+
+def iter_jsonl_quotes(path: str) -> Iterator[Dict]:
+    """JSONL 말뭉치 순회 (한 줄에 {"investor", "quote", "context"} 하나)"""
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+class ContinuousLearningSystem:
+    """지속적 학습 시스템"""
 
-        text_lower = text.lower()
+    def __init__(self, db_path: str = "learning_system.db", batch_size: int = 500, flush_interval: float = 1.0):
+        self.knowledge_graph = KnowledgeGraph()
+        self.db_path = db_path
+        self.learning_history = deque(maxlen=1000)  # 최근 1000개 경험
+        self.extractor = QuoteExtractor()
 
-        positive_count = sum(1 for word in positive_words if word in text_lower)
-        negative_count = sum(1 for word in negative_words if word in text_lower)
+        # 장기 연결 + 일괄 쓰기 저장소
+        self.store = LearningStore(db_path, batch_size=batch_size, flush_interval=flush_interval)
 
-        if positive_count > negative_count:
-            return 'bullish'
-        elif negative_count > positive_count:
-            return 'bearish'
+        self.init_database()
+
+    def init_database(self) -> None:
+        """데이터베이스 초기화"""
+        self.store.init_schema()
+
+    def flush(self) -> None:
+        """버퍼에 남은 지식/경험을 DB에 기록 (내구성 경계)"""
+        self.store.flush()
+
+    def close(self) -> None:
+        """버퍼를 기록하고 DB 연결 종료"""
+        self.store.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.store.flush()
+
+    def learn_from_quote(self, investor_id: str, quote: str, context: Dict) -> None:
+        """인용문으로부터 학습"""
+
+        # 1. 엔티티 추출 (간단 버전)
+        entities = self.extract_entities(quote)
+
+        # 2. 관계 추론
+        relationships = self.infer_relationships(quote, entities, investor_id)
+
+        # 3. 지식 그래프에 추가
+        for rel in relationships:
+            triple = KnowledgeTriple(
+                subject=rel['subject'],
+                predicate=rel['predicate'],
+                object=rel['object'],
+                confidence=rel['confidence'],
+                source=f"quote_{investor_id}_{datetime.now().strftime('%Y%m%d')}",
+                timestamp=datetime.now(),
+                context=context
+            )
+            self.knowledge_graph.add_knowledge(triple)
+            self.save_knowledge_to_db(triple)
+
+    def learn_from_quotes(self, quotes: Iterable[Dict], workers: int = 1,
+                          chunk_size: int = 256) -> Dict:
+        """인용문 스트림으로부터 일괄 학습
+
+        quotes는 {'investor', 'quote', 'context'} 사전의 반복자(생성기 가능)이다.
+        엔티티/관계 추출은 기본적으로 현재 프로세스에서 수행한다. 프로세스 풀 기동 비용은
+        수천 건 이상의 말뭉치에서만 회수되므로, 그때 workers를 2 이상으로 주면
+        chunk_size 단위로 병렬 추출한다. 결과 트리플은 입력 순서대로 그래프와 DB에
+        일괄 반영하므로 workers와 관계없이 같은 그래프가 된다. 처리량 통계를 반환한다.
+        """
+        started = time.perf_counter()
+        source_date = datetime.now().strftime('%Y%m%d')
+        stats = {'quotes': 0, 'triples': 0}
+
+        quote_iter = iter(quotes)
+        chunks = iter(lambda: list(itertools.islice(quote_iter, chunk_size)), [])
+
+        def merge(chunk: List[Dict], relationships_per_quote: List[List[Dict]]) -> None:
+            timestamp = datetime.now()
+            triples = []
+            for item, relationships in zip(chunk, relationships_per_quote):
+                for rel in relationships:
+                    triples.append(KnowledgeTriple(
+                        subject=rel['subject'],
+                        predicate=rel['predicate'],
+                        object=rel['object'],
+                        confidence=rel['confidence'],
+                        source=f"quote_{item['investor']}_{source_date}",
+                        timestamp=timestamp,
+                        context=item.get('context', {})
+                    ))
+
+            for triple in triples:
+                self.knowledge_graph.add_knowledge(triple)
+            self.store.add_knowledge_many(triples)
+
+            stats['quotes'] += len(chunk)
+            stats['triples'] += len(triples)
+
+        if workers <= 1:
+            for chunk in chunks:
+                merge(chunk, [self.extractor.extract_relationships(item['quote'], item['investor']) for item in chunk])
         else:
-            return 'neutral'
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                # 제출량을 제한해 큰 말뭉치도 메모리에 한꺼번에 올리지 않음
+                in_flight = deque()
+                for chunk in chunks:
+                    in_flight.append((chunk, executor.submit(
+                        _extract_quote_chunk, [(item['investor'], item['quote']) for item in chunk]
+                    )))
+                    if len(in_flight) >= workers * 2:
+                        done_chunk, future = in_flight.popleft()
+                        merge(done_chunk, future.result())
+                while in_flight:
+                    done_chunk, future = in_flight.popleft()
+                    merge(done_chunk, future.result())
+
+        self.store.flush()
+
+        stats['seconds'] = time.perf_counter() - started
+        stats['quotes_per_sec'] = stats['quotes'] / stats['seconds'] if stats['seconds'] > 0 else 0.0
+        return stats
+
+    def extract_entities(self, text: str) -> Dict[str, List[str]]:
+        """텍스트에서 엔티티 추출"""
+        return self.extractor.extract_entities(text)
+
+    def infer_relationships(self, quote: str, entities: Dict, investor_id: str) -> List[Dict]:
+        """관계 추론"""
+        return self.extractor.infer_relationships(quote, entities, investor_id)
+
+    def analyze_sentiment(self, text: str) -> str:
+        """감성 분석"""
+        return self.extractor.analyze_sentiment(text)
 
     def learn_from_outcome(self, prediction: Dict, actual_outcome: Dict) -> None:
         """실제 결과로부터 학습"""
@@ -305,6 +468,40 @@ class ContinuousLearningSystem:
         # 관련 지식 업데이트
         self.update_related_knowledge(experience)
 
+    def learn_from_outcomes(self, investor_id: str, actions: np.ndarray, performances: np.ndarray,
+                            contexts: List[Dict]) -> np.ndarray:
+        """실제 결과 여러 개로부터 일괄 학습 (learn_from_outcome 반복과 같은 기록)
+
+        정확도는 한 번에 계산하고, 경험 행은 저장소에 묶어서 넘긴다. 학습 기록에는
+        deque에 남을 마지막 경험만 객체로 만든다. 결정별 정확도 배열을 반환한다.
+        """
+        actions = np.asarray(actions)
+        performances = np.asarray(performances, dtype=float)
+        accuracy = decision_quality(actions, performances)
+        timestamp = datetime.now()
+
+        self.store.add_experience_rows(
+            (investor_id, str(action), str(performance), score, json.dumps(context))
+            for action, performance, score, context in zip(
+                actions.tolist(), performances.tolist(), accuracy.tolist(), contexts)
+        )
+
+        keep_from = max(0, len(actions) - (self.learning_history.maxlen or len(actions)))
+        for i in np.flatnonzero((accuracy > 0.8) | (accuracy < 0.3) | (np.arange(len(actions)) >= keep_from)):
+            experience = LearningExperience(
+                investor_id=investor_id,
+                prediction=str(actions[i]),
+                actual_outcome=str(float(performances[i])),
+                accuracy_score=float(accuracy[i]),
+                situation_context=contexts[i],
+                timestamp=timestamp
+            )
+            if i >= keep_from:
+                self.learning_history.append(experience)
+            self.update_related_knowledge(experience)
+
+        return accuracy
+
     def update_related_knowledge(self, experience: LearningExperience) -> None:
         """관련 지식 업데이트"""
 
@@ -443,45 +640,12 @@ class ContinuousLearningSystem:
         return ". ".join(reasoning_parts) if reasoning_parts else "Based on historical patterns and current market conditions."
 
     def save_knowledge_to_db(self, triple: KnowledgeTriple) -> None:
-        """지식을 DB에 저장"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-
-        cursor.execute('''
-            INSERT INTO knowledge_triples
-            (subject, predicate, object, confidence, source, context)
-            VALUES (?, ?, ?, ?, ?, ?)
-        ''', (
-            triple.subject,
-            triple.predicate,
-            triple.object,
-            triple.confidence,
-            triple.source,
-            json.dumps(triple.context)
-        ))
-
-        conn.commit()
-        conn.close()
+        """지식을 DB에 저장 (버퍼링 후 일괄 기록)"""
+        self.store.add_knowledge(triple)
 
     def save_experience_to_db(self, experience: LearningExperience) -> None:
-        """학습 경험을 DB에 저장"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-
-        cursor.execute('''
-            INSERT INTO learning_experiences
-            (investor_id, prediction, actual_outcome, accuracy_score, situation_context)
-            VALUES (?, ?, ?, ?, ?)
-        ''', (
-            experience.investor_id,
-            experience.prediction,
-            experience.actual_outcome,
-            experience.accuracy_score,
-            json.dumps(experience.situation_context)
-        ))
-
-        conn.commit()
-        conn.close()
+        """학습 경험을 DB에 저장 (버퍼링 후 일괄 기록)"""
+        self.store.add_experience(experience)
 
 # 데모 실행
 def demo_learning_system():
@@ -522,6 +686,12 @@ def demo_learning_system():
         )
         print(f"   ✓ Learned from {quote_data['investor']} quote")
 
+    # 거장 데이터의 모든 인사이트 일괄 학습
+    data_dir = Path(__file__).parent.parent / 'data' / 'investors'
+    stats = learning_system.learn_from_quotes(iter_investor_quotes(str(data_dir)))
+    print(f"   ✓ Bulk-learned {stats['quotes']} insights → {stats['triples']} triples "
+          f"({stats['quotes_per_sec']:.0f} quotes/sec)")
+
     # 2. 현재 상황에서 예측
     print("\n🔮 Making predictions for current market...")
 
@@ -545,7 +715,7 @@ def demo_learning_system():
     outcomes = [
         {
             'investor': 'Warren Buffett',
-            'prediction': {'action': 'buy', 'context': current_context},
+            'prediction': {'investor_id': 'Warren Buffett', 'action': 'buy', 'context': current_context},
             'result': {'performance': 0.25, 'time_horizon': '2y'}
         }
     ]
@@ -557,6 +727,7 @@ def demo_learning_system():
         )
         print(f"   ✓ Learned from {outcome['investor']} outcome (25% gain)")
 
+    learning_system.close()
     print("\n🎯 Learning system is now smarter!")
 
 if __name__ == "__main__":
@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+"""
+💾 Learning Store - ContinuousLearningSystem의 SQLite 저장 계층
+"매번 연결하고 커밋하는 대신, 모아서 한 번에 쓴다"
+"""
+
+import json
+import sqlite3
+import threading
+import time
+from typing import Dict, Iterable, List, Optional, Tuple
+
+SYNCHRONOUS_MODES = {'OFF', 'NORMAL', 'FULL', 'EXTRA'}
+TABLES = ('knowledge_triples', 'learning_experiences')
+
+class LearningStore:
+    """장기 연결 + 버퍼링 일괄 쓰기 SQLite 저장소
+
+    쓰기는 메모리 버퍼에 쌓였다가 batch_size개가 차거나 flush_interval초가 지나면
+    executemany 한 번과 커밋 한 번으로 기록된다. 시간 창은 버퍼가 비어 있다가 처음
+    채워질 때 거는 데몬 타이머가 지키므로, 이후 쓰기가 없어도 행이 버퍼에 남지 않는다.
+    타이머는 프로세스 종료 시 실행이 보장되지 않으므로 종료 전에는 close()를, 내구성이
+    필요한 지점에서는 flush()나 with 블록을 사용한다 (블록을 벗어날 때 flush).
+    """
+
+    def __init__(self, db_path: str, batch_size: int = 500, flush_interval: float = 1.0,
+                 synchronous: str = "NORMAL", clock=time.monotonic):
+        self.db_path = db_path
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._clock = clock
+        self._lock = threading.RLock()
+
+        self._knowledge_buffer: List[Tuple] = []
+        self._experience_buffer: List[Tuple] = []
+        self._last_flush = clock()
+        self._timer: Optional[threading.Timer] = None
+        self._closed = False
+
+        synchronous = synchronous.upper()
+        if synchronous not in SYNCHRONOUS_MODES:
+            raise ValueError(f"synchronous는 {sorted(SYNCHRONOUS_MODES)} 중 하나여야 함: {synchronous!r}")
+
+        self.conn = sqlite3.connect(db_path, check_same_thread=False)
+        if db_path != ":memory:":
+            self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute(f"PRAGMA synchronous={synchronous}")
+        self.init_schema()
+
+    def init_schema(self) -> None:
+        """테이블 생성"""
+        with self._lock:
+            cursor = self.conn.cursor()
+
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS learning_experiences (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    investor_id TEXT NOT NULL,
+                    prediction TEXT NOT NULL,
+                    actual_outcome TEXT NOT NULL,
+                    accuracy_score REAL,
+                    situation_context TEXT,
+                    timestamp DATETIME DEFAULT CURRENT_TIMESTAMP
+                )
+            ''')
+
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS knowledge_triples (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    subject TEXT NOT NULL,
+                    predicate TEXT NOT NULL,
+                    object TEXT NOT NULL,
+                    confidence REAL NOT NULL,
+                    source TEXT NOT NULL,
+                    context TEXT,
+                    timestamp DATETIME DEFAULT CURRENT_TIMESTAMP
+                )
+            ''')
+
+            self.conn.commit()
+
+    @property
+    def pending(self) -> int:
+        """아직 기록되지 않은 행 수"""
+        return len(self._knowledge_buffer) + len(self._experience_buffer)
+
+    def add_knowledge(self, triple) -> None:
+        """지식 트리플 기록 예약"""
+        self.add_knowledge_many([triple])
+
+    def add_knowledge_many(self, triples: Iterable) -> None:
+        """지식 트리플 여러 개 기록 예약"""
+        rows = [
+            (t.subject, t.predicate, t.object, t.confidence, t.source, json.dumps(t.context))
+            for t in triples
+        ]
+        with self._lock:
+            self._knowledge_buffer.extend(rows)
+            self._maybe_flush()
+
+    def add_experience(self, experience) -> None:
+        """학습 경험 기록 예약"""
+        row = (
+            experience.investor_id,
+            experience.prediction,
+            experience.actual_outcome,
+            experience.accuracy_score,
+            json.dumps(experience.situation_context)
+        )
+        with self._lock:
+            self._experience_buffer.append(row)
+            self._maybe_flush()
+
+    def add_experience_rows(self, rows: Iterable[tuple]) -> None:
+        """(investor_id, prediction, actual_outcome, accuracy_score, context_json) 행 여러 개 기록 예약"""
+        with self._lock:
+            self._experience_buffer.extend(rows)
+            self._maybe_flush()
+
+    def _maybe_flush(self) -> None:
+        """배치 크기나 시간 창을 넘으면 기록 (잠금 안에서 호출)"""
+        if self.pending >= self.batch_size or self._clock() - self._last_flush >= self.flush_interval:
+            self.flush()
+        elif self.pending and self._timer is None and self.flush_interval > 0:
+            self._timer = threading.Timer(self.flush_interval, self._flush_on_timer)
+            self._timer.daemon = True
+            self._timer.start()
+
+    def _flush_on_timer(self) -> None:
+        """시간 창이 끝날 때까지 추가 쓰기가 없으면 타이머 스레드에서 기록"""
+        with self._lock:
+            self._timer = None
+            if not self._closed:
+                self.flush()
+
+    def flush(self) -> None:
+        """버퍼를 한 트랜잭션으로 기록"""
+        with self._lock:
+            self._last_flush = self._clock()
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            if not self.pending:
+                return
+
+            with self.conn:
+                if self._knowledge_buffer:
+                    self.conn.executemany('''
+                        INSERT INTO knowledge_triples
+                        (subject, predicate, object, confidence, source, context)
+                        VALUES (?, ?, ?, ?, ?, ?)
+                    ''', self._knowledge_buffer)
+
+                if self._experience_buffer:
+                    self.conn.executemany('''
+                        INSERT INTO learning_experiences
+                        (investor_id, prediction, actual_outcome, accuracy_score, situation_context)
+                        VALUES (?, ?, ?, ?, ?)
+                    ''', self._experience_buffer)
+
+            self._knowledge_buffer = []
+            self._experience_buffer = []
+
+    def high_water(self) -> Dict[str, int]:
+        """버퍼를 기록한 뒤 테이블별 마지막 행 id (체크포인트에 함께 저장)"""
+        with self._lock:
+            self.flush()
+            return {table: self.conn.execute(f"SELECT COALESCE(MAX(id), 0) FROM {table}").fetchone()[0]
+                    for table in TABLES}
+
+    def rollback_to(self, marks: Dict[str, int]) -> int:
+        """high_water 이후에 기록된 행 삭제, 삭제한 행 수 반환
+
+        체크포인트에서 재개할 때 부른다. 체크포인트 뒤에 기록된 행은 재개 후 다시 기록되므로
+        지우지 않으면 중복된다 (AUTOINCREMENT라 새 행 id는 지운 id를 재사용하지 않음).
+        """
+        with self._lock:
+            self.flush()
+            removed = 0
+            with self.conn:
+                for table in TABLES:
+                    removed += self.conn.execute(f"DELETE FROM {table} WHERE id > ?", (marks.get(table, 0),)).rowcount
+            return removed
+
+    def close(self) -> None:
+        """남은 버퍼를 기록하고 연결 종료"""
+        with self._lock:
+            self.flush()
+            self._closed = True
+            self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.flush()
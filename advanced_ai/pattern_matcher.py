@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+🔎 Multi-Pattern Matcher - Aho-Corasick 기반 단일 패스 키워드 추출
+"사전이 수천 개로 늘어나도 텍스트는 한 번만 훑는다"
+"""
+
+from collections import deque
+from typing import Any, Iterable, List, NamedTuple, Optional
+
+class PatternMatch(NamedTuple):
+    """매칭 결과 (오프셋은 소문자로 바꾼 텍스트 기준)"""
+    start: int
+    end: int
+    kind: str  # 패턴 종류 (company, concept, emotion 등)
+    value: Any  # 패턴에 붙은 값 (원래 표기, 티커 등)
+
+def _is_word_char(ch: str) -> bool:
+    return ch.isalnum() or ch == '_'
+
+class MultiPatternMatcher:
+    """대소문자 무시 Aho-Corasick 오토마톤
+
+    여러 사전의 패턴을 종류(kind)와 값(value)을 붙여 한 오토마톤에 넣고,
+    텍스트를 한 번 훑어 모든 매칭을 반환한다. word_boundary인 패턴은
+    앞뒤가 단어 문자(영숫자, _)로 이어지면 매칭하지 않는다.
+    """
+
+    def __init__(self, word_boundary: bool = True):
+        self.word_boundary = word_boundary
+        self._goto = [{}]  # 상태별 전이
+        self._fail = [0]  # 실패 링크
+        self._own = [[]]  # 상태에서 끝나는 패턴만 (길이, 종류, 값, 왼쪽 경계 확인, 오른쪽 경계 확인)
+        self._outputs = [[]]  # 실패 링크로 물려받은 것까지 합친 출력 (build가 매번 새로 계산)
+        self._built = True
+
+    def add(self, pattern: str, kind: str, value: Any = None, word_boundary: Optional[bool] = None) -> None:
+        """패턴 추가 (value를 생략하면 원래 패턴 문자열)"""
+        key = pattern.lower()
+        if not key:
+            return
+
+        state = 0
+        for ch in key:
+            next_state = self._goto[state].get(ch)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto.append({})
+                self._fail.append(0)
+                self._own.append([])
+                self._outputs.append([])
+                self._goto[state][ch] = next_state
+            state = next_state
+
+        boundary = self.word_boundary if word_boundary is None else word_boundary
+        self._own[state].append((
+            len(key),
+            kind,
+            pattern if value is None else value,
+            boundary and _is_word_char(key[0]),
+            boundary and _is_word_char(key[-1])
+        ))
+        self._built = False
+
+    def add_many(self, patterns: Iterable[str], kind: str, word_boundary: Optional[bool] = None) -> None:
+        """같은 종류의 패턴 여러 개 추가"""
+        for pattern in patterns:
+            self.add(pattern, kind, word_boundary=word_boundary)
+
+    def build(self) -> None:
+        """실패 링크와 합친 출력 계산 (BFS)
+
+        add() 후 다시 불려도 이전 결과에 덧붙이지 않도록 출력은 각 상태의
+        고유 패턴에서 처음부터 다시 합친다.
+        """
+        self._outputs = [list(own) for own in self._own]
+        queue = deque()
+        for next_state in self._goto[0].values():
+            self._fail[next_state] = 0
+            queue.append(next_state)
+
+        while queue:
+            state = queue.popleft()
+            for ch, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fail = self._fail[state]
+                while fail and ch not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[next_state] = self._goto[fail].get(ch, 0)
+                self._outputs[next_state] = self._outputs[next_state] + self._outputs[self._fail[next_state]]
+
+        self._built = True
+
+    def find_all(self, text: str) -> List[PatternMatch]:
+        """텍스트의 모든 매칭 (대소문자 무시)"""
+        return self.find_all_lower(text.lower())
+
+    def find_all_lower(self, text_lower: str) -> List[PatternMatch]:
+        """이미 소문자로 바꾼 텍스트의 모든 매칭"""
+        if not self._built:
+            self.build()
+
+        goto, fail, outputs = self._goto, self._fail, self._outputs
+        size = len(text_lower)
+        matches = []
+        state = 0
+
+        for i, ch in enumerate(text_lower):
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+
+            for length, kind, value, check_left, check_right in outputs[state]:
+                start = i - length + 1
+                if check_left and start > 0 and _is_word_char(text_lower[start - 1]):
+                    continue
+                if check_right and i + 1 < size and _is_word_char(text_lower[i + 1]):
+                    continue
+                matches.append(PatternMatch(start, i + 1, kind, value))
+
+        return matches
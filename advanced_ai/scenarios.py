@@ -0,0 +1,273 @@
+#!/usr/bin/env python3
+"""
+🧪 Scenario Sweep - 시장 상황 격자 x 기업 전체에 대한 거장 판단 텐서
+"강세/약세, 변동성 0.1-0.9, 감성 -1..1 에서 판단이 어떻게 바뀌는가"를 한 번에
+"""
+
+import itertools
+from dataclasses import dataclass, field, replace
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .investor_brain import (
+    ACTIONS,
+    InvestorBrain,
+    MarketContext,
+    MarketPhase,
+    company_columns,
+    create_investor_brain,
+    registered_brains
+)
+
+# 격자 축으로 쓸 수 있는 MarketContext 필드
+CONTEXT_AXES = ('phase', 'volatility', 'sentiment_score', 'valuation_level', 'key_themes', 'risk_factors')
+
+def default_base_context() -> MarketContext:
+    """격자에 없는 필드의 기본값"""
+    return MarketContext(
+        phase=MarketPhase.TRANSITION,
+        volatility=0.5,
+        sentiment_score=0.0,
+        valuation_level=0.5,
+        key_themes=[],
+        risk_factors=[]
+    )
+
+def axis_label(value) -> str:
+    """요약 출력용 축 값 표기"""
+    if isinstance(value, MarketPhase):
+        return value.value
+    if isinstance(value, (list, tuple)):
+        return '|'.join(map(str, value))
+    return f"{value:g}" if isinstance(value, float) else str(value)
+
+@dataclass
+class ScenarioSet:
+    """시장 상황 묶음 (격자면 축별 차원, 몬테카를로면 'sample' 한 차원)"""
+    contexts: List[MarketContext]
+    dims: Tuple[str, ...]
+    axes: Dict[str, list]
+
+    @property
+    def shape(self) -> Tuple[int, ...]:
+        return tuple(len(self.axes[dim]) for dim in self.dims)
+
+    def __len__(self) -> int:
+        return len(self.contexts)
+
+    @classmethod
+    def grid(cls, base: Optional[MarketContext] = None, **axes: Sequence) -> 'ScenarioSet':
+        """축 값의 데카르트 곱 (축 순서 = 인자 순서, 마지막 축이 가장 빠르게 변함)
+
+        예: ScenarioSet.grid(phase=[MarketPhase.BULL_MARKET, MarketPhase.BEAR_MARKET],
+                             volatility=np.linspace(0.1, 0.9, 9), sentiment_score=np.linspace(-1, 1, 9))
+        """
+        unknown = set(axes) - set(CONTEXT_AXES)
+        if unknown:
+            raise ValueError(f"Unknown scenario axes: {sorted(unknown)}")
+        base = base or default_base_context()
+        values = {
+            name: [MarketPhase(v) if name == 'phase' else (list(v) if name in ('key_themes', 'risk_factors') else float(v))
+                   for v in axis]
+            for name, axis in axes.items()
+        }
+        dims = tuple(values)
+        contexts = [replace(base, **dict(zip(dims, combo))) for combo in itertools.product(*values.values())]
+        return cls(contexts=contexts, dims=dims, axes=values)
+
+    @classmethod
+    def monte_carlo(cls, n: int, seed: Optional[int] = None, base: Optional[MarketContext] = None,
+                    phases: Sequence[MarketPhase] = tuple(MarketPhase),
+                    volatility: Tuple[float, float] = (0.0, 1.0),
+                    sentiment_score: Tuple[float, float] = (-1.0, 1.0),
+                    valuation_level: Tuple[float, float] = (0.0, 1.0)) -> 'ScenarioSet':
+        """무작위 시장 상황 n개 (국면은 균등 추출, 수치는 구간 균등 분포)"""
+        rng = np.random.default_rng(seed)
+        base = base or default_base_context()
+        phases = [MarketPhase(phase) for phase in phases]
+        phase_index = rng.integers(len(phases), size=n)
+        draws = {
+            name: rng.uniform(low, high, size=n)
+            for name, (low, high) in (('volatility', volatility), ('sentiment_score', sentiment_score),
+                                      ('valuation_level', valuation_level))
+        }
+        contexts = [
+            replace(base, phase=phases[phase_index[i]], volatility=float(draws['volatility'][i]),
+                    sentiment_score=float(draws['sentiment_score'][i]),
+                    valuation_level=float(draws['valuation_level'][i]))
+            for i in range(n)
+        ]
+        return cls(contexts=contexts, dims=('sample',), axes={'sample': list(range(n))})
+
+    def parameters(self) -> Dict[str, np.ndarray]:
+        """시나리오별 수치 파라미터 (shape 모양 배열)"""
+        return {
+            'phase': np.array([context.phase.value for context in self.contexts]).reshape(self.shape),
+            'volatility': np.array([context.volatility for context in self.contexts]).reshape(self.shape),
+            'sentiment_score': np.array([context.sentiment_score for context in self.contexts]).reshape(self.shape),
+            'valuation_level': np.array([context.valuation_level for context in self.contexts]).reshape(self.shape)
+        }
+
+@dataclass
+class ScenarioResult:
+    """거장 x 시나리오 축 x 기업 판단 텐서
+
+    action_codes는 ACTIONS 인덱스(int8), confidences/scores는 float32.
+    차원 순서는 dims = ('investor', *scenario.dims, 'company').
+    """
+    investors: List[str]
+    tickers: np.ndarray
+    scenarios: ScenarioSet
+    action_codes: np.ndarray
+    confidences: np.ndarray
+    scores: np.ndarray
+    evaluations: Dict[str, int] = field(default_factory=dict)  # 거장별 실제 일괄 평가 횟수
+
+    @property
+    def dims(self) -> Tuple[str, ...]:
+        return ('investor',) + self.scenarios.dims + ('company',)
+
+    @property
+    def pairs(self) -> int:
+        """시나리오-기업 쌍 수 (거장당)"""
+        return len(self.scenarios) * len(self.tickers)
+
+    def investor_index(self, investor_id: str) -> int:
+        try:
+            return self.investors.index(investor_id)
+        except ValueError:
+            raise KeyError(f"Unknown investor in result: {investor_id}") from None
+
+    def actions(self, investor_id: str) -> np.ndarray:
+        """한 거장의 판단을 문자열 배열로 (*scenario.shape, 기업 수)"""
+        return np.array(ACTIONS)[self.action_codes[self.investor_index(investor_id)]]
+
+    def action_share(self) -> np.ndarray:
+        """시나리오별 행동 비율 (investor, *scenario.shape, len(ACTIONS))"""
+        return np.stack([(self.action_codes == code).mean(axis=-1) for code in range(len(ACTIONS))], axis=-1)
+
+    def company_stability(self, investor_id: str) -> Dict[str, np.ndarray]:
+        """기업별 최빈 행동과 그 비율 (1.0이면 모든 시나리오에서 같은 판단)"""
+        codes = self.action_codes[self.investor_index(investor_id)].reshape(len(self.scenarios), -1)
+        counts = np.stack([(codes == code).sum(axis=0) for code in range(len(ACTIONS))])
+        modal = counts.argmax(axis=0)
+        return {
+            'tickers': self.tickers,
+            'modal_action': np.array(ACTIONS)[modal],
+            'stability': counts.max(axis=0) / len(self.scenarios),
+            'distinct_actions': (counts > 0).sum(axis=0)
+        }
+
+    def boundaries(self, axis: str) -> Dict[str, List[Dict]]:
+        """축을 따라 이웃한 두 값 사이에서 판단이 바뀌는 비율 (거장별)
+
+        다른 시나리오 축과 기업 전체에 대해 평균한 전환율을 구간마다 돌려준다.
+        """
+        if axis not in self.scenarios.dims:
+            raise ValueError(f"Not a scenario grid axis: {axis}")
+        position = 1 + self.scenarios.dims.index(axis)
+        values = self.scenarios.axes[axis]
+        codes = np.moveaxis(self.action_codes, position, 1)
+        flips = codes[:, 1:] != codes[:, :-1]
+        rates = flips.reshape(flips.shape[0], flips.shape[1], -1).mean(axis=-1)
+
+        return {
+            investor_id: [
+                {
+                    'from': axis_label(values[i]),
+                    'to': axis_label(values[i + 1]),
+                    'flip_rate': float(rates[b, i])
+                }
+                for i in range(len(values) - 1)
+            ]
+            for b, investor_id in enumerate(self.investors)
+        }
+
+    def boundary_summary(self) -> Dict[str, Dict]:
+        """거장별 요약: 전체 행동 비율, 격자 축별 전환율과 가장 민감한 구간"""
+        share = self.action_share()
+        summary = {}
+        for b, investor_id in enumerate(self.investors):
+            overall = share[b].reshape(-1, len(ACTIONS)).mean(axis=0)
+            summary[investor_id] = {
+                'action_share': {action: float(overall[code]) for code, action in enumerate(ACTIONS)},
+                'axes': {}
+            }
+
+        for axis in self.scenarios.dims:
+            if axis == 'sample' or len(self.scenarios.axes[axis]) < 2:
+                continue
+            for investor_id, transitions in self.boundaries(axis).items():
+                rates = [t['flip_rate'] for t in transitions]
+                summary[investor_id]['axes'][axis] = {
+                    'flip_rate': float(np.mean(rates)),
+                    'sharpest': max(transitions, key=lambda t: t['flip_rate']),
+                    'transitions': transitions
+                }
+        return summary
+
+class ScenarioEngine:
+    """시나리오 x 기업 데카르트 곱에 대한 거장 판단 평가기
+
+    거장 판단은 시장 상황에 prepare_context()의 몇 가지 항목으로만 의존한다.
+    그래서 시나리오마다 그 항목만 계산해 같은 항목을 가진 시나리오를 묶고,
+    묶음마다 analyze_companies를 한 번 돌린 뒤 결과를 시나리오 축으로 펼친다.
+    결과는 기업별로 analyze_company를 부른 것과 같다. context_terms를 오버라이드하지
+    않은 뇌는 시장 상황 의존을 알 수 없으므로 시나리오마다 따로 평가한다.
+    """
+
+    def __init__(self, brains: Optional[Dict[str, InvestorBrain]] = None):
+        if brains is None:
+            brains = {spec.investor_id: create_investor_brain(spec.investor_id) for spec in registered_brains()}
+        self.brains = dict(brains)
+
+    def run(self, scenarios: ScenarioSet, companies) -> ScenarioResult:
+        """전체 시나리오 x 기업 평가"""
+        columns = company_columns(companies)
+        size = len(columns['pe_ratio'])
+        shape = (len(self.brains),) + scenarios.shape + (size,)
+        action_codes = np.empty(shape, dtype=np.int8)
+        confidences = np.empty(shape, dtype=np.float32)
+        scores = np.empty(shape, dtype=np.float32)
+        action_lookup = {action: code for code, action in enumerate(ACTIONS)}
+        evaluations = {}
+
+        for b, (investor_id, brain) in enumerate(self.brains.items()):
+            group_of = {}
+            representatives = []
+            inverse = np.empty(len(scenarios), dtype=np.intp)
+            groupable = type(brain).context_terms is not InvestorBrain.context_terms
+            for s, context in enumerate(scenarios.contexts):
+                prepared = brain.prepare_context(context)
+                key = tuple(sorted(prepared.terms.items())) if groupable else s
+                if key not in group_of:
+                    group_of[key] = len(representatives)
+                    representatives.append(prepared)
+                inverse[s] = group_of[key]
+
+            group_codes = np.empty((len(representatives), size), dtype=np.int8)
+            group_confidences = np.empty((len(representatives), size), dtype=np.float32)
+            group_scores = np.empty((len(representatives), size), dtype=np.float32)
+            for g, prepared in enumerate(representatives):
+                batch = brain.analyze_companies(columns, prepared)
+                actions, codes = np.unique(batch.actions, return_inverse=True)
+                group_codes[g] = np.array([action_lookup[action] for action in actions], dtype=np.int8)[codes]
+                group_confidences[g] = batch.confidences
+                group_scores[g] = batch.scores
+
+            flat = (len(scenarios), size)
+            action_codes[b].reshape(flat)[:] = group_codes[inverse]
+            confidences[b].reshape(flat)[:] = group_confidences[inverse]
+            scores[b].reshape(flat)[:] = group_scores[inverse]
+            evaluations[investor_id] = len(representatives)
+
+        return ScenarioResult(
+            investors=list(self.brains),
+            tickers=np.asarray(columns['ticker']),
+            scenarios=scenarios,
+            action_codes=action_codes,
+            confidences=confidences,
+            scores=scores,
+            evaluations=evaluations
+        )
@@ -0,0 +1,236 @@
+#!/usr/bin/env python3
+"""
+📏 Decision Sensitivity - 판단이 뒤집히기까지 남은 거리
+"PER이 얼마나 오르면 버핏이 매수를 접는가" - 기업별/입력 필드별 행동 전환 마진
+"""
+
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .investor_brain import (
+    ACTIONS,
+    ACTION_CODES,
+    COMPANY_NUMERIC_FIELDS,
+    COMPANY_TEXT_FIELDS,
+    InvestorBrain,
+    MarketContext,
+    company_columns,
+    create_investor_brain,
+    map_categories,
+    registered_brains
+)
+
+# 필드별 탐색 범위 (현재 값에서 위/아래로 이만큼까지 찾음)
+SEARCH_SPANS = {
+    'pe_ratio': 100.0,
+    'pb_ratio': 20.0,
+    'roe': 50.0,
+    'debt_equity': 5.0,
+    'revenue_growth': 60.0,
+    'business_complexity': 1.0,
+    'moat_strength': 1.0
+}
+
+# 필드가 가질 수 있는 값의 범위 (현재 값이 밖에 있으면 그 값까지 넓힘)
+FIELD_BOUNDS = {
+    'pb_ratio': (0.0, np.inf),
+    'debt_equity': (0.0, np.inf),
+    'business_complexity': (0.0, 1.0),
+    'moat_strength': (0.0, 1.0)
+}
+
+def encode_actions(actions: np.ndarray) -> np.ndarray:
+    """행동 문자열 -> ACTIONS 코드 (int8, 모르는 행동은 -1)"""
+    return map_categories(actions, lambda action: ACTION_CODES.get(action, -1), dtype=np.int8)
+
+@dataclass
+class SensitivityResult:
+    """거장 x 필드 x 기업 행동 전환 마진
+
+    up/down은 필드를 올리거나/내려서 행동이 처음 바뀌는 거리(필드 단위, 양수).
+    탐색 범위 안에서 바뀌지 않으면 inf. up_actions/down_actions는 바뀐 뒤 행동 코드(-1이면 없음).
+    """
+    investors: List[str]
+    fields: Tuple[str, ...]
+    tickers: np.ndarray
+    base_actions: np.ndarray  # (investor, company) 행동 코드
+    up: np.ndarray  # (investor, field, company)
+    down: np.ndarray
+    up_actions: np.ndarray
+    down_actions: np.ndarray
+    spans: Dict[str, float]
+
+    def investor_index(self, investor_id: str) -> int:
+        try:
+            return self.investors.index(investor_id)
+        except ValueError:
+            raise KeyError(f"Unknown investor in result: {investor_id}") from None
+
+    def margins(self, investor_id: str) -> Dict[str, np.ndarray]:
+        """필드별 가장 가까운 전환까지의 거리 (위/아래 중 작은 쪽)"""
+        b = self.investor_index(investor_id)
+        return {field: np.minimum(self.up[b, f], self.down[b, f]) for f, field in enumerate(self.fields)}
+
+    def nearest_flip(self, investor_id: str) -> Dict[str, np.ndarray]:
+        """기업별로 가장 민감한 필드 (탐색 범위 대비 상대 거리 기준)"""
+        b = self.investor_index(investor_id)
+        spans = np.array([self.spans[field] for field in self.fields])[:, None]
+        relative = np.minimum(self.up[b], self.down[b]) / spans
+        best = relative.argmin(axis=0)
+        columns = np.arange(relative.shape[1])
+        going_up = self.up[b, best, columns] <= self.down[b, best, columns]
+        flipped = np.where(going_up, self.up_actions[b, best, columns], self.down_actions[b, best, columns])
+        found = np.isfinite(relative[best, columns])
+        return {
+            'tickers': self.tickers,
+            'action': np.array(ACTIONS)[self.base_actions[b]],
+            'field': np.where(found, np.array(self.fields)[best], ''),
+            'direction': np.where(found, np.where(going_up, 'up', 'down'), ''),
+            'distance': np.minimum(self.up[b], self.down[b])[best, columns],
+            'relative_distance': relative[best, columns],
+            'flips_to': np.where(found, np.array(ACTIONS + ('',))[flipped], '')
+        }
+
+    def to_frame(self, investor_id: str):
+        """리스크 리뷰용 표 (기업별 현재 행동 + 필드별 위/아래 마진)"""
+        import pandas as pd
+
+        b = self.investor_index(investor_id)
+        frame = pd.DataFrame({'ticker': self.tickers, 'action': np.array(ACTIONS)[self.base_actions[b]]})
+        for f, field in enumerate(self.fields):
+            frame[f'{field}_up'] = self.up[b, f]
+            frame[f'{field}_down'] = self.down[b, f]
+        return frame
+
+class SensitivityAnalyzer:
+    """행동 전환 마진 분석기 (기존 analyze_companies 규칙 위에서 벡터화 탐색)
+
+    필드마다 현재 값에서 위/아래로 탐색 범위를 steps 칸으로 나눠 한 번에 훑고,
+    처음 행동이 바뀐 칸과 그 직전 칸 사이를 이분 탐색해 tolerance 안으로 좁힌다.
+    모든 평가는 기업 전체에 대한 일괄 analyze_companies 호출이며, 이미 전환을 찾은
+    기업은 다음 칸부터 빠진다. 칸 폭보다 좁은 구간에서 바뀌었다가 되돌아오는 전환은
+    놓칠 수 있으니 필요하면 steps를 늘린다.
+    """
+
+    def __init__(self, brains: Optional[Dict[str, InvestorBrain]] = None,
+                 fields: Sequence[str] = COMPANY_NUMERIC_FIELDS,
+                 spans: Optional[Dict[str, float]] = None,
+                 steps: int = 64, tolerance: float = 1e-6, chunk_size: int = 250000):
+        if brains is None:
+            brains = {spec.investor_id: create_investor_brain(spec.investor_id) for spec in registered_brains()}
+        unknown = set(fields) - set(COMPANY_NUMERIC_FIELDS)
+        if unknown:
+            raise ValueError(f"Not numeric company fields: {sorted(unknown)}")
+        self.brains = dict(brains)
+        self.fields = tuple(fields)
+        self.spans = {**SEARCH_SPANS, **(spans or {})}
+        self.steps = steps
+        self.tolerance = tolerance
+        self.chunk_size = chunk_size
+
+    def analyze(self, companies, context: MarketContext) -> SensitivityResult:
+        """한 시장 상황에서 전체 기업의 필드별 위/아래 전환 마진"""
+        columns = company_columns(companies)
+        # 범주 열은 고정 폭 문자열로 - 반복 평가에서 np.unique가 훨씬 빠름
+        for field in COMPANY_TEXT_FIELDS:
+            columns[field] = np.asarray(columns[field]).astype(str)
+        size = len(columns['pe_ratio'])
+        shape = (len(self.brains), len(self.fields), size)
+        up, down = np.full(shape, np.inf), np.full(shape, np.inf)
+        up_actions = np.full(shape, -1, dtype=np.int8)
+        down_actions = np.full(shape, -1, dtype=np.int8)
+        base_actions = np.empty((len(self.brains), size), dtype=np.int8)
+
+        for b, brain in enumerate(self.brains.values()):
+            prepared = brain.prepare_context(context)
+            base = self._evaluate(brain, prepared, columns, np.arange(size), None, None)
+            base_actions[b] = encode_actions(base)
+            for f, field in enumerate(self.fields):
+                for sign, distances, flipped in ((1.0, up, up_actions), (-1.0, down, down_actions)):
+                    distances[b, f], flipped[b, f] = self._search(brain, prepared, columns, base, field, sign)
+
+        return SensitivityResult(
+            investors=list(self.brains),
+            fields=self.fields,
+            tickers=np.asarray(columns['ticker']),
+            base_actions=base_actions,
+            up=up,
+            down=down,
+            up_actions=up_actions,
+            down_actions=down_actions,
+            spans={field: self.spans[field] for field in self.fields}
+        )
+
+    def _evaluate(self, brain: InvestorBrain, prepared, columns: Dict[str, np.ndarray],
+                  rows: np.ndarray, field: Optional[str], values: Optional[np.ndarray]) -> np.ndarray:
+        """rows 기업의 field를 values로 바꿔 일괄 분석한 행동 (문자열 배열)"""
+        actions = np.empty(len(rows), dtype='<U5')
+        for start in range(0, len(rows), self.chunk_size):
+            chunk = rows[start:start + self.chunk_size]
+            sub = {name: column[chunk] for name, column in columns.items()}
+            if field is not None:
+                sub[field] = values[start:start + self.chunk_size]
+            actions[start:start + len(chunk)] = brain.analyze_companies(sub, prepared).actions
+        return actions
+
+    def _search(self, brain: InvestorBrain, prepared, columns: Dict[str, np.ndarray],
+                base: np.ndarray, field: str, sign: float) -> Tuple[np.ndarray, np.ndarray]:
+        """한 필드/방향의 전환 거리와 전환 후 행동 (격자 훑기 + 이분 탐색)"""
+        x = columns[field]
+        size = len(x)
+        low, high = FIELD_BOUNDS.get(field, (-np.inf, np.inf))
+        low, high = np.minimum(low, x), np.maximum(high, x)
+        limit = high - x if sign > 0 else x - low  # 이 방향으로 갈 수 있는 최대 거리
+        offsets = self.spans[field] * np.arange(1, self.steps + 1) / self.steps
+
+        distance = np.full(size, np.inf)
+        flipped = np.full(size, -1, dtype=np.int8)
+        inside = np.zeros(size)  # 행동이 그대로인 가장 먼 거리
+        outside = np.full(size, np.nan)  # 행동이 바뀐 가장 가까운 거리
+
+        # 1. 격자 훑기 - 여러 칸을 한 번의 호출로 (찾은 기업은 다음 칸부터 제외)
+        pending = np.flatnonzero(limit > 0)
+        per_call = max(1, self.chunk_size // max(1, size))
+        previous = np.zeros(size)
+        for first in range(0, self.steps, per_call):
+            if len(pending) == 0:
+                break
+            block = offsets[first:first + per_call]
+            steps_here = np.minimum(block[:, None], limit[pending][None, :])  # (칸, 기업)
+            rows = np.tile(pending, len(block))
+            actions = self._evaluate(brain, prepared, columns, rows, field, x[rows] + sign * steps_here.ravel())
+            changed = (actions != base[rows]).reshape(len(block), len(pending))
+
+            hit = changed.any(axis=0)
+            first_hit = changed.argmax(axis=0)
+            hit_rows = pending[hit]
+            hit_step = first_hit[hit]
+            outside[hit_rows] = steps_here[hit_step, np.flatnonzero(hit)]
+            inside[hit_rows] = np.where(
+                hit_step > 0, steps_here[np.maximum(hit_step - 1, 0), np.flatnonzero(hit)], previous[hit_rows]
+            )
+            previous[pending] = steps_here[-1]
+            # 경계에 닿았거나 전환을 찾은 기업은 제외
+            pending = pending[~hit & (steps_here[-1] < limit[pending])]
+
+        # 2. 이분 탐색 - 전환 구간을 tolerance 안으로
+        found = np.flatnonzero(~np.isnan(outside))
+        while len(found):
+            wide = found[outside[found] - inside[found] > self.tolerance]
+            if len(wide) == 0:
+                break
+            middle = (inside[wide] + outside[wide]) / 2
+            changed = self._evaluate(brain, prepared, columns, wide, field, x[wide] + sign * middle) != base[wide]
+            outside[wide[changed]] = middle[changed]
+            inside[wide[~changed]] = middle[~changed]
+            found = wide
+
+        found = np.flatnonzero(~np.isnan(outside))
+        if len(found):
+            distance[found] = outside[found]
+            flipped[found] = encode_actions(
+                self._evaluate(brain, prepared, columns, found, field, x[found] + sign * outside[found])
+            )
+        return distance, flipped
@@ -0,0 +1,258 @@
+#!/usr/bin/env python3
+"""
+🔁 워크포워드 학습 시뮬레이션
+과거 날짜를 따라 걸으며 거장 뇌의 결정 -> 실현 수익률 -> 학습 루프를 대량으로 재현
+"""
+
+import os
+import pickle
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .investor_brain import InvestorBrain, MarketContext, MarketPhase, company_columns
+
+def market_context_from_prices(matrix: np.ndarray, row: int, lookback: int = 252) -> MarketContext:
+    """동일가중 지수의 과거 lookback일로 시장 상황 추정 (row일 종가까지만 사용)"""
+    window = matrix[max(0, row - lookback):row + 1]
+    with np.errstate(invalid='ignore', divide='ignore'):
+        index = np.nanmean(window / window[0], axis=1)
+        daily = index[1:] / index[:-1] - 1
+    trailing = float(index[-1] - 1) if len(index) else 0.0
+    volatility = float(np.nanstd(daily) * np.sqrt(252)) if len(daily) > 1 else 0.0
+    low, high = float(np.nanmin(index)), float(np.nanmax(index))
+
+    if trailing > 0.1:
+        phase = MarketPhase.BULL_MARKET
+    elif trailing < -0.1:
+        phase = MarketPhase.BEAR_MARKET
+    elif volatility > 0.3:
+        phase = MarketPhase.UNCERTAIN
+    else:
+        phase = MarketPhase.TRANSITION
+
+    return MarketContext(
+        phase=phase,
+        volatility=float(np.clip(volatility / 0.5, 0, 1)),
+        sentiment_score=float(np.clip(trailing / 0.3, -1, 1)),
+        valuation_level=(float(index[-1]) - low) / (high - low) if high > low else 0.5,
+        key_themes=[],
+        risk_factors=[]
+    )
+
+@dataclass
+class PendingOutcome:
+    """아직 실현되지 않은 결정 묶음 (realize_row일에 학습)"""
+    decision_row: int
+    realize_row: int
+    decision_date: str
+    investor_id: str
+    tickers: np.ndarray
+    price_cols: np.ndarray  # 가격 행렬의 열 번호
+    entry: np.ndarray  # decision_row일 종가
+    actions: np.ndarray
+    confidences: np.ndarray
+    phase: str
+
+@dataclass
+class SimulationState:
+    """체크포인트로 저장되는 시뮬레이션 상태"""
+    cursor: int  # 다음 결정 행
+    brains: Dict[str, InvestorBrain]
+    pending: List[PendingOutcome] = field(default_factory=list)
+    history: List[Dict] = field(default_factory=list)  # 보정 추이 기록
+    pairs: int = 0  # 학습한 결정/결과 쌍 수
+    knowledge_graph: object = None
+    learning_history: object = None
+    store_marks: Optional[Dict[str, int]] = None  # 체크포인트 시점 학습 DB의 테이블별 마지막 행 id
+
+class WalkForwardSimulation:
+    """워크포워드 학습 시뮬레이터
+
+    step 거래일마다 모든 뇌가 종목 전체를 일괄 분석하고(analyze_companies), 각 결정의
+    horizon 거래일 뒤 수익률은 그 날짜가 되었을 때에야 학습에 반영한다 (미래 정보 누수 없음).
+    결정 대상은 결정일에 가격이 있는 종목 전체이며, horizon 전에 가격이 끊긴 종목(상장폐지,
+    거래정지)은 마지막 거래 가격으로 수익률을 실현한다 (생존 편향 없음).
+    결과는 InvestorBrain.learn_from_outcomes와 (주어지면) ContinuousLearningSystem.learn_from_outcomes
+    두 경로 모두에 넣고, 투자자별 보정값 추이를 기록한다. checkpoint_path를 주면
+    checkpoint_every 스텝마다 상태를 원자적으로 저장하고, 다음 실행에서 이어서 진행한다.
+    재개할 때는 체크포인트 뒤에 학습 DB에 기록된 행을 지워, 다시 실행하는 스텝의 행이
+    중복되지 않게 한다.
+    """
+
+    def __init__(self, brains: Dict[str, InvestorBrain], universe, prices: pd.DataFrame,
+                 horizon: int = 21, step: int = 21, lookback: int = 252,
+                 context_fn: Optional[Callable[[pd.Timestamp, np.ndarray, int], MarketContext]] = None,
+                 learning_system=None, checkpoint_path: Optional[str] = None, checkpoint_every: int = 50):
+        self.brains = brains
+        self.prices = prices.sort_index()
+        self.matrix = self.prices.to_numpy(dtype=float)
+        self.dates = self.prices.index
+        self.horizon = horizon
+        self.step = step
+        self.lookback = lookback
+        self.context_fn = context_fn or (lambda date, matrix, row: market_context_from_prices(matrix, row, lookback))
+        self.learning_system = learning_system
+        self.checkpoint_path = checkpoint_path
+        self.checkpoint_every = checkpoint_every
+
+        # 가격이 있는 종목만 사용 (universe는 정적 기업 표 또는 날짜 -> 기업 표 함수)
+        self.universe = universe
+        self._static_columns = None if callable(universe) else self._align(company_columns(universe))
+
+    def _align(self, columns: Dict[str, np.ndarray]):
+        """기업 열을 가격 열 순서에 맞추고 (기업 열, 가격 열 번호) 반환"""
+        position = {ticker: i for i, ticker in enumerate(self.prices.columns)}
+        cols = np.array([position.get(t, -1) for t in columns['ticker']], dtype=np.int64)
+        keep = cols >= 0
+        return {name: values[keep] for name, values in columns.items()}, cols[keep]
+
+    def _columns_at(self, date):
+        if self._static_columns is not None:
+            return self._static_columns
+        return self._align(company_columns(self.universe(date)))
+
+    def initial_state(self) -> SimulationState:
+        return SimulationState(cursor=self.lookback, brains=self.brains)
+
+    def load_checkpoint(self) -> Optional[SimulationState]:
+        if not self.checkpoint_path or not os.path.exists(self.checkpoint_path):
+            return None
+        with open(self.checkpoint_path, 'rb') as f:
+            return pickle.load(f)
+
+    def save_checkpoint(self, state: SimulationState) -> None:
+        """임시 파일에 쓰고 교체 (중간에 죽어도 이전 체크포인트 유지)"""
+        if not self.checkpoint_path:
+            return
+        if self.learning_system is not None:
+            # 학습 시스템의 DB 버퍼를 먼저 내리고, 그 시점의 마지막 행 id를 체크포인트와 맞춘다
+            state.store_marks = self.learning_system.store.high_water()
+            state.knowledge_graph = self.learning_system.knowledge_graph
+            state.learning_history = self.learning_system.learning_history
+        tmp_path = f"{self.checkpoint_path}.tmp"
+        with open(tmp_path, 'wb') as f:
+            pickle.dump(state, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, self.checkpoint_path)
+
+    def _exit_prices(self, pending: PendingOutcome) -> Tuple[np.ndarray, np.ndarray]:
+        """realize_row일 종가와 가격이 끊긴 종목 마스크
+
+        realize_row일 가격이 없는 종목은 결정일 이후 마지막 거래 가격으로 청산한다.
+        """
+        window = self.matrix[pending.decision_row:pending.realize_row + 1, pending.price_cols]
+        exit_prices = window[-1].copy()
+        missing = np.isnan(exit_prices)
+        if missing.any():
+            valid = ~np.isnan(window[:, missing])
+            last = window.shape[0] - 1 - np.argmax(valid[::-1], axis=0)
+            exit_prices[missing] = window[last, np.flatnonzero(missing)]
+        return exit_prices, missing
+
+    def _realize(self, state: SimulationState, row: int) -> None:
+        """row일까지 실현된 결과를 두 학습 경로에 반영"""
+        ready = [p for p in state.pending if p.realize_row <= row]
+        if not ready:
+            return
+        state.pending = [p for p in state.pending if p.realize_row > row]
+
+        for pending in ready:
+            exit_prices, delisted = self._exit_prices(pending)
+            outcomes = exit_prices / pending.entry - 1
+
+            brain = state.brains[pending.investor_id]
+            before = brain.confidence_calibration
+            quality = brain.learn_from_outcomes(pending.actions, pending.confidences, outcomes)
+
+            if self.learning_system is not None:
+                contexts = [{'mentioned_companies': [ticker], 'market_phase': pending.phase,
+                             'decision_date': pending.decision_date} for ticker in pending.tickers.tolist()]
+                self.learning_system.learn_from_outcomes(
+                    pending.investor_id, pending.actions, outcomes, contexts)
+
+            directional = pending.actions != 'hold'
+            state.pairs += len(pending.actions)
+            state.history.append({
+                'date': str(self.dates[pending.realize_row].date()),
+                'decision_date': pending.decision_date,
+                'investor': pending.investor_id,
+                'decisions': len(pending.actions),
+                'delisted': int(delisted.sum()),
+                'buy_share': float(np.mean(pending.actions == 'buy')),
+                'mean_confidence': float(np.mean(pending.confidences)),
+                'mean_quality': float(np.mean(quality)),
+                'hit_rate': float(np.mean(quality[directional] > 0.7)) if directional.any() else np.nan,
+                'calibration_before': before,
+                'calibration_after': brain.confidence_calibration
+            })
+
+    def _decide(self, state: SimulationState, row: int) -> None:
+        """row일에 모든 뇌의 일괄 결정 (결과는 row + horizon일에 실현)"""
+        date = self.dates[row]
+        columns, cols = self._columns_at(date)
+        if len(cols) == 0:
+            return
+
+        # 결정일 가격만으로 대상 선정 (미래 가격 유무로 거르면 생존 편향)
+        entry = self.matrix[row, cols]
+        priced = ~np.isnan(entry)
+        if not priced.any():
+            return
+        columns = {name: values[priced] for name, values in columns.items()}
+        cols, entry = cols[priced], entry[priced]
+
+        context = self.context_fn(date, self.matrix, row)
+        for investor_id, brain in state.brains.items():
+            batch = brain.analyze_companies(columns, context)
+            state.pending.append(PendingOutcome(
+                decision_row=row,
+                realize_row=row + self.horizon,
+                decision_date=str(date.date()),
+                investor_id=investor_id,
+                tickers=columns['ticker'],
+                price_cols=cols,
+                entry=entry,
+                actions=batch.actions,
+                confidences=batch.confidences,
+                phase=context.phase.value
+            ))
+
+    def run(self, resume: bool = True, max_steps: Optional[int] = None) -> pd.DataFrame:
+        """시뮬레이션 실행 (resume이면 체크포인트에서 이어서), 보정 추이 표 반환"""
+        state = self.load_checkpoint() if resume else None
+        if state is None:
+            state = self.initial_state()
+        elif self.learning_system is not None and state.knowledge_graph is not None:
+            self.learning_system.knowledge_graph = state.knowledge_graph
+            self.learning_system.learning_history = state.learning_history
+            if state.store_marks is not None:
+                # 체크포인트 뒤에 기록된 행은 아래에서 다시 기록된다
+                self.learning_system.store.rollback_to(state.store_marks)
+        self.brains = state.brains
+
+        started = time.perf_counter()
+        steps = 0
+        last_row = len(self.dates) - 1
+        while state.cursor + self.horizon <= last_row:
+            if max_steps is not None and steps >= max_steps:
+                break
+            self._realize(state, state.cursor)
+            self._decide(state, state.cursor)
+            state.cursor += self.step
+            steps += 1
+            if self.checkpoint_path and steps % self.checkpoint_every == 0:
+                self.save_checkpoint(state)
+
+        if state.cursor + self.horizon > last_row:
+            # 남은 결정은 모두 데이터 안에서 실현된다
+            self._realize(state, last_row)
+        if self.learning_system is not None:
+            self.learning_system.flush()
+        self.save_checkpoint(state)
+
+        self.state = state
+        self.elapsed = time.perf_counter() - started
+        return pd.DataFrame(state.history)
@@ -0,0 +1,220 @@
+#!/usr/bin/env python3
+"""
+🌐 Company Universe - 열 기반 기업 유니버스
+"객체 만 개 대신 배열 몇 개" - 수치 필드는 연속 float 배열, 섹터/성장 단계는 범주 코드
+"""
+
+from typing import Dict, Iterator, List, Optional, Sequence
+
+import numpy as np
+
+from .investor_brain import COMPANY_NUMERIC_FIELDS, Company, _has_field
+
+CATEGORICAL_FIELDS = ('sector', 'growth_stage')
+LABEL_FIELDS = ('ticker', 'name')
+
+# 입력에 없을 때 쓰는 기본값 (backend CompanyInput과 같음)
+FIELD_DEFAULTS = {'business_complexity': 0.5, 'moat_strength': 0.5, 'growth_stage': 'mature', 'ticker': '', 'name': ''}
+
+def encode_categories(values: Sequence, categories: Optional[np.ndarray] = None):
+    """문자열 열 -> (코드 배열, 범주 배열)"""
+    values = np.asarray(values, dtype=object).astype(str)
+    if categories is None:
+        categories, codes = np.unique(values, return_inverse=True)
+    elif len(categories) == 0:
+        categories = np.asarray(categories, dtype=str)
+        if len(values):
+            raise ValueError(f"Unknown categories: {sorted(set(values))[:5]}")
+        codes = np.zeros(0, dtype=np.int64)
+    else:
+        categories = np.asarray(categories, dtype=str)
+        order = np.argsort(categories)
+        positions = np.searchsorted(categories, values, sorter=order)
+        positions = np.minimum(positions, len(categories) - 1)
+        codes = order[positions]
+        unknown = categories[codes] != values
+        if unknown.any():
+            raise ValueError(f"Unknown categories: {sorted(set(values[unknown]))[:5]}")
+    dtype = np.int16 if len(categories) < np.iinfo(np.int16).max else np.int32
+    return codes.reshape(-1).astype(dtype), categories
+
+class CompanyView:
+    """유니버스의 한 행 (복사 없이 Company처럼 읽기)"""
+
+    __slots__ = ('_universe', '_index')
+
+    def __init__(self, universe: 'CompanyUniverse', index: int):
+        self._universe = universe
+        self._index = index
+
+    def to_company(self) -> Company:
+        return Company(**{field: getattr(self, field) for field in Company.__dataclass_fields__})
+
+    def __repr__(self) -> str:
+        return f"CompanyView({self.ticker!r}, sector={self.sector!r})"
+
+def _numeric_property(field: str):
+    return property(lambda self: float(getattr(self._universe, field)[self._index]))
+
+def _label_property(field: str):
+    return property(lambda self: getattr(self._universe, field)[self._index])
+
+def _category_property(field: str):
+    def get(self):
+        universe = self._universe
+        return str(getattr(universe, f'{field}_categories')[getattr(universe, f'{field}_codes')[self._index]])
+    return property(get)
+
+for _field in COMPANY_NUMERIC_FIELDS:
+    setattr(CompanyView, _field, _numeric_property(_field))
+for _field in LABEL_FIELDS:
+    setattr(CompanyView, _field, _label_property(_field))
+for _field in CATEGORICAL_FIELDS:
+    setattr(CompanyView, _field, _category_property(_field))
+
+class CompanyUniverse:
+    """열 기반 기업 유니버스
+
+    수치 필드는 float64 연속 배열, ticker/name은 object 배열, sector/growth_stage는
+    정수 코드 + 범주 배열로 보관한다. 정수 인덱싱은 복사 없는 CompanyView를,
+    슬라이스는 배열 뷰를 공유하는 하위 유니버스를, 불리언/정수 배열은 선택한 행의
+    하위 유니버스를 돌려준다. company_columns()가 그대로 받으므로 뇌의
+    analyze_companies에 바로 넘길 수 있다.
+    """
+
+    def __init__(self, columns: Dict[str, np.ndarray], sector_categories: np.ndarray,
+                 growth_stage_categories: np.ndarray):
+        for field in COMPANY_NUMERIC_FIELDS:
+            setattr(self, field, np.ascontiguousarray(columns[field], dtype=float))
+        for field in LABEL_FIELDS:
+            setattr(self, field, np.asarray(columns[field], dtype=object))
+        self.sector_codes = np.asarray(columns['sector_codes'])
+        self.growth_stage_codes = np.asarray(columns['growth_stage_codes'])
+        self.sector_categories = sector_categories
+        self.growth_stage_categories = growth_stage_categories
+
+        sizes = {len(getattr(self, field)) for field in COMPANY_NUMERIC_FIELDS + LABEL_FIELDS}
+        sizes |= {len(self.sector_codes), len(self.growth_stage_codes)}
+        if len(sizes) > 1:
+            raise ValueError(f"Column lengths differ: {sorted(sizes)}")
+
+    # ---------- 생성 ----------
+
+    @classmethod
+    def from_columns(cls, frame) -> 'CompanyUniverse':
+        """DataFrame / structured array / 열 사전에서 생성 (없는 선택 필드는 기본값)"""
+        size = len(np.asarray(frame['pe_ratio']))
+        columns = {}
+        for field in COMPANY_NUMERIC_FIELDS + LABEL_FIELDS:
+            if _has_field(frame, field):
+                columns[field] = np.asarray(frame[field])
+            elif field in FIELD_DEFAULTS:
+                columns[field] = np.full(size, FIELD_DEFAULTS[field], dtype=object if field in LABEL_FIELDS else float)
+            else:
+                raise KeyError(f"Missing company field: {field}")
+
+        categories = {}
+        for field in CATEGORICAL_FIELDS:
+            if _has_field(frame, field):
+                values = np.asarray(frame[field])
+            elif field in FIELD_DEFAULTS:
+                values = np.full(size, FIELD_DEFAULTS[field], dtype=object)
+            else:
+                raise KeyError(f"Missing company field: {field}")
+            columns[f'{field}_codes'], categories[field] = encode_categories(values)
+
+        return cls(columns, categories['sector'], categories['growth_stage'])
+
+    @classmethod
+    def from_companies(cls, companies: Sequence[Company]) -> 'CompanyUniverse':
+        """Company 리스트에서 생성"""
+        return cls.from_columns({
+            field: [getattr(company, field) for company in companies]
+            for field in Company.__dataclass_fields__
+        })
+
+    @classmethod
+    def from_csv(cls, path: str, **read_options) -> 'CompanyUniverse':
+        import pandas as pd
+        return cls.from_columns(pd.read_csv(path, **read_options))
+
+    @classmethod
+    def from_parquet(cls, path: str, **read_options) -> 'CompanyUniverse':
+        import pandas as pd
+        return cls.from_columns(pd.read_parquet(path, **read_options))
+
+    @classmethod
+    def load(cls, path: str) -> 'CompanyUniverse':
+        """확장자에 따라 CSV/Parquet 로드"""
+        if str(path).lower().endswith('.parquet'):
+            return cls.from_parquet(path)
+        return cls.from_csv(path)
+
+    # ---------- 조회 ----------
+
+    def __len__(self) -> int:
+        return len(self.pe_ratio)
+
+    def __iter__(self) -> Iterator[CompanyView]:
+        for index in range(len(self)):
+            yield CompanyView(self, index)
+
+    def __getitem__(self, key):
+        if isinstance(key, (int, np.integer)):
+            index = int(key)
+            if index < 0:
+                index += len(self)
+            if not 0 <= index < len(self):
+                raise IndexError("universe index out of range")
+            return CompanyView(self, index)
+        return self.take(key)
+
+    def take(self, key) -> 'CompanyUniverse':
+        """슬라이스(뷰 공유) 또는 불리언/정수 인덱스(복사)로 하위 유니버스"""
+        columns = {field: getattr(self, field)[key] for field in COMPANY_NUMERIC_FIELDS + LABEL_FIELDS}
+        columns['sector_codes'] = self.sector_codes[key]
+        columns['growth_stage_codes'] = self.growth_stage_codes[key]
+        return CompanyUniverse(columns, self.sector_categories, self.growth_stage_categories)
+
+    def filter(self, mask: np.ndarray) -> 'CompanyUniverse':
+        """불리언 마스크로 행 선택"""
+        return self.take(np.asarray(mask, dtype=bool))
+
+    def is_sector(self, *sectors: str) -> np.ndarray:
+        """섹터 일치 마스크 (코드 비교라 문자열 비교 없음)"""
+        codes = np.flatnonzero(np.isin(self.sector_categories, sectors))
+        return np.isin(self.sector_codes, codes)
+
+    @property
+    def sector(self) -> np.ndarray:
+        return self.sector_categories[self.sector_codes]
+
+    @property
+    def growth_stage(self) -> np.ndarray:
+        return self.growth_stage_categories[self.growth_stage_codes]
+
+    def company_columns(self) -> Dict[str, np.ndarray]:
+        """뇌 일괄 분석용 열 사전 (company_columns가 호출)
+
+        범주 열은 고정 폭 문자열('U') 배열로 넘긴다. object 배열로 바꾸면 뇌마다
+        map_categories의 np.unique가 파이썬 객체 비교로 다시 돌아 범주 인코딩 이점이 사라진다.
+        """
+        columns = {field: getattr(self, field) for field in COMPANY_NUMERIC_FIELDS}
+        for field in LABEL_FIELDS:
+            columns[field] = getattr(self, field)
+        for field in CATEGORICAL_FIELDS:
+            columns[field] = getattr(self, field)
+        return columns
+
+    def to_companies(self) -> List[Company]:
+        return [view.to_company() for view in self]
+
+    @property
+    def nbytes(self) -> int:
+        """배열 메모리 (object 배열은 참조 크기만)"""
+        arrays = [getattr(self, field) for field in COMPANY_NUMERIC_FIELDS + LABEL_FIELDS]
+        arrays += [self.sector_codes, self.growth_stage_codes, self.sector_categories, self.growth_stage_categories]
+        return sum(array.nbytes for array in arrays)
+
+    def __repr__(self) -> str:
+        return f"CompanyUniverse({len(self)} companies, {len(self.sector_categories)} sectors)"
@@ -6,42 +6,39 @@
 2025년 12월 현재: 나스닥 역대급 상승, AI 열풍, 경기 둔화 우려
 """
 
-import yfinance as yf
+import sys
 import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from market_data import MarketDataProvider, SnapshotEngine, create_market_data
 
 class CurrentMarketWisdom:
     """현재 시장 상황에서 거장들의 진짜 생각을 시뮬레이션"""
 
-    def __init__(self):
+    def __init__(self, data_provider: MarketDataProvider = None):
         self.current_date = datetime.now()
+        self.data_provider = data_provider or create_market_data()
+        self.snapshot_engine = SnapshotEngine(self.data_provider, max_workers=4, timeout=15.0)
+        self.snapshot_failures = {}
         self.market_data = self.get_market_snapshot()
         self.context = self.analyze_market_context()
 
     def get_market_snapshot(self):
         """현재 시장 스냅샷"""
         indices = {
-            'nasdaq': yf.Ticker("^IXIC"),
-            'snp500': yf.Ticker("^GSPC"),
-            'vix': yf.Ticker("^VIX"),
-            'dxy': yf.Ticker("DX-Y.NYB")  # 달러 인덱스
+            'nasdaq': "^IXIC",
+            'snp500': "^GSPC",
+            'vix': "^VIX",
+            'dxy': "DX-Y.NYB"  # 달러 인덱스
         }
 
-        snapshot = {}
-        for name, ticker in indices.items():
-            hist = ticker.history(period="1y")
-            if len(hist) > 0:
-                current = hist['Close'].iloc[-1]
-                year_ago = hist['Close'].iloc[0]
-                ytd_return = (current / hist['Close'].iloc[252] - 1) * 100 if len(hist) > 252 else 0
-                snapshot[name] = {
-                    'current': current,
-                    'year_change': (current / year_ago - 1) * 100,
-                    'ytd_change': ytd_return
-                }
-
-        return snapshot
+        # 네 지수를 병렬 조회, 실패한 지수는 빼고 계산
+        snapshot = self.snapshot_engine.fetch(indices)
+        self.snapshot_failures = snapshot.failures
+        return snapshot.as_dict()
 
     def analyze_market_context(self):
         """현재 시장 컨텍스트 분석"""
@@ -102,7 +99,7 @@ class CurrentMarketWisdom:
             print(f"   \"Apple을 더 사려면 최소 20% 하락을 기다려야 해.\"")
             print(f"   \"물론 팔 생각은 없어. 최고의 기업이니까.\"")
 
-    def peter_ynch_current_thinking(self):
+    def peter_lynch_current_thinking(self):
         """피터 린치가 현재 상황에서 무슨 생각을 할까?"""
         print(f"\n📈 피터 린치의 현재 시장 생각")
         print("=" * 60)
@@ -267,7 +264,7 @@ def main():
 
     # 각 거장의 현재 생각
     wisdom.warren_buffett_current_thinking()
-    wisdom.peter_ynch_current_thinking()
+    wisdom.peter_lynch_current_thinking()
     wisdom.howard_marks_current_thinking()
     wisdom.charlie_munger_current_thinking()
     wisdom.ray_dalio_current_thinking()
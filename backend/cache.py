@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+🗃️ 분석 결과 캐시
+같은 종목/펀더멘털/시장 상황 요청은 거장 뇌를 다시 돌리지 않는다
+"""
+
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+class AnalysisCache:
+    """LRU + TTL 분석 결과 캐시
+
+    키는 요청(기업, 시장 상황, 투자자 목록)의 정규화 해시이며, quantum을 주면
+    실수 값을 그 단위로 양자화해 미세한 차이의 요청도 같은 키로 묶는다.
+    값은 저장 시점의 뇌 보정 버전과 함께 보관되고, 버전이 바뀌면 전부 무효화된다.
+    """
+
+    def __init__(self, max_entries: int = 1024, ttl_seconds: float = 60.0,
+                 quantum: Optional[float] = None, clock=time.monotonic):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.quantum = quantum
+        self._clock = clock
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()  # key -> (expires_at, value)
+        self._version: Optional[int] = None
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_entries > 0
+
+    def _canonical(self, value: Any) -> Any:
+        """해시용 정규화 (실수 양자화, 사전 키 정렬)"""
+        if isinstance(value, bool) or value is None or isinstance(value, str):
+            return value
+        if isinstance(value, (int, float)):
+            if self.quantum:
+                return round(value / self.quantum)
+            return float(value)
+        if isinstance(value, dict):
+            return {key: self._canonical(item) for key, item in value.items()}
+        if isinstance(value, (list, tuple)):
+            return [self._canonical(item) for item in value]
+        return str(value)
+
+    def make_key(self, company: Dict, context: Optional[Dict], investors: list) -> str:
+        """요청의 정규화 해시 키 생성"""
+        if context is not None:
+            # 테마/위험 요소는 순서와 무관
+            context = dict(context)
+            context['key_themes'] = sorted(context.get('key_themes', []))
+            context['risk_factors'] = sorted(context.get('risk_factors', []))
+
+        canonical = self._canonical({'company': company, 'context': context, 'investors': list(investors)})
+        payload = json.dumps(canonical, sort_keys=True, separators=(',', ':'), ensure_ascii=False)
+        return hashlib.blake2b(payload.encode('utf-8'), digest_size=16).hexdigest()
+
+    def _sync_version(self, version: int) -> None:
+        """뇌 보정 버전이 바뀌었으면 전체 무효화 (잠금 안에서 호출)"""
+        if version != self._version:
+            self.invalidations += len(self._entries)
+            self._entries.clear()
+            self._version = version
+
+    def get(self, key: str, version: int) -> Optional[Any]:
+        """캐시 조회 (없거나 만료/무효화되면 None)"""
+        if not self.enabled:
+            return None
+
+        with self._lock:
+            self._sync_version(version)
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+
+            expires_at, value = entry
+            if expires_at <= self._clock():
+                del self._entries[key]
+                self.expirations += 1
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key: str, value: Any, version: int) -> None:
+        """캐시 저장 (version은 값을 계산할 때 사용한 뇌 보정 버전)"""
+        if not self.enabled:
+            return
+
+        with self._lock:
+            self._sync_version(max(version, self._version or 0))
+            if version != self._version:
+                # 계산 중에 학습이 일어난 결과는 저장하지 않음
+                return
+
+            self._entries[key] = (self._clock() + self.ttl_seconds, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """캐시 카운터"""
+        lookups = self.hits + self.misses
+        return {
+            'enabled': self.enabled,
+            'size': len(self._entries),
+            'max_entries': self.max_entries,
+            'ttl_seconds': self.ttl_seconds,
+            'quantum': self.quantum,
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+            'evictions': self.evictions,
+            'expirations': self.expirations,
+            'invalidations': self.invalidations
+        }
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+📚 거장 데이터 저장소
+data/investors/*.json을 서버 시작 시 한 번 읽어 직렬화된 바이트로 메모리에 보관
+"""
+
+import gzip
+import hashlib
+import json
+import re
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional
+
+# 파일명으로 쓸 수 있는 투자자 ID만 허용 (경로 조작 방지)
+INVESTOR_ID_PATTERN = re.compile(r'^[A-Za-z0-9_\-]+$')
+
+@dataclass(frozen=True)
+class InvestorDocument:
+    """직렬화된 거장 데이터 (불변)"""
+    investor_id: str
+    body: bytes  # JSON 바이트
+    gzip_body: bytes  # gzip 압축본
+    etag: str
+    mtime_ns: int
+
+class InvestorDataStore:
+    """메모리 상주 거장 데이터 저장소
+
+    문서 사전은 통째로 교체(copy-on-write)되므로 읽기는 잠금이 필요 없다.
+    조회 시 파일 mtime을 check_interval 초에 한 번만 확인하고, 바뀐 파일만 다시 읽는다.
+    """
+
+    def __init__(self, data_dir: Path, check_interval: float = 1.0, clock=time.monotonic):
+        self.data_dir = Path(data_dir)
+        self.check_interval = check_interval
+        self._clock = clock
+        self._documents: Dict[str, InvestorDocument] = {}
+        self._checked_at: Dict[str, float] = {}
+        self._lock = threading.Lock()
+        self._loaded = False
+
+    def _path(self, investor_id: str) -> Path:
+        return self.data_dir / f"{investor_id}.json"
+
+    def _read(self, investor_id: str, path: Path) -> InvestorDocument:
+        """JSON 파일 하나를 읽어 응답용 바이트로 직렬화"""
+        mtime_ns = path.stat().st_mtime_ns
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+
+        body = json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        return InvestorDocument(
+            investor_id=investor_id,
+            body=body,
+            gzip_body=gzip.compress(body, mtime=0),
+            etag=f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"',
+            mtime_ns=mtime_ns
+        )
+
+    def _publish(self, investor_id: str, document: Optional[InvestorDocument]) -> None:
+        """문서 하나만 교체한 새 사전을 공개"""
+        with self._lock:
+            documents = dict(self._documents)
+            if document is None:
+                documents.pop(investor_id, None)
+            else:
+                documents[investor_id] = document
+            self._documents = documents
+
+    def load_all(self) -> None:
+        """디렉터리의 모든 거장 JSON 로드 (서버 시작 시)"""
+        documents = {}
+        if self.data_dir.is_dir():
+            for path in sorted(self.data_dir.glob("*.json")):
+                documents[path.stem] = self._read(path.stem, path)
+
+        now = self._clock()
+        with self._lock:
+            self._documents = documents
+            self._checked_at = {investor_id: now for investor_id in documents}
+            self._loaded = True
+
+    def _refresh(self, investor_id: str) -> None:
+        """파일 mtime이 바뀌었으면 그 파일만 다시 로드
+
+        확인 시각은 파일이 있는 ID만 기록한다. 없는 ID까지 기록하면 임의 ID 요청마다
+        항목이 쌓여 메모리가 끝없이 는다.
+        """
+        path = self._path(investor_id)
+        current = self._documents.get(investor_id)
+
+        try:
+            mtime_ns = path.stat().st_mtime_ns
+        except FileNotFoundError:
+            self._checked_at.pop(investor_id, None)
+            if current is not None:
+                self._publish(investor_id, None)
+            return
+
+        self._checked_at[investor_id] = self._clock()
+
+        if current is None or current.mtime_ns != mtime_ns:
+            self._publish(investor_id, self._read(investor_id, path))
+
+    def get(self, investor_id: str) -> Optional[InvestorDocument]:
+        """거장 문서 조회 (없으면 None)"""
+        if not INVESTOR_ID_PATTERN.match(investor_id):
+            return None
+        if not self._loaded:
+            self.load_all()
+
+        checked_at = self._checked_at.get(investor_id)
+        if checked_at is None or self._clock() - checked_at >= self.check_interval:
+            self._refresh(investor_id)
+
+        return self._documents.get(investor_id)
+
+    def ids(self) -> List[str]:
+        return list(self._documents)
@@ -6,16 +6,23 @@ Railway 배포용 API 서버
 
 import os
 import sys
+import asyncio
+import logging
+import time
+from contextlib import asynccontextmanager
+from concurrent.futures import Executor, ThreadPoolExecutor, ProcessPoolExecutor
 from pathlib import Path
 
 # advanced_ai 모듈 경로 추가
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
-from typing import List, Optional, Dict
+from typing import List, Optional, Dict, Tuple
 import json
+import numpy as np
 from dotenv import load_dotenv
 
 # 환경 변수 로드
@@ -24,16 +31,86 @@ load_dotenv()
 # AI 엔진 import
 from advanced_ai.investor_brain import (
     create_investor_brain,
+    get_brain_spec,
+    registered_brains,
+    resolve_investor_id,
+    InvestorBrain,
     Company,
     MarketContext,
     MarketPhase,
     InvestorDecision
 )
+from advanced_ai.brain_registry import BrainRegistry
+from backend.cache import AnalysisCache
+from backend.investor_store import InvestorDataStore
+from backend.metrics import MetricsRegistry
+
+logger = logging.getLogger("stockoracle")
+
+# 기본 분석 대상 거장 (등록된 뇌의 정규 ID)
+DEFAULT_INVESTORS = [spec.investor_id for spec in registered_brains()]
+
+# 거장별 분석 실행기 설정
+ANALYSIS_EXECUTOR = os.getenv("ANALYSIS_EXECUTOR", "thread")  # thread, process
+ANALYSIS_MAX_WORKERS = int(os.getenv("ANALYSIS_MAX_WORKERS", 4))
+ANALYSIS_INVESTOR_TIMEOUT = float(os.getenv("ANALYSIS_INVESTOR_TIMEOUT", 2.0))  # 초
+STREAM_PREFETCH_TICKERS = int(os.getenv("STREAM_PREFETCH_TICKERS", 4))  # 스트리밍 시 미리 계산할 종목 수
+
+_analysis_executor: Optional[Executor] = None
+_analysis_slots: Optional[asyncio.Semaphore] = None  # 실행기의 빈 작업자 수
+
+# 지연 시간 계측 (/metrics), METRICS_LOG_REQUESTS=1 이면 /api/analyze 단계별 시간을 JSON 로그로도 남김
+METRICS_LOG_REQUESTS = os.getenv("METRICS_LOG_REQUESTS", "0").lower() in ("1", "true", "yes")
+metrics = MetricsRegistry()
+HTTP_REQUEST_SECONDS = metrics.histogram(
+    "stockoracle_http_request_duration_seconds", "HTTP request latency", ("method", "route", "status"))
+ANALYSIS_STAGE_SECONDS = metrics.histogram(
+    "stockoracle_analysis_stage_seconds", "Time spent per /api/analyze stage", ("stage",))
+INVESTOR_ANALYSIS_SECONDS = metrics.histogram(
+    "stockoracle_investor_analysis_seconds", "Time spent inside each brain's analysis", ("investor", "method"))
+INVESTORS_SKIPPED = metrics.counter(
+    "stockoracle_investors_skipped_total", "Investors dropped from a request", ("investor", "reason"))
+ANALYSIS_ERRORS = metrics.counter(
+    "stockoracle_analysis_errors_total", "Analysis requests that failed", ("endpoint",))
+metrics_logger = logging.getLogger("stockoracle.metrics")
+
+def get_analysis_executor() -> Executor:
+    """거장 분석용 실행기 (처음 사용할 때 생성)"""
+    global _analysis_executor
+    if _analysis_executor is None:
+        if ANALYSIS_EXECUTOR == "process":
+            _analysis_executor = ProcessPoolExecutor(max_workers=ANALYSIS_MAX_WORKERS)
+        else:
+            _analysis_executor = ThreadPoolExecutor(
+                max_workers=ANALYSIS_MAX_WORKERS,
+                thread_name_prefix="investor-brain"
+            )
+    return _analysis_executor
+
+def get_analysis_slots() -> asyncio.Semaphore:
+    """실행기 작업자 수만큼의 자리 (자리를 얻은 뒤 제출하면 큐에서 기다리지 않고 바로 시작)"""
+    global _analysis_slots
+    if _analysis_slots is None:
+        _analysis_slots = asyncio.Semaphore(ANALYSIS_MAX_WORKERS)
+    return _analysis_slots
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """서버 시작/종료 시 자원 관리"""
+    investor_store.load_all()
+    get_analysis_executor()
+    yield
+    global _analysis_executor, _analysis_slots
+    if _analysis_executor is not None:
+        _analysis_executor.shutdown(wait=False, cancel_futures=True)
+        _analysis_executor = None
+    _analysis_slots = None
 
 app = FastAPI(
     title="StockOracle API",
     description="🧠 거장 투자자들의 뇌를 시뮬레이션하는 AI API",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
 # CORS 설정
@@ -49,6 +126,39 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+@app.middleware("http")
+async def record_request_latency(request: Request, call_next):
+    """요청 전체 지연 시간 기록 (스트리밍 응답은 헤더를 보낼 때까지)"""
+    started = time.perf_counter()
+    request.state.started = started  # 핸들러가 본문 읽기/검증 시간을 계산하는 기준
+    status = 500
+    try:
+        response = await call_next(request)
+        status = response.status_code
+        return response
+    finally:
+        route = request.scope.get("route")
+        HTTP_REQUEST_SECONDS.observe(
+            time.perf_counter() - started,
+            request.method, route.path if route is not None else "unmatched", str(status)
+        )
+
+# 프로세스 전역 거장 뇌 레지스트리 (요청마다 뇌를 새로 만들지 않음)
+brain_registry = BrainRegistry(create_investor_brain)
+
+# /api/analyze 결과 캐시 (ANALYSIS_CACHE_SIZE=0 이면 비활성화)
+analysis_cache = AnalysisCache(
+    max_entries=int(os.getenv("ANALYSIS_CACHE_SIZE", 1024)),
+    ttl_seconds=float(os.getenv("ANALYSIS_CACHE_TTL", 60)),
+    quantum=float(os.getenv("ANALYSIS_CACHE_QUANTUM")) if os.getenv("ANALYSIS_CACHE_QUANTUM") else None
+)
+
+# 거장 데이터 저장소 (시작 시 전부 메모리에 로드, 바뀐 파일만 다시 읽음)
+investor_store = InvestorDataStore(
+    Path(__file__).parent.parent / "data" / "investors",
+    check_interval=float(os.getenv("INVESTOR_DATA_CHECK_INTERVAL", 1.0))
+)
+
 # ==================== Pydantic Models ====================
 
 class CompanyInput(BaseModel):
@@ -75,7 +185,12 @@ class MarketContextInput(BaseModel):
 class AnalysisRequest(BaseModel):
     company: CompanyInput
     context: Optional[MarketContextInput] = None
-    investors: List[str] = ["warren_buffett", "peter_lynch", "howard_marks", "george_soros"]
+    investors: List[str] = DEFAULT_INVESTORS
+
+class StreamAnalysisRequest(BaseModel):
+    companies: List[CompanyInput]
+    context: Optional[MarketContextInput] = None
+    investors: List[str] = DEFAULT_INVESTORS
 
 class InvestorDecisionResponse(BaseModel):
     investor: str
@@ -93,6 +208,60 @@ class AnalysisResponse(BaseModel):
     consensus: str
     consensus_confidence: float
 
+class OutcomeInput(BaseModel):
+    investor: str
+    action: str  # buy, sell, hold, avoid
+    confidence: float
+    actual_outcome: float  # 실제 수익률 (0.1 = +10%)
+
+class CalibrationResponse(BaseModel):
+    version: int
+    calibration: Dict[str, float]
+
+class CompanyColumnsInput(BaseModel):
+    """열(column) 단위 기업 목록 - 모든 리스트는 같은 길이"""
+    ticker: List[str]
+    name: List[str]
+    sector: List[str]
+    pe_ratio: List[float]
+    pb_ratio: List[float]
+    roe: List[float]
+    debt_equity: List[float]
+    revenue_growth: List[float]
+    business_complexity: Optional[List[float]] = None  # 기본값 0.5
+    moat_strength: Optional[List[float]] = None  # 기본값 0.5
+    growth_stage: Optional[List[str]] = None  # 기본값 "mature"
+
+class ScreenRequest(BaseModel):
+    companies: CompanyColumnsInput
+    context: Optional[MarketContextInput] = None
+    investors: List[str] = DEFAULT_INVESTORS
+    consensus: Optional[str] = None  # BUY, HOLD, AVOID 중 하나로 필터
+    top_n: Optional[int] = None
+    page: int = 1
+    page_size: int = 50
+
+class ScreenDecision(BaseModel):
+    investor: str
+    action: str
+    confidence: float
+
+class ScreenResult(BaseModel):
+    rank: int
+    ticker: str
+    company_name: str
+    consensus: str
+    consensus_score: float
+    consensus_confidence: float
+    decisions: List[ScreenDecision]
+
+class ScreenResponse(BaseModel):
+    total: int
+    page: int
+    page_size: int
+    investors: List[str]
+    results: List[ScreenResult]
+
 # ==================== Helper Functions ====================
 
 def get_market_phase(phase_str: str) -> MarketPhase:
@@ -106,22 +275,199 @@ def get_market_phase(phase_str: str) -> MarketPhase:
     return phase_map.get(phase_str.lower(), MarketPhase.UNCERTAIN)
 
 def get_investor_name(investor_type: str) -> str:
-    """투자자 타입을 이름으로 변환"""
-    name_map = {
-        "warren_buffett": "Warren Buffett",
-        "buffett": "Warren Buffett",
-        "peter_lynch": "Peter Lynch",
-        "lynch": "Peter Lynch",
-        "howard_marks": "Howard Marks",
-        "marks": "Howard Marks",
-        "george_soros": "George Soros",
-        "soros": "George Soros"
-    }
-    return name_map.get(investor_type.lower(), investor_type)
+    """투자자 타입(정규 ID 또는 별칭)을 이름으로 변환"""
+    spec = get_brain_spec(investor_type)
+    return spec.name if spec else investor_type
+
+def build_market_context(context_input: Optional[MarketContextInput]) -> MarketContext:
+    """요청의 시장 상황을 MarketContext로 변환 (없으면 기본 시장 상황)"""
+    if context_input:
+        return MarketContext(
+            phase=get_market_phase(context_input.phase),
+            volatility=context_input.volatility,
+            sentiment_score=context_input.sentiment_score,
+            valuation_level=context_input.valuation_level,
+            key_themes=context_input.key_themes,
+            risk_factors=context_input.risk_factors
+        )
+
+    # 기본 시장 상황
+    return MarketContext(
+        phase=MarketPhase.UNCERTAIN,
+        volatility=0.3,
+        sentiment_score=0.5,
+        valuation_level=0.5,
+        key_themes=["AI", "inflation"],
+        risk_factors=["geopolitical"]
+    )
+
+def build_company(company_input: CompanyInput) -> Company:
+    """요청의 기업 정보를 Company로 변환"""
+    return Company(
+        ticker=company_input.ticker,
+        name=company_input.name,
+        sector=company_input.sector,
+        pe_ratio=company_input.pe_ratio,
+        pb_ratio=company_input.pb_ratio,
+        roe=company_input.roe,
+        debt_equity=company_input.debt_equity,
+        revenue_growth=company_input.revenue_growth,
+        business_complexity=company_input.business_complexity,
+        moat_strength=company_input.moat_strength,
+        growth_stage=company_input.growth_stage
+    )
+
+def to_decision_response(investor_type: str, decision: InvestorDecision) -> InvestorDecisionResponse:
+    """InvestorDecision을 응답 모델로 변환"""
+    return InvestorDecisionResponse(
+        investor=get_investor_name(investor_type),
+        action=decision.action,
+        confidence=decision.confidence,
+        reasoning=decision.reasoning,
+        emotional_state=decision.emotional_state,
+        key_factors=decision.key_factors,
+        time_horizon=decision.time_horizon
+    )
+
+def analysis_cache_key(company_input: CompanyInput, context_input: Optional[MarketContextInput],
+                       investors: List[str]) -> str:
+    """단일 종목 분석 결과의 캐시 키"""
+    return analysis_cache.make_key(
+        company_input.model_dump(),
+        context_input.model_dump() if context_input else None,
+        investors
+    )
+
+def build_company_columns(companies: CompanyColumnsInput) -> Dict[str, np.ndarray]:
+    """열 단위 입력을 배치 분석용 배열로 변환"""
+    size = len(companies.ticker)
+    defaults = {"business_complexity": 0.5, "moat_strength": 0.5, "growth_stage": "mature"}
+
+    columns = {}
+    for field in CompanyColumnsInput.model_fields:
+        values = getattr(companies, field)
+        if values is None:
+            values = [defaults[field]] * size
+        if len(values) != size:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Column '{field}' has {len(values)} values, expected {size}"
+            )
+        is_text = field in ("ticker", "name", "sector", "growth_stage")
+        columns[field] = np.array(values, dtype=object if is_text else float)
+    return columns
+
+def timed_call(brain: InvestorBrain, method: str, *args) -> Tuple[object, float]:
+    """뇌 메서드 결과와 소요 시간 (프로세스 실행기에서도 쓰도록 모듈 함수)"""
+    started = time.perf_counter()
+    result = getattr(brain, method)(*args)
+    return result, time.perf_counter() - started
+
+async def observe_analysis(investor_type: str, method: str, call: asyncio.Future,
+                           timings: Optional[Dict[str, float]] = None):
+    """실행기 작업 결과를 풀고 거장별 분석 시간 기록"""
+    result, elapsed = await call
+    INVESTOR_ANALYSIS_SECONDS.observe(elapsed, investor_type, method)
+    if timings is not None:
+        timings[investor_type] = elapsed
+    return result
+
+def release_analysis_slot(loop: asyncio.AbstractEventLoop, slots: asyncio.Semaphore) -> None:
+    """실행기 작업이 실제로 끝났을 때 자리 반납 (작업자 스레드/프로세스 콜백에서 호출)"""
+    try:
+        loop.call_soon_threadsafe(slots.release)
+    except RuntimeError:
+        pass  # 서버 종료로 이벤트 루프가 이미 닫힘
+
+class AnalysisSlotsExhausted(asyncio.TimeoutError):
+    """제한 시간 안에 실행기 자리가 나지 않음 (작업자가 모두 멈춘 뇌에 붙잡힘)"""
+
+async def run_timed_analysis(investor_type: str, brain: InvestorBrain, method: str, *args,
+                             timeout: Optional[float] = None,
+                             timings: Optional[Dict[str, float]] = None):
+    """자리가 날 때까지 기다렸다가 제출하고, 제한 시간은 작업이 시작된 뒤부터 잰다
+
+    자리는 제한 시간이 지나도 작업이 실제로 끝날 때 반납하므로, 붙잡힌 작업자 때문에
+    다음 거장들이 큐에서 시간을 다 쓰고 빠지는 일이 없다. 자리 대기에도 같은 제한 시간을
+    두어, 멈춘 뇌가 모든 자리를 붙잡아도 요청이 끝없이 기다리지 않는다.
+    """
+    loop = asyncio.get_running_loop()
+    slots = get_analysis_slots()
+    try:
+        await asyncio.wait_for(slots.acquire(), timeout)
+    except asyncio.TimeoutError:
+        raise AnalysisSlotsExhausted(f"No free analysis worker within {timeout}s") from None
+    try:
+        job = get_analysis_executor().submit(timed_call, brain, method, *args)
+    except BaseException:
+        slots.release()
+        raise
+    job.add_done_callback(lambda _: release_analysis_slot(loop, slots))
+    return await asyncio.wait_for(
+        observe_analysis(investor_type, method, asyncio.wrap_future(job), timings),
+        timeout
+    )
+
+def submit_investor_analyses(
+    brains: Dict[str, InvestorBrain],
+    method: str,
+    *args,
+    timeout: Optional[float] = None,
+    timings: Optional[Dict[str, float]] = None
+) -> List[Tuple[str, asyncio.Future]]:
+    """거장별 분석 작업을 실행기에 제출하고 (투자자 타입, 결과 future) 목록 반환"""
+    return [
+        (
+            investor_type,
+            asyncio.ensure_future(run_timed_analysis(
+                investor_type, brain, method, *args, timeout=timeout, timings=timings))
+        )
+        for investor_type, brain in brains.items()
+    ]
+
+def record_skipped_investor(investor_type: str, error: Exception, timeout: Optional[float]) -> None:
+    """시간 초과나 예외로 결과에서 빠진 거장 기록"""
+    if isinstance(error, AnalysisSlotsExhausted):
+        logger.warning("Investor %s skipped: all %d workers busy for %.2fs", investor_type, ANALYSIS_MAX_WORKERS, timeout)
+        INVESTORS_SKIPPED.inc(investor_type, "saturated")
+    elif isinstance(error, asyncio.TimeoutError):
+        logger.warning("Investor %s timed out after %.2fs", investor_type, timeout)
+        INVESTORS_SKIPPED.inc(investor_type, "timeout")
+    else:
+        logger.error("Investor %s analysis failed: %r", investor_type, error, exc_info=error)
+        INVESTORS_SKIPPED.inc(investor_type, "error")
+
+async def run_investor_analyses(
+    brains: Dict[str, InvestorBrain],
+    method: str,
+    *args,
+    timeout: Optional[float] = None,
+    timings: Optional[Dict[str, float]] = None
+) -> List[Tuple[str, object]]:
+    """거장별 분석을 실행기에서 동시에 수행 (이벤트 루프를 막지 않음)
+
+    method는 'analyze_company' 또는 'analyze_companies'. 제한 시간을 넘기거나 예외를
+    던진 거장은 결과에서 빠진다 (스레드 작업 자체는 중단되지 않고 백그라운드에서 끝난다).
+    """
+    futures = [future for _, future in submit_investor_analyses(
+        brains, method, *args, timeout=timeout, timings=timings)]
+    outcomes = await asyncio.gather(*futures, return_exceptions=True)
+
+    results = []
+    for investor_type, outcome in zip(brains, outcomes):
+        if isinstance(outcome, Exception):
+            record_skipped_investor(investor_type, outcome, timeout)
+            continue
+        if isinstance(outcome, BaseException):
+            raise outcome
+        results.append((investor_type, outcome))
+    return results
+
+ACTION_SCORES = {"buy": 1, "hold": 0, "sell": -1, "avoid": -0.5}
 
 def calculate_consensus(decisions: List[InvestorDecisionResponse]) -> tuple:
     """거장들의 합의 계산"""
-    action_scores = {"buy": 1, "hold": 0, "sell": -1, "avoid": -0.5}
+    action_scores = ACTION_SCORES
     
     total_score = 0
     total_confidence = 0
@@ -143,6 +489,25 @@ def calculate_consensus(decisions: List[InvestorDecisionResponse]) -> tuple:
     
     return consensus, avg_confidence
 
+def calculate_consensus_batch(actions: List[np.ndarray], confidences: List[np.ndarray]) -> tuple:
+    """거장들의 합의 일괄 계산 (calculate_consensus와 같은 규칙, 기업별 배열)"""
+    size = len(actions[0])
+    total_score = np.zeros(size)
+    total_confidence = np.zeros(size)
+
+    for investor_actions, investor_confidences in zip(actions, confidences):
+        score = np.zeros(size)
+        for action, value in ACTION_SCORES.items():
+            score[investor_actions == action] = value
+        total_score = total_score + score * investor_confidences
+        total_confidence = total_confidence + investor_confidences
+
+    avg_score = total_score / len(actions)
+    avg_confidence = total_confidence / len(actions)
+    consensus = np.select([avg_score > 0.3, avg_score < -0.3], ["BUY", "AVOID"], "HOLD")
+
+    return consensus, avg_score, avg_confidence
+
 # ==================== API Endpoints ====================
 
 @app.get("/")
@@ -153,6 +518,12 @@ async def root():
         "version": "1.0.0",
         "endpoints": {
             "analyze": "/api/analyze",
+            "analyze_stream": "/api/analyze/stream",
+            "screen": "/api/screen",
+            "learn": "/api/learn",
+            "calibration": "/api/calibration",
+            "cache_stats": "/api/cache/stats",
+            "metrics": "/metrics",
             "investors": "/api/investors",
             "health": "/health"
         }
@@ -168,127 +539,356 @@ async def get_investors():
     """사용 가능한 거장 투자자 목록"""
     investors = [
         {
-            "id": "warren_buffett",
-            "name": "Warren Buffett",
-            "title": "Chairman & CEO, Berkshire Hathaway",
-            "philosophy": "Value investing with focus on moats",
-            "style": "Long-term, conservative"
-        },
-        {
-            "id": "peter_lynch",
-            "name": "Peter Lynch",
-            "title": "Former Manager, Fidelity Magellan Fund",
-            "philosophy": "Growth investing, invest in what you know",
-            "style": "Medium-term, growth-oriented"
-        },
-        {
-            "id": "howard_marks",
-            "name": "Howard Marks",
-            "title": "Co-Chairman, Oaktree Capital",
-            "philosophy": "Cycle awareness and risk management",
-            "style": "Contrarian, risk-focused"
-        },
-        {
-            "id": "george_soros",
-            "name": "George Soros",
-            "title": "Chairman, Soros Fund Management",
-            "philosophy": "Reflexivity theory and macro investing",
-            "style": "Short-term, aggressive"
+            "id": spec.investor_id,
+            "name": spec.name,
+            "title": spec.title,
+            "philosophy": spec.philosophy,
+            "style": spec.style
         }
+        for spec in registered_brains()
     ]
     return {"investors": investors}
 
+def json_response(model: BaseModel) -> Response:
+    return Response(content=model.model_dump_json(), media_type="application/json")
+
 @app.post("/api/analyze", response_model=AnalysisResponse)
-async def analyze_stock(request: AnalysisRequest):
+async def analyze_stock(request: AnalysisRequest, http_request: Request):
     """주식 분석 - 거장들의 관점에서"""
-    
+    entered = time.perf_counter()
+    started = getattr(http_request.state, "started", entered)
+    timings: Dict[str, float] = {}
+    investor_timings: Dict[str, float] = {}
+
+    # 본문 읽기/검증은 FastAPI가 핸들러 전에 하므로, 미들웨어 진입부터 여기까지를 parse로 기록
+    timings["parse"] = entered - started
+    ANALYSIS_STAGE_SECONDS.observe(timings["parse"], "parse")
+
+    for investor_type in request.investors:
+        if resolve_investor_id(investor_type) is None:
+            INVESTORS_SKIPPED.inc("unknown", "unknown_investor")
+
+    # 캐시 조회 (뇌 보정값이 바뀌면 자동 무효화)
+    cache_key = analysis_cache_key(request.company, request.context, request.investors)
+    cached = analysis_cache.get(cache_key, brain_registry.version)
+    if cached is not None:
+        with ANALYSIS_STAGE_SECONDS.time("serialize") as span:
+            response = json_response(cached)
+        timings["serialize"] = span.elapsed
+        log_analysis_timings(request, started, timings, investor_timings, cached=True)
+        return response
+
     try:
-        # Company 객체 생성
-        company = Company(
-            ticker=request.company.ticker,
-            name=request.company.name,
-            sector=request.company.sector,
-            pe_ratio=request.company.pe_ratio,
-            pb_ratio=request.company.pb_ratio,
-            roe=request.company.roe,
-            debt_equity=request.company.debt_equity,
-            revenue_growth=request.company.revenue_growth,
-            business_complexity=request.company.business_complexity,
-            moat_strength=request.company.moat_strength,
-            growth_stage=request.company.growth_stage
-        )
-        
-        # MarketContext 설정
-        if request.context:
-            context = MarketContext(
-                phase=get_market_phase(request.context.phase),
-                volatility=request.context.volatility,
-                sentiment_score=request.context.sentiment_score,
-                valuation_level=request.context.valuation_level,
-                key_themes=request.context.key_themes,
-                risk_factors=request.context.risk_factors
-            )
-        else:
-            # 기본 시장 상황
-            context = MarketContext(
-                phase=MarketPhase.UNCERTAIN,
-                volatility=0.3,
-                sentiment_score=0.5,
-                valuation_level=0.5,
-                key_themes=["AI", "inflation"],
-                risk_factors=["geopolitical"]
-            )
-        
-        # 각 거장의 분석 수행
+        # Company / MarketContext 객체 생성
+        with ANALYSIS_STAGE_SECONDS.time("build_inputs") as span:
+            company = build_company(request.company)
+            context = build_market_context(request.context)
+        timings["build_inputs"] = span.elapsed
+
+        # 각 거장의 분석 동시 수행 (알 수 없는 투자자 타입은 스냅샷에서 제외됨)
+        snapshot = brain_registry.snapshot(request.investors)
         decisions = []
-        for investor_type in request.investors:
-            try:
-                brain = create_investor_brain(investor_type)
-                decision = brain.analyze_company(company, context)
-                
-                decisions.append(InvestorDecisionResponse(
-                    investor=get_investor_name(investor_type),
-                    action=decision.action,
-                    confidence=decision.confidence,
-                    reasoning=decision.reasoning,
-                    emotional_state=decision.emotional_state,
-                    key_factors=decision.key_factors,
-                    time_horizon=decision.time_horizon
-                ))
-            except ValueError as e:
-                # 알 수 없는 투자자 타입은 건너뜀
-                continue
-        
-        if not decisions:
+        with ANALYSIS_STAGE_SECONDS.time("investors") as span:
+            for investor_type, decision in await run_investor_analyses(
+                snapshot.brains, "analyze_company", company, context,
+                timeout=ANALYSIS_INVESTOR_TIMEOUT, timings=investor_timings
+            ):
+                decisions.append(to_decision_response(investor_type, decision))
+        timings["investors"] = span.elapsed
+
+        if not snapshot.brains:
             raise HTTPException(status_code=400, detail="No valid investors specified")
-        
+        if not decisions:
+            raise HTTPException(status_code=503, detail="All investors timed out or failed")
+
         # 합의 계산
-        consensus, consensus_confidence = calculate_consensus(decisions)
-        
-        return AnalysisResponse(
+        with ANALYSIS_STAGE_SECONDS.time("consensus") as span:
+            consensus, consensus_confidence = calculate_consensus(decisions)
+        timings["consensus"] = span.elapsed
+
+        analysis = AnalysisResponse(
             ticker=company.ticker,
             company_name=company.name,
             decisions=decisions,
             consensus=consensus,
             consensus_confidence=consensus_confidence
         )
-        
+        if len(decisions) == len(snapshot.brains):
+            # 시간 초과로 빠진 거장이 있는 부분 결과는 캐시하지 않음
+            analysis_cache.put(cache_key, analysis, snapshot.version)
+
+        with ANALYSIS_STAGE_SECONDS.time("serialize") as span:
+            response = json_response(analysis)
+        timings["serialize"] = span.elapsed
+        log_analysis_timings(request, started, timings, investor_timings, cached=False)
+        return response
+
+    except HTTPException:
+        ANALYSIS_ERRORS.inc("/api/analyze")
+        raise
+    except Exception as e:
+        ANALYSIS_ERRORS.inc("/api/analyze")
+        raise HTTPException(status_code=500, detail=str(e))
+
+def log_analysis_timings(request: AnalysisRequest, started: float, timings: Dict[str, float],
+                         investor_timings: Dict[str, float], cached: bool) -> None:
+    """단계별 시간 구조화 로그 (METRICS_LOG_REQUESTS=1 일 때만)"""
+    if not METRICS_LOG_REQUESTS:
+        return
+    metrics_logger.info(json.dumps({
+        "event": "analyze",
+        "ticker": request.company.ticker,
+        "cached": cached,
+        "total_ms": round((time.perf_counter() - started) * 1000, 3),
+        "stages_ms": {stage: round(seconds * 1000, 3) for stage, seconds in timings.items()},
+        "investors_ms": {investor: round(seconds * 1000, 3) for investor, seconds in investor_timings.items()}
+    }, separators=(",", ":")))
+
+def format_stream_event(event: str, payload: Dict, stream_format: str) -> bytes:
+    """스트림 이벤트 하나를 NDJSON 줄 또는 SSE 메시지로 직렬화"""
+    data = json.dumps({"type": event, **payload}, ensure_ascii=False, separators=(",", ":"))
+    if stream_format == "sse":
+        return f"event: {event}\ndata: {data}\n\n".encode("utf-8")
+    return (data + "\n").encode("utf-8")
+
+async def stream_analyses(request: StreamAnalysisRequest, stream_format: str):
+    """종목별/거장별 결정을 계산되는 대로 내보내는 비동기 생성기
+
+    StreamingResponse는 클라이언트가 받을 때까지 다음 값을 요청하지 않으므로,
+    계산은 STREAM_PREFETCH_TICKERS 종목까지만 앞서 나간다 (backpressure).
+    """
+    context = build_market_context(request.context)
+    snapshot = brain_registry.snapshot(request.investors)
+    if not snapshot.brains:
+        yield format_stream_event("error", {"detail": "No valid investors specified"}, stream_format)
+        return
+
+    def start(company_input: CompanyInput) -> Dict:
+        cache_key = analysis_cache_key(company_input, request.context, request.investors)
+        cached = analysis_cache.get(cache_key, snapshot.version)
+        futures = [] if cached else submit_investor_analyses(
+            snapshot.brains, "analyze_company", build_company(company_input), context,
+            timeout=ANALYSIS_INVESTOR_TIMEOUT
+        )
+        return {"company": company_input, "cache_key": cache_key, "cached": cached, "futures": futures}
+
+    async def labelled(investor_type: str, future: asyncio.Future) -> Tuple[str, InvestorDecision]:
+        try:
+            return investor_type, await future
+        except Exception as e:
+            record_skipped_investor(investor_type, e, ANALYSIS_INVESTOR_TIMEOUT)
+            raise
+
+    companies = iter(request.companies)
+    pending = []
+    job = None
+    try:
+        for company_input in companies:
+            pending.append(start(company_input))
+            if len(pending) >= STREAM_PREFETCH_TICKERS:
+                break
+
+        while pending:
+            job = pending.pop(0)
+            company_input = job["company"]
+            next_company = next(companies, None)
+            if next_company is not None:
+                pending.append(start(next_company))
+
+            decisions = job["cached"].decisions if job["cached"] else []
+            for decision in decisions:
+                yield format_stream_event(
+                    "decision", {"ticker": company_input.ticker, "decision": decision.model_dump()}, stream_format
+                )
+
+            # 거장별 결정은 끝나는 순서대로 전송
+            finished_by_investor = {}
+            for finished in asyncio.as_completed([labelled(*pair) for pair in job["futures"]]):
+                try:
+                    investor_type, result = await finished
+                except Exception:
+                    # 시간 초과/예외는 labelled가 거장을 기록하고 다시 던진 것
+                    continue
+                decision = to_decision_response(investor_type, result)
+                finished_by_investor[investor_type] = decision
+                yield format_stream_event(
+                    "decision", {"ticker": company_input.ticker, "decision": decision.model_dump()}, stream_format
+                )
+
+            if finished_by_investor:
+                # 합의와 캐시는 /api/analyze와 같은 거장 순서로 (완료 순서에 따라 달라지지 않게)
+                decisions = [finished_by_investor[t] for t in snapshot.brains if t in finished_by_investor]
+
+            if not decisions:
+                yield format_stream_event(
+                    "error", {"ticker": company_input.ticker, "detail": "All investors timed out or failed"}, stream_format
+                )
+                continue
+
+            consensus, consensus_confidence = calculate_consensus(decisions)
+            if not job["cached"] and len(decisions) == len(snapshot.brains):
+                analysis_cache.put(job["cache_key"], AnalysisResponse(
+                    ticker=company_input.ticker,
+                    company_name=company_input.name,
+                    decisions=decisions,
+                    consensus=consensus,
+                    consensus_confidence=consensus_confidence
+                ), snapshot.version)
+
+            yield format_stream_event("consensus", {
+                "ticker": company_input.ticker,
+                "company_name": company_input.name,
+                "consensus": consensus,
+                "consensus_confidence": consensus_confidence
+            }, stream_format)
+
+        yield format_stream_event("done", {"tickers": len(request.companies)}, stream_format)
+
+    finally:
+        # 클라이언트가 끊으면 아직 남은 작업 취소
+        for unfinished in pending + ([job] if job else []):
+            for _, future in unfinished["futures"]:
+                future.cancel()
+
+@app.post("/api/analyze/stream")
+async def analyze_stream(request: StreamAnalysisRequest, format: str = "ndjson"):
+    """주식 분석 스트리밍 - 거장별 결정을 NDJSON(기본) 또는 SSE(format=sse)로 즉시 전송"""
+    if format not in ("ndjson", "sse"):
+        raise HTTPException(status_code=400, detail="format must be 'ndjson' or 'sse'")
+
+    return StreamingResponse(
+        stream_analyses(request, format),
+        media_type="text/event-stream" if format == "sse" else "application/x-ndjson",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+@app.post("/api/screen", response_model=ScreenResponse)
+async def screen_stocks(request: ScreenRequest):
+    """전체 종목 스크리닝 - 거장들의 일괄 분석 후 순위/페이지 처리"""
+
+    if request.page < 1 or request.page_size < 1:
+        raise HTTPException(status_code=400, detail="page and page_size must be positive")
+
+    columns = build_company_columns(request.companies)
+    context = build_market_context(request.context)
+
+    try:
+        # 각 거장의 일괄 분석 (한 번에 전체 종목)
+        snapshot = brain_registry.snapshot(request.investors)
+        investors, actions, confidences = [], [], []
+        for investor_type, batch in await run_investor_analyses(
+            snapshot.brains, "analyze_companies", columns, context
+        ):
+            investors.append(get_investor_name(investor_type))
+            actions.append(batch.actions)
+            confidences.append(batch.confidences)
+
+        if not snapshot.brains:
+            raise HTTPException(status_code=400, detail="No valid investors specified")
+        if not investors:
+            raise HTTPException(status_code=503, detail="All investors failed")
+
+        consensus, consensus_score, consensus_confidence = calculate_consensus_batch(actions, confidences)
+
+        # 합의 점수 → 합의 신뢰도 순으로 정렬
+        order = np.lexsort((-consensus_confidence, -consensus_score))
+        if request.consensus:
+            order = order[consensus[order] == request.consensus.upper()]
+        if request.top_n is not None:
+            order = order[:max(0, request.top_n)]
+
+        start = (request.page - 1) * request.page_size
+        page_rows = order[start:start + request.page_size]
+
+        results = []
+        for offset, row in enumerate(page_rows.tolist()):
+            results.append(ScreenResult(
+                rank=start + offset + 1,
+                ticker=columns["ticker"][row],
+                company_name=columns["name"][row],
+                consensus=str(consensus[row]),
+                consensus_score=float(consensus_score[row]),
+                consensus_confidence=float(consensus_confidence[row]),
+                decisions=[
+                    ScreenDecision(
+                        investor=investor,
+                        action=str(investor_actions[row]),
+                        confidence=float(investor_confidences[row])
+                    )
+                    for investor, investor_actions, investor_confidences in zip(investors, actions, confidences)
+                ]
+            ))
+
+        return ScreenResponse(
+            total=len(order),
+            page=request.page,
+            page_size=request.page_size,
+            investors=investors,
+            results=results
+        )
+
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+@app.post("/api/learn", response_model=CalibrationResponse)
+async def learn_from_outcome(outcome: OutcomeInput):
+    """실제 결과로 거장 뇌의 신뢰도 보정 (이후 모든 요청에 유지됨)"""
+    decision = InvestorDecision(
+        action=outcome.action.lower(),
+        confidence=outcome.confidence,
+        reasoning="",
+        emotional_state="",
+        key_factors=[],
+        time_horizon=""
+    )
+
+    try:
+        brain_registry.learn_from_outcome(outcome.investor, decision, outcome.actual_outcome)
+    except ValueError:
+        raise HTTPException(status_code=404, detail=f"Investor {outcome.investor} not found")
+
+    return CalibrationResponse(version=brain_registry.version, calibration=brain_registry.calibrations())
+
+@app.get("/api/calibration", response_model=CalibrationResponse)
+async def get_calibration():
+    """거장 뇌별 현재 신뢰도 보정값"""
+    return CalibrationResponse(version=brain_registry.version, calibration=brain_registry.calibrations())
+
+@app.get("/metrics")
+async def get_metrics():
+    """Prometheus 텍스트 형식 지표"""
+    return Response(content=metrics.render(), media_type=MetricsRegistry.CONTENT_TYPE)
+
+@app.get("/api/cache/stats")
+async def get_cache_stats():
+    """분석 결과 캐시 카운터 (hit/miss/eviction)"""
+    return analysis_cache.stats()
+
 @app.get("/api/investors/{investor_id}/data")
-async def get_investor_data(investor_id: str):
-    """거장 투자자 상세 데이터"""
+async def get_investor_data(investor_id: str, request: Request):
+    """거장 투자자 상세 데이터 (별칭도 허용)"""
     
-    data_path = Path(__file__).parent.parent / "data" / "investors" / f"{investor_id}.json"
+    document = investor_store.get(resolve_investor_id(investor_id) or investor_id)
     
-    if not data_path.exists():
+    if document is None:
         raise HTTPException(status_code=404, detail=f"Investor {investor_id} not found")
     
-    with open(data_path, "r", encoding="utf-8") as f:
-        data = json.load(f)
+    headers = {"ETag": document.etag, "Vary": "Accept-Encoding"}
+    
+    # 클라이언트가 같은 버전을 가지고 있으면 본문 없이 304
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match:
+        tags = [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+        if "*" in tags or document.etag in tags:
+            return Response(status_code=304, headers=headers)
+    
+    if "gzip" in request.headers.get("accept-encoding", ""):
+        headers["Content-Encoding"] = "gzip"
+        return Response(content=document.gzip_body, media_type="application/json", headers=headers)
     
-    return data
+    return Response(content=document.body, media_type="application/json", headers=headers)
 
 # ==================== Run Server ====================
 
@@ -0,0 +1,346 @@
+#!/usr/bin/env python3
+"""
+⏱️ 분석 핫패스 벤치마크
+거장 뇌 분석, 합의 계산, /api/analyze, 지식 그래프, 인사이트 매칭의 재현 가능한 성능 측정
+
+사용법:
+    python benchmarks/run_benchmarks.py                      # 실행 후 결과 JSON 출력
+    python benchmarks/run_benchmarks.py --output out.json    # 결과 저장
+    python benchmarks/run_benchmarks.py --save-baseline      # benchmarks/baseline.json 갱신
+    python benchmarks/run_benchmarks.py --baseline other.json --threshold 0.25
+    python benchmarks/run_benchmarks.py --graph-sizes 10000,100000,1000000 --only graph
+
+기준선(기본 benchmarks/baseline.json) 대비 연산당 중앙값이 threshold 비율 이상
+느려진 항목이 있으면 종료 코드 1. 기준선 파일이 없거나 기준선과 이름이 맞는 항목이
+하나도 없어도 (작업량이 이름에 들어가므로 --scale 이 다르면) 종료 코드 1, 일부만 맞지
+않으면 비교하지 않은 항목을 경고로 출력한다.
+"""
+
+import argparse
+import asyncio
+import contextlib
+import json
+import platform
+import statistics
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, List, Tuple
+
+import numpy as np
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT))
+sys.path.insert(0, str(REPO_ROOT / "backend"))
+sys.path.insert(0, str(REPO_ROOT / "prototype"))
+
+from advanced_ai.investor_brain import Company, MarketContext, MarketPhase, create_investor_brain, registered_brains
+
+DEFAULT_BASELINE = Path(__file__).resolve().parent / "baseline.json"
+SECTORS = ['Technology', 'Consumer Staples', 'Financials', 'Energy', 'Healthcare', 'Real Estate']
+STAGES = ['early', 'growth', 'mature', 'declining']
+THEMES = ['ai', 'inflation', 'rates', 'energy', 'consumer', 'china', 'banks', 'housing', 'crypto', 'value']
+
+# 이름 -> (그룹, 준비 함수). 준비 함수는 (측정 함수, 측정 함수 1회당 연산 수)를 반환
+BENCHMARKS: Dict[str, Tuple[str, Callable]] = {}
+
+def benchmark(name: str, group: str):
+    def register(setup: Callable) -> Callable:
+        BENCHMARKS[name] = (group, setup)
+        return setup
+    return register
+
+def make_context() -> MarketContext:
+    return MarketContext(
+        phase=MarketPhase.TRANSITION,
+        volatility=0.4,
+        sentiment_score=0.2,
+        valuation_level=0.6,
+        key_themes=['ai', 'rates'],
+        risk_factors=['inflation']
+    )
+
+def make_companies(count: int, seed: int = 7) -> List[Company]:
+    rng = np.random.default_rng(seed)
+    return [
+        Company(
+            ticker=f"T{i:05d}",
+            name=f"Company {i}",
+            sector=SECTORS[i % len(SECTORS)],
+            pe_ratio=float(rng.uniform(5, 60)),
+            pb_ratio=float(rng.uniform(0.5, 15)),
+            roe=float(rng.uniform(-0.1, 0.5)),
+            debt_equity=float(rng.uniform(0, 3)),
+            revenue_growth=float(rng.uniform(-0.2, 0.6)),
+            business_complexity=float(rng.uniform(0, 1)),
+            moat_strength=float(rng.uniform(0, 1)),
+            growth_stage=STAGES[i % len(STAGES)]
+        )
+        for i in range(count)
+    ]
+
+def brain_benchmarks(scale: float) -> None:
+    """등록된 거장마다 단건/일괄 분석 벤치마크 등록"""
+    single_count = max(1, int(1000 * scale))
+    batch_count = max(1, int(10000 * scale))
+
+    for spec in registered_brains():
+        def single(investor_id=spec.investor_id):
+            brain = create_investor_brain(investor_id)
+            companies = make_companies(single_count)
+            context = brain.prepare_context(make_context())
+
+            def run():
+                for company in companies:
+                    brain.analyze_company(company, context)
+            return run, len(companies)
+
+        def batch(investor_id=spec.investor_id):
+            brain = create_investor_brain(investor_id)
+            companies = make_companies(batch_count)
+            context = make_context()
+            return (lambda: brain.analyze_companies(companies, context)), len(companies)
+
+        benchmark(f"brain.{spec.investor_id}.analyze_company", "brain")(single)
+        benchmark(f"brain.{spec.investor_id}.analyze_companies[{batch_count}]", "brain")(batch)
+
+def api_benchmarks(scale: float) -> None:
+    request_count = max(1, int(200 * scale))
+
+    @benchmark("api.calculate_consensus", "api")
+    def consensus():
+        from main import InvestorDecisionResponse, calculate_consensus
+
+        rng = np.random.default_rng(11)
+        decision_sets = [
+            [
+                InvestorDecisionResponse(
+                    investor=spec.name, action=str(rng.choice(['buy', 'hold', 'sell', 'avoid'])),
+                    confidence=float(rng.uniform(0, 1)), reasoning="", emotional_state="",
+                    key_factors=[], time_horizon=""
+                )
+                for spec in registered_brains()
+            ]
+            for _ in range(1000)
+        ]
+
+        def run():
+            for decisions in decision_sets:
+                calculate_consensus(decisions)
+        return run, len(decision_sets)
+
+    @benchmark(f"api.post_analyze[{request_count}]", "api")
+    def analyze_endpoint():
+        import httpx
+        from main import app
+
+        bodies = [
+            {
+                "company": {
+                    "ticker": company.ticker, "name": company.name, "sector": company.sector,
+                    "pe_ratio": company.pe_ratio, "pb_ratio": company.pb_ratio, "roe": company.roe,
+                    "debt_equity": company.debt_equity, "revenue_growth": company.revenue_growth,
+                    "business_complexity": company.business_complexity,
+                    "moat_strength": company.moat_strength, "growth_stage": company.growth_stage
+                },
+                "context": {"phase": "transition", "volatility": 0.4, "key_themes": ["ai"]}
+            }
+            for company in make_companies(request_count)
+        ]
+        state = {"round": 0}
+
+        async def post_all():
+            # 매 라운드 값을 조금씩 바꿔 캐시를 타지 않게 함
+            state["round"] += 1
+            transport = httpx.ASGITransport(app=app)
+            async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+                for body in bodies:
+                    body["company"]["pe_ratio"] += 1e-6 * state["round"]
+                    response = await client.post("/api/analyze", json=body)
+                    response.raise_for_status()
+
+        return (lambda: asyncio.run(post_all())), len(bodies)
+
+def make_triples(count: int, seed: int = 3):
+    from advanced_ai.knowledge_graph_learner import KnowledgeTriple
+
+    rng = np.random.default_rng(seed)
+    now = datetime.now()
+    subjects = rng.integers(0, max(1, count // 20), count)
+    objects = rng.integers(0, count, count)
+    theme_picks = rng.integers(0, len(THEMES), (count, 2))
+    phases = rng.choice(['bull_market', 'bear_market', 'transition'], count)
+    return [
+        KnowledgeTriple(
+            subject=f"investor_{subjects[i]}", predicate='bullish_on', object=f"entity_{objects[i]}",
+            confidence=0.7, source='bench', timestamp=now,
+            context={'key_themes': [THEMES[j] for j in theme_picks[i]], 'market_phase': str(phases[i])}
+        )
+        for i in range(count)
+    ]
+
+def graph_benchmarks(sizes: List[int]) -> None:
+    for size in sizes:
+        @benchmark(f"graph.add_knowledge[{size}]", "graph")
+        def add(size=size):
+            from advanced_ai.knowledge_graph_learner import KnowledgeGraph
+
+            triples = make_triples(size)
+
+            def run():
+                graph = KnowledgeGraph()
+                for triple in triples:
+                    graph.add_knowledge(triple)
+            return run, len(triples)
+
+        @benchmark(f"graph.find_similar_situations[{size}]", "graph")
+        def similar(size=size):
+            from advanced_ai.knowledge_graph_learner import KnowledgeGraph
+
+            graph = KnowledgeGraph()
+            for triple in make_triples(size):
+                graph.add_knowledge(triple)
+            queries = [{'key_themes': [THEMES[i % len(THEMES)], THEMES[(i * 3) % len(THEMES)]],
+                        'market_phase': 'transition'} for i in range(20)]
+
+            def run():
+                for query in queries:
+                    graph.find_similar_situations(query)
+            return run, len(queries)
+
+def insight_benchmarks(scale: float) -> None:
+    insight_count = max(1, int(2000 * scale))
+
+    @benchmark(f"insight.analyze_insight[{insight_count}]", "insight")
+    def analyze_insight():
+        from investor_insight_processor import InvestorInsight, InvestorInsightProcessor
+
+        processor = InvestorInsightProcessor(data_dir=str(REPO_ROOT / "data" / "investors"))
+        names = list(processor.stock_name_to_ticker)
+        rng = np.random.default_rng(5)
+        words = ['market', 'moat', 'growth', 'value', 'cycle', 'risk', 'the', 'we', 'love', 'business']
+        insights = []
+        for i in range(insight_count):
+            tokens = list(rng.choice(words, 40)) + list(rng.choice(names, 3))
+            rng.shuffle(tokens)
+            insights.append(InvestorInsight(
+                id=f"bench_{i}", content=" ".join(tokens), source="bench", source_type="synthetic",
+                date_said="2024-01-01", context="", companies_mentioned=[], sentiment="bullish",
+                investment_themes=[], confidence_score=0.5,
+                tags=['technology'] if i % 3 == 0 else []
+            ))
+
+        def run():
+            for insight in insights:
+                processor.analyze_insight(insight)
+        return run, len(insights)
+
+def measure(setup: Callable, repeats: int) -> Dict:
+    """준비 후 1회 예열, repeats회 측정 (연산당 시간의 중앙값/최솟값)"""
+    # 준비/예열 중 출력이 결과 JSON(stdout)에 섞이지 않게 함
+    with contextlib.redirect_stdout(sys.stderr):
+        run, ops = setup()
+        run()
+    samples = []
+    for _ in range(repeats):
+        started = time.perf_counter()
+        run()
+        samples.append((time.perf_counter() - started) / ops)
+    return {
+        'ops': ops,
+        'repeats': repeats,
+        'median_s': statistics.median(samples),
+        'min_s': min(samples),
+        'per_op_us': statistics.median(samples) * 1e6
+    }
+
+def compare(results: Dict, baseline: Dict, threshold: float) -> Tuple[List[str], List[str]]:
+    """기준선 대비 느려진 항목 목록과 기준선에 없어 비교하지 못한 항목 목록"""
+    regressions = []
+    unmatched = []
+    for name, result in results.items():
+        base = baseline.get('results', {}).get(name)
+        if not base:
+            unmatched.append(name)
+            continue
+        ratio = result['median_s'] / base['median_s']
+        result['baseline_ratio'] = ratio
+        if ratio > 1 + threshold:
+            regressions.append(f"{name}: {ratio:.2f}x ({base['per_op_us']:.2f}us -> {result['per_op_us']:.2f}us)")
+    return regressions, unmatched
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="StockOracle hot path benchmarks")
+    parser.add_argument('--repeats', type=int, default=5)
+    parser.add_argument('--scale', type=float, default=1.0, help="brain/api/insight 작업량 배율")
+    parser.add_argument('--graph-sizes', default="10000", help="쉼표로 구분한 그래프 엣지 수")
+    parser.add_argument('--only', default=None, help="이 문자열을 포함하는 벤치마크만")
+    parser.add_argument('--output', default=None, help="결과 JSON 저장 경로")
+    parser.add_argument('--baseline', default=str(DEFAULT_BASELINE),
+                        help="비교할 기준선 JSON (빈 문자열이면 비교 생략, 파일이 없으면 실패)")
+    parser.add_argument('--threshold', type=float, default=0.25, help="허용 감속 비율")
+    parser.add_argument('--save-baseline', action='store_true', help=f"결과를 {DEFAULT_BASELINE.name}에 저장")
+    args = parser.parse_args()
+
+    brain_benchmarks(args.scale)
+    api_benchmarks(args.scale)
+    graph_benchmarks([int(size) for size in args.graph_sizes.split(',') if size])
+    insight_benchmarks(args.scale)
+
+    results = {}
+    for name, (group, setup) in BENCHMARKS.items():
+        if args.only and args.only not in name:
+            continue
+        results[name] = {'group': group, **measure(setup, args.repeats)}
+        print(f"{name:<55} {results[name]['per_op_us']:>12.2f} us/op", file=sys.stderr)
+
+    report = {
+        'meta': {
+            'timestamp': datetime.now().isoformat(),
+            'python': platform.python_version(),
+            'numpy': np.__version__,
+            'platform': platform.platform(),
+            'args': vars(args)
+        },
+        'results': results
+    }
+
+    regressions = []
+    unmatched = []
+    baseline_missing = False
+    if args.baseline and not args.save_baseline:
+        baseline_path = Path(args.baseline)
+        if baseline_path.exists():
+            with open(baseline_path, 'r', encoding='utf-8') as f:
+                regressions, unmatched = compare(results, json.load(f), args.threshold)
+        else:
+            baseline_missing = True
+    report['regressions'] = regressions
+    report['unmatched'] = unmatched
+
+    text = json.dumps(report, indent=2, ensure_ascii=False)
+    if args.output:
+        Path(args.output).write_text(text, encoding='utf-8')
+    if args.save_baseline:
+        DEFAULT_BASELINE.write_text(text, encoding='utf-8')
+    if not args.output and not args.save_baseline:
+        print(text)
+
+    for regression in regressions:
+        print(f"❌ 성능 저하: {regression}", file=sys.stderr)
+    if baseline_missing:
+        print(f"❌ 기준선 없음: {args.baseline} (--save-baseline 으로 만들거나 --baseline '' 로 비교 생략)",
+              file=sys.stderr)
+        return 1
+    if unmatched:
+        # 작업량이 이름에 들어가므로 --scale/--graph-sizes 가 기준선과 다르면 여기로 온다
+        print(f"⚠️ 기준선에 없어 비교하지 않은 항목 {len(unmatched)}개: {', '.join(unmatched)}", file=sys.stderr)
+        if len(unmatched) == len(results):
+            print("❌ 기준선과 일치하는 항목이 하나도 없음 (기준선과 같은 --scale/--graph-sizes 로 실행할 것)",
+                  file=sys.stderr)
+            return 1
+    return 1 if regressions else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
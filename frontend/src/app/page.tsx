@@ -42,9 +42,9 @@ const mockInvestors: InvestorWithInsights[] = [
     ]
   },
   {
-    id: 'peter_ynch',
+    id: 'peter_lynch',
     name: 'Peter Lynch',
-    slug: 'peter_ynch',
+    slug: 'peter_lynch',
     title: 'Former Manager, Fidelity Magellan Fund',
     birthYear: 1944,
     nationality: 'American',
@@ -54,7 +54,7 @@ const mockInvestors: InvestorWithInsights[] = [
       "Invest in what you know.",
       "The key to making money in stocks is not to get scared out of them."
     ],
-    photoUrl: '/images/investors/peter_ynch.jpg',
+    photoUrl: '/images/investors/peter_lynch.jpg',
     insights: []
   }
 ];
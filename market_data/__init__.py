@@ -0,0 +1,55 @@
+# StockOracle Market Data Module
+import os
+from pathlib import Path
+from typing import Optional
+
+from .providers import (
+    MarketDataProvider,
+    MarketDataUnavailable,
+    TickerView,
+    YFinanceProvider,
+    FixtureProvider
+)
+from .cache import MarketDataCache, CachedMarketData
+from .snapshot import MarketSnapshot, SnapshotEngine
+from .indicators import IndicatorState
+
+_REPO_ROOT = Path(__file__).resolve().parent.parent
+
+def create_market_data(mode: Optional[str] = None, cache_path: Optional[str] = None,
+                       fixture_dir: Optional[str] = None) -> MarketDataProvider:
+    """환경 설정에 맞는 시장 데이터 제공자 생성
+
+    MARKET_DATA_MODE: live (yfinance + 캐시, 기본), offline (픽스처만), record (live + 픽스처 기록)
+    MARKET_DATA_CACHE: SQLite 캐시 경로, MARKET_DATA_FIXTURES: 픽스처 디렉터리
+    MARKET_DATA_HISTORY_TTL / MARKET_DATA_INFO_TTL: 캐시 유효 시간(초)
+    기본 픽스처(data/market_fixtures)는 python -m market_data.record 로 다시 만든다.
+    """
+    mode = (mode or os.getenv("MARKET_DATA_MODE", "live")).lower()
+    fixture_dir = fixture_dir or os.getenv(
+        "MARKET_DATA_FIXTURES", str(_REPO_ROOT / "data" / "market_fixtures"))
+
+    if mode == "offline":
+        return FixtureProvider(fixture_dir)
+
+    cache = MarketDataCache(
+        cache_path or os.getenv("MARKET_DATA_CACHE", str(Path.home() / ".cache" / "stockoracle" / "market_data.db")),
+        history_ttl=float(os.getenv("MARKET_DATA_HISTORY_TTL", 12 * 3600)),
+        info_ttl=float(os.getenv("MARKET_DATA_INFO_TTL", 24 * 3600))
+    )
+    recorder = FixtureProvider(fixture_dir) if mode == "record" else None
+    return CachedMarketData(YFinanceProvider(), cache, recorder=recorder)
+
+__all__ = [
+    'MarketDataProvider',
+    'MarketDataUnavailable',
+    'TickerView',
+    'YFinanceProvider',
+    'FixtureProvider',
+    'MarketDataCache',
+    'CachedMarketData',
+    'MarketSnapshot',
+    'SnapshotEngine',
+    'IndicatorState',
+    'create_market_data'
+]
@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+"""
+🗄️ 시장 데이터 로컬 캐시
+(티커, 기간, 간격) 단위로 SQLite에 저장하고, 같은 키의 동시 요청은 한 번만 조회한다
+"""
+
+import json
+import sqlite3
+import threading
+import time
+from concurrent.futures import Future
+from pathlib import Path
+from typing import Callable, Dict, Optional
+
+import pandas as pd
+
+from .providers import FixtureProvider, MarketDataProvider
+
+def encode_history(hist: pd.DataFrame) -> str:
+    """가격 이력 직렬화 (인덱스는 UTC ISO, 원래 시간대는 따로 기록)"""
+    index = pd.DatetimeIndex(hist.index)
+    tz = str(index.tz) if index.tz is not None else None
+    frame = hist.copy()
+    frame.index = index.tz_convert('UTC') if tz else index
+    return json.dumps({
+        'tz': tz,
+        'frame': json.loads(frame.to_json(orient='split', date_format='iso', date_unit='ns'))
+    })
+
+def decode_history(payload: str) -> pd.DataFrame:
+    """encode_history 역변환"""
+    data = json.loads(payload)
+    frame = data['frame']
+    index = pd.to_datetime(frame['index'], utc=data['tz'] is not None)
+    if data['tz']:
+        index = index.tz_convert(data['tz'])
+    hist = pd.DataFrame(frame['data'], index=index, columns=frame['columns'])
+    hist.index.name = 'Date'
+    return hist
+
+class MarketDataCache:
+    """SQLite 시장 데이터 캐시 (TTL)"""
+
+    def __init__(self, db_path: str = "market_data_cache.db", history_ttl: float = 12 * 3600,
+                 info_ttl: float = 24 * 3600, clock=time.time):
+        self.db_path = db_path
+        self.history_ttl = history_ttl
+        self.info_ttl = info_ttl
+        self._clock = clock
+        self._lock = threading.Lock()
+
+        if db_path != ":memory:":
+            Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(db_path, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute('''
+            CREATE TABLE IF NOT EXISTS history (
+                ticker TEXT, period TEXT, interval TEXT,
+                fetched_at REAL, payload TEXT,
+                PRIMARY KEY (ticker, period, interval)
+            )
+        ''')
+        self.conn.execute('''
+            CREATE TABLE IF NOT EXISTS info (
+                ticker TEXT PRIMARY KEY, fetched_at REAL, payload TEXT
+            )
+        ''')
+        self.conn.commit()
+
+    def get_history(self, ticker: str, period: str, interval: str) -> Optional[pd.DataFrame]:
+        """TTL 안의 가격 이력 (없으면 None)"""
+        with self._lock:
+            row = self.conn.execute(
+                'SELECT fetched_at, payload FROM history WHERE ticker=? AND period=? AND interval=?',
+                (ticker, period, interval)
+            ).fetchone()
+        if row is None or self._clock() - row[0] > self.history_ttl:
+            return None
+        return decode_history(row[1])
+
+    def put_history(self, ticker: str, period: str, interval: str, hist: pd.DataFrame) -> None:
+        payload = encode_history(hist)
+        with self._lock:
+            self.conn.execute(
+                'INSERT OR REPLACE INTO history VALUES (?, ?, ?, ?, ?)',
+                (ticker, period, interval, self._clock(), payload)
+            )
+            self.conn.commit()
+
+    def get_info(self, ticker: str) -> Optional[Dict]:
+        """TTL 안의 기업 정보 (없으면 None)"""
+        with self._lock:
+            row = self.conn.execute(
+                'SELECT fetched_at, payload FROM info WHERE ticker=?', (ticker,)
+            ).fetchone()
+        if row is None or self._clock() - row[0] > self.info_ttl:
+            return None
+        return json.loads(row[1])
+
+    def put_info(self, ticker: str, info: Dict) -> None:
+        payload = json.dumps(info, default=str)
+        with self._lock:
+            self.conn.execute(
+                'INSERT OR REPLACE INTO info VALUES (?, ?, ?)',
+                (ticker, self._clock(), payload)
+            )
+            self.conn.commit()
+
+    def clear(self) -> None:
+        with self._lock:
+            self.conn.execute('DELETE FROM history')
+            self.conn.execute('DELETE FROM info')
+            self.conn.commit()
+
+    def close(self) -> None:
+        with self._lock:
+            self.conn.close()
+
+class CachedMarketData(MarketDataProvider):
+    """캐시 + 요청 병합 제공자
+
+    캐시에 없을 때만 하위 제공자를 호출하며, 같은 키를 동시에 요청한 호출자들은
+    하나의 조회 결과를 공유한다. recorder를 주면 조회 결과를 픽스처로도 남긴다.
+    """
+
+    def __init__(self, provider: MarketDataProvider, cache: MarketDataCache,
+                 recorder: Optional[FixtureProvider] = None):
+        self.provider = provider
+        self.cache = cache
+        self.recorder = recorder
+        self._inflight: Dict[tuple, Future] = {}
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.fetches = 0
+        self.coalesced = 0
+
+    def _coalesce(self, key: tuple, lookup: Callable, fetch: Callable):
+        """캐시 확인 후, 같은 키의 진행 중 조회가 있으면 그 결과를 기다림"""
+        cached = lookup()
+        if cached is not None:
+            self.hits += 1
+            return cached
+
+        with self._lock:
+            future = self._inflight.get(key)
+            owner = future is None
+            if owner:
+                future = Future()
+                self._inflight[key] = future
+            else:
+                self.coalesced += 1
+
+        if not owner:
+            return future.result()
+
+        try:
+            # 잠금을 기다리는 동안 다른 호출자가 채웠을 수 있음
+            result = lookup()
+            if result is None:
+                self.fetches += 1
+                result = fetch()
+            future.set_result(result)
+            return result
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
+
+    def history(self, ticker: str, period: str = "1y", interval: str = "1d") -> pd.DataFrame:
+        def fetch():
+            hist = self.provider.history(ticker, period=period, interval=interval)
+            self.cache.put_history(ticker, period, interval, hist)
+            if self.recorder is not None:
+                self.recorder.save_history(ticker, period, interval, hist)
+            return hist
+
+        hist = self._coalesce(
+            ('history', ticker, period, interval),
+            lambda: self.cache.get_history(ticker, period, interval),
+            fetch
+        )
+        return hist.copy()
+
+    def info(self, ticker: str) -> Dict:
+        def fetch():
+            info = self.provider.info(ticker)
+            self.cache.put_info(ticker, info)
+            if self.recorder is not None:
+                self.recorder.save_info(ticker, info)
+            return info
+
+        info = self._coalesce(('info', ticker), lambda: self.cache.get_info(ticker), fetch)
+        return dict(info)
+
+    def stats(self) -> Dict:
+        return {'hits': self.hits, 'fetches': self.fetches, 'coalesced': self.coalesced}
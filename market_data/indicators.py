@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+"""
+📐 벡터화 기술적 지표
+(티커 x 거래일) 종가 행렬 하나로 수천 종목의 지표를 한 번에 계산
+"""
+
+from typing import Dict, Iterable
+
+import numpy as np
+import pandas as pd
+from numpy.lib.stride_tricks import sliding_window_view
+
+TRADING_DAYS = 252
+
+def as_matrix(prices) -> np.ndarray:
+    """종가를 (티커 x 거래일) float 행렬로 변환
+
+    1차원 배열은 티커 하나로, DataFrame(날짜 x 티커)은 전치해서 받는다.
+    """
+    if isinstance(prices, pd.DataFrame):
+        prices = prices.to_numpy(dtype=float).T
+    elif isinstance(prices, pd.Series):
+        prices = prices.to_numpy(dtype=float)
+    matrix = np.asarray(prices, dtype=float)
+    if matrix.ndim == 1:
+        matrix = matrix[None, :]
+    return matrix
+
+def _rolling(prices: np.ndarray, window: int, reducer) -> np.ndarray:
+    """길이 window 이동 구간 집계 (앞쪽 window-1일은 NaN)"""
+    prices = as_matrix(prices)
+    out = np.full(prices.shape, np.nan)
+    if window <= prices.shape[1]:
+        out[:, window - 1:] = reducer(sliding_window_view(prices, window, axis=1))
+    return out
+
+def sma(prices, window: int) -> np.ndarray:
+    """단순 이동평균 (누적합 기반, 구간에 NaN이 있으면 NaN)"""
+    prices = as_matrix(prices)
+    out = np.full(prices.shape, np.nan)
+    if window > prices.shape[1]:
+        return out
+
+    missing = np.isnan(prices)
+    pad = np.zeros((prices.shape[0], 1))
+    sums = np.concatenate([pad, np.cumsum(np.where(missing, 0.0, prices), axis=1)], axis=1)
+    gaps = np.concatenate([pad, np.cumsum(missing, axis=1)], axis=1)
+
+    window_sum = sums[:, window:] - sums[:, :-window]
+    window_gaps = gaps[:, window:] - gaps[:, :-window]
+    out[:, window - 1:] = np.where(window_gaps > 0, np.nan, window_sum / window)
+    return out
+
+def ema(prices, span: int) -> np.ndarray:
+    """지수 이동평균 (pandas ewm(span, adjust=False)와 같은 재귀식)"""
+    prices = as_matrix(prices)
+    alpha = 2.0 / (span + 1)
+    out = np.empty(prices.shape)
+    if prices.shape[1] == 0:
+        return out
+    out[:, 0] = prices[:, 0]
+    for t in range(1, prices.shape[1]):
+        prev = out[:, t - 1]
+        value = alpha * prices[:, t] + (1 - alpha) * prev
+        # 결측일은 직전 값 유지
+        out[:, t] = np.where(np.isnan(prices[:, t]), prev, np.where(np.isnan(prev), prices[:, t], value))
+    return out
+
+def rolling_max(prices, window: int) -> np.ndarray:
+    """이동 최고가"""
+    return _rolling(prices, window, lambda view: view.max(axis=-1))
+
+def rolling_min(prices, window: int) -> np.ndarray:
+    """이동 최저가"""
+    return _rolling(prices, window, lambda view: view.min(axis=-1))
+
+def returns(prices) -> np.ndarray:
+    """일간 수익률 (첫날은 NaN)"""
+    prices = as_matrix(prices)
+    out = np.full(prices.shape, np.nan)
+    out[:, 1:] = prices[:, 1:] / prices[:, :-1] - 1
+    return out
+
+def realized_volatility(prices, window: int, periods_per_year: int = TRADING_DAYS) -> np.ndarray:
+    """이동 실현 변동성 (연율화, 표본 표준편차)"""
+    daily = returns(prices)
+    out = np.full(daily.shape, np.nan)
+    if 2 <= window < daily.shape[1]:
+        out[:, window:] = sliding_window_view(daily[:, 1:], window, axis=1).std(axis=-1, ddof=1)
+    return out * np.sqrt(periods_per_year)
+
+def drawdown(prices) -> np.ndarray:
+    """누적 최고가 대비 하락률 (0 이하)"""
+    prices = as_matrix(prices)
+    peak = np.fmax.accumulate(prices, axis=1)
+    return prices / peak - 1
+
+def max_drawdown(prices) -> np.ndarray:
+    """티커별 최대 낙폭"""
+    return np.nanmin(drawdown(prices), axis=1)
+
+def position_in_range(prices, window: int) -> np.ndarray:
+    """이동 구간 최저~최고 사이 현재가 위치 (0 = 최저, 1 = 최고)"""
+    prices = as_matrix(prices)
+    high = rolling_max(prices, window)
+    low = rolling_min(prices, window)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return (prices - low) / (high - low)
+
+class IndicatorState:
+    """새 봉 하나씩 지표를 갱신하는 증분 계산기
+
+    최근 window개 종가만 링 버퍼로 보관하며, 이동평균은 누적합을 밀어 넣고 빼는
+    방식으로, 지수 이동평균과 누적 최고가는 재귀식으로 갱신한다. 한 봉 갱신 비용은
+    전체 이력 길이와 무관하다. 이동평균 누적합은 버퍼가 한 바퀴 돌 때마다 버퍼에서
+    다시 계산해 부동소수점 오차가 쌓이지 않게 한다. 결측 봉(거래정지)은 배치 함수와
+    같이 다룬다: 구간에 결측이 있으면 이동평균은 NaN, 지수 이동평균은 직전 값 유지.
+    """
+
+    def __init__(self, prices, sma_windows: Iterable[int] = (50, 200), ema_spans: Iterable[int] = (12, 26),
+                 range_window: int = TRADING_DAYS, vol_window: int = TRADING_DAYS - 1,
+                 periods_per_year: int = TRADING_DAYS):
+        history = as_matrix(prices)
+        self.sma_windows = tuple(sma_windows)
+        self.ema_spans = tuple(ema_spans)
+        self.range_window = range_window
+        self.vol_window = vol_window
+        self.periods_per_year = periods_per_year
+        self.window = max(self.sma_windows + (range_window, vol_window + 1))
+
+        n_tickers, n_days = history.shape
+        self._ring = np.full((n_tickers, self.window), np.nan)
+        self._count = 0  # 지금까지 받은 봉 수
+        tail = history[:, -self.window:]
+        start = n_days - tail.shape[1]
+        for offset in range(tail.shape[1]):
+            self._ring[:, (start + offset) % self.window] = tail[:, offset]
+        self._count = n_days
+
+        self._sums: Dict[int, np.ndarray] = {}
+        self._valid: Dict[int, np.ndarray] = {}  # 구간 내 결측이 아닌 봉 수
+        self._resync_sums()
+        self._emas = {span: ema(history, span)[:, -1] if n_days else np.full(n_tickers, np.nan)
+                      for span in self.ema_spans}
+        self._peak = np.nanmax(history, axis=1) if n_days else np.full(n_tickers, np.nan)
+
+    def _recent(self, length: int) -> np.ndarray:
+        """최근 length개 종가 (오래된 것부터)"""
+        slots = (self._count - length + np.arange(length)) % self.window
+        return self._ring[:, slots]
+
+    def _resync_sums(self) -> None:
+        for window in self.sma_windows:
+            recent = self._recent(window)
+            self._sums[window] = np.nansum(recent, axis=1)
+            self._valid[window] = np.count_nonzero(~np.isnan(recent), axis=1)
+
+    def update(self, bar) -> None:
+        """새 종가 한 봉 (티커 수 길이) 반영"""
+        bar = np.asarray(bar, dtype=float)
+        slot = self._count % self.window
+        present = ~np.isnan(bar)
+
+        for window in self.sma_windows:
+            if self._count >= window:
+                leaving = self._ring[:, (self._count - window) % self.window]
+            else:
+                leaving = np.full(bar.shape, np.nan)
+            self._sums[window] = self._sums[window] + np.where(present, bar, 0.0) - np.nan_to_num(leaving)
+            self._valid[window] = self._valid[window] + present.astype(int) - (~np.isnan(leaving)).astype(int)
+
+        for span in self.ema_spans:
+            alpha = 2.0 / (span + 1)
+            prev = self._emas[span]
+            # 결측일은 직전 값 유지 (배치 ema와 같은 규칙)
+            self._emas[span] = np.where(~present, prev, np.where(np.isnan(prev), bar, alpha * bar + (1 - alpha) * prev))
+
+        self._peak = np.fmax(self._peak, bar)
+        self._ring[:, slot] = bar
+        self._count += 1
+
+        if self._count % self.window == 0:
+            self._resync_sums()
+
+    def snapshot(self) -> Dict[str, np.ndarray]:
+        """현재 시점 지표 (지표명 -> 티커별 값)"""
+        close = self._ring[:, (self._count - 1) % self.window]
+        values = {'close': close}
+
+        for window in self.sma_windows:
+            values[f'sma_{window}'] = np.where(self._valid[window] == window, self._sums[window] / window, np.nan)
+        for span in self.ema_spans:
+            values[f'ema_{span}'] = self._emas[span]
+
+        span = min(self.range_window, self._count)
+        recent = self._recent(span)
+        high, low = recent.max(axis=1), recent.min(axis=1)
+        values['high'] = high
+        values['low'] = low
+        with np.errstate(divide='ignore', invalid='ignore'):
+            values['position_in_range'] = (close - low) / (high - low)
+
+        if self._count > self.vol_window >= 2:
+            recent = self._recent(self.vol_window + 1)
+            daily = recent[:, 1:] / recent[:, :-1] - 1
+            values['volatility'] = daily.std(axis=1, ddof=1) * np.sqrt(self.periods_per_year)
+        else:
+            values['volatility'] = np.full(close.shape, np.nan)
+
+        values['drawdown'] = close / self._peak - 1
+        return values
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+📡 시장 데이터 제공자
+yfinance 실시간 조회 / 픽스처 파일 기반 오프라인 조회를 같은 인터페이스로 제공
+"""
+
+import json
+import re
+from pathlib import Path
+from typing import Dict
+
+import pandas as pd
+
+class MarketDataUnavailable(LookupError):
+    """요청한 시장 데이터를 구할 수 없음"""
+
+class MarketDataProvider:
+    """시장 데이터 제공자 기본 클래스"""
+
+    def history(self, ticker: str, period: str = "1y", interval: str = "1d") -> pd.DataFrame:
+        """가격 이력 (yfinance history와 같은 열 구성)"""
+        raise NotImplementedError
+
+    def info(self, ticker: str) -> Dict:
+        """기업 정보 사전 (yfinance info와 같은 키)"""
+        raise NotImplementedError
+
+    def ticker(self, ticker: str) -> 'TickerView':
+        """yf.Ticker 처럼 쓸 수 있는 티커 뷰"""
+        return TickerView(self, ticker)
+
+class TickerView:
+    """yf.Ticker 호환 뷰 (info 속성, history 메서드)"""
+
+    def __init__(self, provider: MarketDataProvider, ticker: str):
+        self.provider = provider
+        self.ticker = ticker
+
+    @property
+    def info(self) -> Dict:
+        return self.provider.info(self.ticker)
+
+    def history(self, period: str = "1y", interval: str = "1d") -> pd.DataFrame:
+        return self.provider.history(self.ticker, period=period, interval=interval)
+
+class YFinanceProvider(MarketDataProvider):
+    """yfinance 실시간 조회"""
+
+    def __init__(self):
+        import yfinance as yf
+        self._yf = yf
+
+    def history(self, ticker: str, period: str = "1y", interval: str = "1d") -> pd.DataFrame:
+        hist = self._yf.Ticker(ticker).history(period=period, interval=interval)
+        if hist is None or len(hist) == 0:
+            raise MarketDataUnavailable(f"{ticker} 가격 이력 없음 ({period}/{interval})")
+        return hist
+
+    def info(self, ticker: str) -> Dict:
+        info = self._yf.Ticker(ticker).info
+        if not info:
+            raise MarketDataUnavailable(f"{ticker} 기업 정보 없음")
+        return dict(info)
+
+def fixture_stem(ticker: str) -> str:
+    """파일명으로 안전한 티커 표기 (^IXIC -> _IXIC, DX-Y.NYB -> DX-Y.NYB)"""
+    return re.sub(r'[^A-Za-z0-9.\-]', '_', ticker)
+
+class FixtureProvider(MarketDataProvider):
+    """픽스처 파일 기반 오프라인 제공자 (결정적, 네트워크 없음)
+
+    {TICKER}_{period}_{interval}.csv 와 {TICKER}_info.json 을 읽는다.
+    """
+
+    def __init__(self, fixture_dir: str):
+        self.fixture_dir = Path(fixture_dir)
+
+    def _history_path(self, ticker: str, period: str, interval: str) -> Path:
+        return self.fixture_dir / f"{fixture_stem(ticker)}_{period}_{interval}.csv"
+
+    def _info_path(self, ticker: str) -> Path:
+        return self.fixture_dir / f"{fixture_stem(ticker)}_info.json"
+
+    def history(self, ticker: str, period: str = "1y", interval: str = "1d") -> pd.DataFrame:
+        path = self._history_path(ticker, period, interval)
+        if not path.exists():
+            raise MarketDataUnavailable(f"픽스처 없음: {path}")
+        hist = pd.read_csv(path, index_col=0)
+        hist.index = pd.to_datetime(hist.index, utc=True)
+        hist.index.name = 'Date'
+        return hist
+
+    def info(self, ticker: str) -> Dict:
+        path = self._info_path(ticker)
+        if not path.exists():
+            raise MarketDataUnavailable(f"픽스처 없음: {path}")
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    def save_history(self, ticker: str, period: str, interval: str, hist: pd.DataFrame) -> None:
+        """가격 이력 픽스처 기록"""
+        self.fixture_dir.mkdir(parents=True, exist_ok=True)
+        hist.to_csv(self._history_path(ticker, period, interval))
+
+    def save_info(self, ticker: str, info: Dict) -> None:
+        """기업 정보 픽스처 기록"""
+        self.fixture_dir.mkdir(parents=True, exist_ok=True)
+        with open(self._info_path(ticker), 'w', encoding='utf-8') as f:
+            json.dump(info, f, ensure_ascii=False, indent=2, default=str)
@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+📼 오프라인 픽스처 기록
+MARKET_DATA_MODE=offline 이 읽는 픽스처 디렉터리를 만든다
+
+    python -m market_data.record                # yfinance 실데이터 기록 (네트워크 필요)
+    python -m market_data.record --synthetic    # 결정적 합성 데이터 생성 (네트워크 없음)
+
+저장소의 data/market_fixtures 는 --synthetic 으로 만든 것이다. 실데이터로 바꾸려면
+네트워크가 되는 환경에서 인자 없이 한 번 실행한다.
+"""
+
+import argparse
+import sys
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .providers import FixtureProvider, YFinanceProvider
+
+DEFAULT_FIXTURE_DIR = Path(__file__).resolve().parent.parent / "data" / "market_fixtures"
+
+# prototype/apple_analysis.py, advanced_analysis/current_market_analysis.py 가 조회하는 키
+FIXTURE_HISTORIES: List[Tuple[str, str, str]] = [
+    ("AAPL", "6mo", "1d"),
+    ("AAPL", "1y", "1d"),
+    ("AAPL", "max", "1d"),
+    ("^IXIC", "1y", "1d"),
+    ("^GSPC", "1y", "1d"),
+    ("^VIX", "1y", "1d"),
+    ("DX-Y.NYB", "1y", "1d"),
+]
+FIXTURE_INFOS: List[str] = ["AAPL"]
+
+# 합성 데이터 설정: 시작가, 일간 추세, 일간 변동성, 평균회귀 여부
+_SYNTHETIC_PARAMS: Dict[str, Tuple[float, float, float, bool]] = {
+    "AAPL": (150.0, 0.0006, 0.017, False),
+    "^IXIC": (14000.0, 0.0005, 0.013, False),
+    "^GSPC": (4800.0, 0.0004, 0.010, False),
+    "^VIX": (17.0, 0.0, 0.06, True),
+    "DX-Y.NYB": (103.0, 0.0, 0.004, True),
+}
+_SYNTHETIC_DAYS = {"6mo": 126, "1y": 252, "max": 252 * 5}
+_SYNTHETIC_END = "2026-10-15"
+
+_SYNTHETIC_INFO = {
+    "AAPL": {
+        "symbol": "AAPL",
+        "shortName": "Apple Inc.",
+        "sector": "Technology",
+        "marketCap": 3.4e12,
+        "trailingPE": 33.5,
+        "priceToBook": 48.0,
+        "revenueGrowth": 0.06,
+        "profitMargins": 0.24,
+        "returnOnEquity": 1.45,
+        "debtToEquity": 150.0,
+        "totalCash": 65e9,
+        "_synthetic": True,
+    }
+}
+
+def synthetic_history(ticker: str, period: str) -> pd.DataFrame:
+    """결정적 합성 가격 이력 (yfinance history와 같은 열 구성)
+
+    티커마다 고정 시드로 전체 이력을 만들고 기간별로 뒷부분을 잘라, 기간이 달라도
+    겹치는 날짜의 가격은 같다.
+    """
+    start, drift, vol, mean_reverting = _SYNTHETIC_PARAMS[ticker]
+    total = max(_SYNTHETIC_DAYS.values())
+    rng = np.random.default_rng(sum(map(ord, ticker)))
+    shocks = rng.normal(drift, vol, total)
+
+    if mean_reverting:
+        log_level = np.empty(total)
+        log_level[0] = np.log(start)
+        for t in range(1, total):
+            log_level[t] = log_level[t - 1] + 0.05 * (np.log(start) - log_level[t - 1]) + shocks[t]
+        close = np.exp(log_level)
+    else:
+        close = start * np.exp(np.cumsum(shocks))
+
+    gap = rng.normal(0, vol / 3, total)
+    open_ = close * np.exp(gap)
+    spread = np.abs(rng.normal(0, vol / 2, total))
+    high = np.maximum(open_, close) * (1 + spread)
+    low = np.minimum(open_, close) * (1 - spread)
+    volume = rng.integers(40_000_000, 90_000_000, total) if not ticker.startswith(("^", "DX")) \
+        else np.zeros(total, dtype=int)
+
+    index = pd.bdate_range(end=_SYNTHETIC_END, periods=total, tz="America/New_York", name="Date")
+    hist = pd.DataFrame({
+        "Open": open_.round(4),
+        "High": high.round(4),
+        "Low": low.round(4),
+        "Close": close.round(4),
+        "Volume": volume,
+        "Dividends": 0.0,
+        "Stock Splits": 0.0,
+    }, index=index)
+    return hist.iloc[-_SYNTHETIC_DAYS[period]:]
+
+def record_synthetic(fixture_dir: str) -> int:
+    """합성 픽스처 기록, 기록한 파일 수 반환"""
+    fixtures = FixtureProvider(fixture_dir)
+    for ticker, period, interval in FIXTURE_HISTORIES:
+        fixtures.save_history(ticker, period, interval, synthetic_history(ticker, period))
+    for ticker in FIXTURE_INFOS:
+        fixtures.save_info(ticker, _SYNTHETIC_INFO[ticker])
+    return len(FIXTURE_HISTORIES) + len(FIXTURE_INFOS)
+
+def record_live(fixture_dir: str) -> int:
+    """yfinance 조회 결과를 픽스처로 기록, 기록한 파일 수 반환
+
+    로컬 캐시에 남은 값을 다시 쓰지 않도록 캐시를 거치지 않고 직접 조회한다.
+    """
+    provider = YFinanceProvider()
+    fixtures = FixtureProvider(fixture_dir)
+    written = 0
+    for ticker, period, interval in FIXTURE_HISTORIES:
+        try:
+            fixtures.save_history(ticker, period, interval, provider.history(ticker, period=period, interval=interval))
+            written += 1
+        except Exception as e:
+            print(f"⚠️ {ticker} {period}/{interval} 기록 실패: {e}")
+    for ticker in FIXTURE_INFOS:
+        try:
+            fixtures.save_info(ticker, provider.info(ticker))
+            written += 1
+        except Exception as e:
+            print(f"⚠️ {ticker} 기업 정보 기록 실패: {e}")
+    return written
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="오프라인 시장 데이터 픽스처 기록")
+    parser.add_argument("--fixture-dir", default=str(DEFAULT_FIXTURE_DIR))
+    parser.add_argument("--synthetic", action="store_true", help="네트워크 없이 결정적 합성 데이터 생성")
+    args = parser.parse_args(argv)
+
+    written = record_synthetic(args.fixture_dir) if args.synthetic else record_live(args.fixture_dir)
+    expected = len(FIXTURE_HISTORIES) + len(FIXTURE_INFOS)
+    print(f"📼 픽스처 {written}/{expected}개 기록: {args.fixture_dir}")
+    return 0 if written == expected else 1
+
+if __name__ == "__main__":
+    sys.exit(main())
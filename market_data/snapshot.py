@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+"""
+📸 다중 티커 시장 스냅샷
+여러 지수를 병렬로 조회하고, 하나로 정렬한 종가 표에서 변화율을 한 번에 계산
+"""
+
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Union
+
+import numpy as np
+import pandas as pd
+
+from .providers import MarketDataProvider
+
+# 원래 스냅샷과 같은 규칙: 253번째 거래일 종가 대비 (데이터가 모자라면 0)
+YTD_OFFSET = 252
+
+@dataclass
+class MarketSnapshot:
+    """정렬된 종가 표와 티커별 변화율"""
+    prices: pd.DataFrame  # 날짜 x 이름
+    current: np.ndarray
+    year_change: np.ndarray
+    ytd_change: np.ndarray
+    failures: Dict[str, str] = field(default_factory=dict)  # 이름 -> 실패 사유
+    elapsed: float = 0.0
+
+    @property
+    def names(self) -> List[str]:
+        return list(self.prices.columns)
+
+    def as_dict(self) -> Dict[str, Dict[str, float]]:
+        """이름 -> {'current', 'year_change', 'ytd_change'} (기존 스냅샷 형식)"""
+        return {
+            name: {
+                'current': float(self.current[i]),
+                'year_change': float(self.year_change[i]),
+                'ytd_change': float(self.ytd_change[i])
+            }
+            for i, name in enumerate(self.names)
+        }
+
+def align_closes(closes: Dict[str, pd.Series]) -> pd.DataFrame:
+    """티커별 종가를 날짜 기준 하나의 표로 정렬 (거래일이 다르면 NaN)"""
+    columns = {}
+    for name, close in closes.items():
+        index = pd.DatetimeIndex(close.index)
+        if index.tz is not None:
+            index = index.tz_localize(None)
+        columns[name] = pd.Series(close.to_numpy(dtype=float), index=index.normalize())
+    return pd.DataFrame(columns).sort_index()
+
+def compute_changes(prices: pd.DataFrame):
+    """정렬된 종가 표에서 (현재가, 1년 변화율 %, YTD 변화율 %) 벡터 계산
+
+    각 열은 자기 유효 값만으로 계산하므로 티커를 하나씩 처리한 결과와 같다.
+    """
+    values = prices.to_numpy(dtype=float)
+    n_cols = values.shape[1]
+    if n_cols == 0 or values.shape[0] == 0:
+        empty = np.zeros(n_cols)
+        return empty, empty.copy(), empty.copy()
+
+    valid = ~np.isnan(values)
+    cols = np.arange(n_cols)
+    rank = np.cumsum(valid, axis=0)
+
+    last_row = values.shape[0] - 1 - np.argmax(valid[::-1], axis=0)
+    first_row = np.argmax(valid, axis=0)
+    current = values[last_row, cols]
+    first = values[first_row, cols]
+
+    ytd_hit = valid & (rank == YTD_OFFSET + 1)
+    has_ytd = ytd_hit.any(axis=0)
+    base = values[np.argmax(ytd_hit, axis=0), cols]
+
+    year_change = (current / first - 1) * 100
+    with np.errstate(divide='ignore', invalid='ignore'):
+        ytd_change = np.where(has_ytd, (current / base - 1) * 100, 0.0)
+    return current, year_change, ytd_change
+
+class SnapshotEngine:
+    """병렬 스냅샷 조회기
+
+    최대 max_workers개를 동시에 조회하고, 조회가 시작된 뒤 timeout 초가 지난 소스는
+    실패로 처리한다 (대기열에 있는 동안은 시간에 포함하지 않음). 실패한 소스는
+    failures에 모으고 나머지로 스냅샷을 만든다.
+    """
+
+    def __init__(self, provider: MarketDataProvider, max_workers: int = 8,
+                 timeout: Optional[float] = 10.0, period: str = "1y", interval: str = "1d"):
+        self.provider = provider
+        self.max_workers = max_workers
+        self.timeout = timeout
+        self.period = period
+        self.interval = interval
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix="snapshot")
+            return self._executor
+
+    def _fetch_close(self, ticker: str, started: Dict[str, float], name: str) -> pd.Series:
+        started[name] = time.monotonic()
+        hist = self.provider.history(ticker, period=self.period, interval=self.interval)
+        return hist['Close']
+
+    def fetch(self, tickers: Union[Dict[str, str], Iterable[str]]) -> MarketSnapshot:
+        """티커 목록(또는 이름 -> 티커 사전) 스냅샷"""
+        if not isinstance(tickers, dict):
+            tickers = {ticker: ticker for ticker in tickers}
+
+        t0 = time.monotonic()
+        executor = self._get_executor()
+        started: Dict[str, float] = {}
+        futures = {
+            executor.submit(self._fetch_close, ticker, started, name): name
+            for name, ticker in tickers.items()
+        }
+
+        closes: Dict[str, pd.Series] = {}
+        failures: Dict[str, str] = {}
+        pending = set(futures)
+        while pending:
+            poll = None
+            if self.timeout is not None:
+                now = time.monotonic()
+                running = [started[futures[f]] for f in pending if futures[f] in started]
+                poll = max(0.0, min(running) + self.timeout - now) if running else self.timeout
+            done, pending = wait(pending, timeout=poll, return_when=FIRST_COMPLETED)
+
+            for future in done:
+                name = futures[future]
+                try:
+                    close = future.result()
+                except Exception as e:
+                    failures[name] = f"{type(e).__name__}: {e}"
+                    continue
+                if len(close) == 0:
+                    failures[name] = "빈 가격 이력"
+                else:
+                    closes[name] = close
+
+            if self.timeout is not None:
+                now = time.monotonic()
+                for future in list(pending):
+                    name = futures[future]
+                    if name in started and now - started[name] >= self.timeout:
+                        future.cancel()
+                        pending.discard(future)
+                        failures[name] = f"시간 초과 ({self.timeout}s)"
+
+        # 요청 순서 유지
+        ordered = {name: closes[name] for name in tickers if name in closes}
+        prices = align_closes(ordered)
+        current, year_change, ytd_change = compute_changes(prices)
+        return MarketSnapshot(
+            prices=prices,
+            current=current,
+            year_change=year_change,
+            ytd_change=ytd_change,
+            failures=failures,
+            elapsed=time.monotonic() - t0
+        )
+
+    def close(self) -> None:
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False, cancel_futures=True)
+                self._executor = None
@@ -4,21 +4,29 @@
 Apple Stock: When the Hell Should We Buy This Thing?
 """
 
-import yfinance as yf
+import sys
 import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
+from pathlib import Path
 from investor_insight_processor import InvestorInsightProcessor
 import matplotlib.pyplot as plt
 import warnings
 warnings.filterwarnings('ignore')
 
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from market_data import MarketDataProvider, create_market_data
+from market_data import indicators
+from advanced_ai.backtester import Backtester, BacktestEvent, sentiment_direction
+
 class AppleStockAnalyst:
     """Apple 주식 전문 분석가 (거장들의 머리를 합친 놈)"""
 
-    def __init__(self):
+    def __init__(self, data_provider: MarketDataProvider = None):
         self.processor = InvestorInsightProcessor(data_dir="../data/investors")
-        self.aapl = yf.Ticker("AAPL")
+        # 캐시된 시장 데이터 (MARKET_DATA_MODE=offline 이면 픽스처만 사용)
+        self.data_provider = data_provider or create_market_data()
+        self.aapl = self.data_provider.ticker("AAPL")
 
     def get_aapl_insights(self):
         """Apple에 대한 거장들의 인사이트만 추출"""
@@ -85,13 +93,14 @@ class AppleStockAnalyst:
         # 1년간 주가 데이터
         hist = self.aapl.history(period="1y")
 
-        current_price = hist['Close'].iloc[-1]
-        ma_50 = hist['Close'].rolling(50).mean().iloc[-1]
-        ma_200 = hist['Close'].rolling(200).mean().iloc[-1]
+        closes = indicators.as_matrix(hist['Close'])
+        current_price = closes[0, -1]
+        ma_50 = indicators.sma(closes, 50)[0, -1]
+        ma_200 = indicators.sma(closes, 200)[0, -1]
 
-        # 52주 high/low
-        week_52_high = hist['Close'].max()
-        week_52_low = hist['Close'].min()
+        # 52주 high/low (1년 전체 구간)
+        week_52_high = indicators.rolling_max(closes, closes.shape[1])[0, -1]
+        week_52_low = indicators.rolling_min(closes, closes.shape[1])[0, -1]
 
         print(f"🏷️  현재 가격: ${current_price:.2f}")
         print(f"📊 52주 최고: ${week_52_high:.2f}")
@@ -108,7 +117,7 @@ class AppleStockAnalyst:
             print(f"🔄 조정 중 - 기회일 수도 있어!")
 
         # 52주 대비 현재 위치
-        position_52w = (current_price - week_52_low) / (week_52_high - week_52_low)
+        position_52w = indicators.position_in_range(closes, closes.shape[1])[0, -1]
         print(f"📍 52주 대비 위치: {position_52w*100:.1f}% (0% = 최저, 100% = 최고)")
 
         if position_52w < 0.3:
@@ -131,6 +140,18 @@ class AppleStockAnalyst:
 
         print(f"📚 총 {len(insights)}개의 Apple 관련 인사이트 발견!")
 
+        # 실제 AAPL 가격 이력으로 선행 수익률 계산
+        hist = self.aapl.history(period="max")
+        backtester = Backtester(pd.DataFrame({'AAPL': hist['Close']}), horizons=(21, 63, 252))
+        events = [
+            BacktestEvent(date=insight.date_said, ticker='AAPL', investor=insight.investor,
+                          direction=sentiment_direction(insight.sentiment),
+                          confidence=insight.confidence_score, event_id=insight.id)
+            for insight in insights
+        ]
+        result = backtester.run(events)
+        outcomes = {row.event_id: row for row in result.events.itertuples()}
+
         # 각 인사이트별 백테스팅
         for insight in insights:
             investor_profile = self.processor.get_investor_profile(insight.investor)
@@ -141,17 +162,25 @@ class AppleStockAnalyst:
             print(f"📖 내용: {insight.content}")
             print(f"🎯 감성: {insight.sentiment}")
 
-            # 해당 날짜 이후의 수익률 계산 (가상)
-            print(f"💸 백테스팅 결과: '이때 샀다면...' (상상 속에서)")
-
-            if insight.sentiment == 'strongly_bullish':
-                print("🚀 강력 매수 추천 - 아마 엄청났을 거야!")
-            elif insight.sentiment == 'bullish':
-                print("📈 매수 추천 - 꽤 잘됐을 거야!")
-            elif insight.sentiment == 'cautiously_bullish':
-                print("🤔 조심스러운 매수 - 그래도 났을 거야!")
-            else:
-                print("😐 중립 - 그냥 그랬을 거야...")
+            outcome = outcomes.get(insight.id)
+            if outcome is None:
+                print("❓ 그 날짜의 가격 데이터가 없어...")
+                continue
+
+            print(f"💸 백테스팅 결과: '이때 샀다면...' (진입가 ${outcome.entry_price:.2f})")
+            for horizon, label in ((21, '1개월'), (63, '3개월'), (252, '1년')):
+                forward = getattr(outcome, f'return_{horizon}d')
+                if np.isnan(forward):
+                    print(f"   ⏳ {label}: 아직 결과 없음")
+                else:
+                    print(f"   📈 {label}: {forward * 100:+.1f}%")
+            print(f"   📉 보유 중 최대 낙폭: {outcome.max_drawdown * 100:.1f}%")
+
+        if not result.summary.empty:
+            print(f"\n🏆 투자자별 적중률 (1년 기준):")
+            for investor, row in result.summary.iterrows():
+                print(f"   👤 {investor}: {row['hit_rate_252d'] * 100:.0f}% "
+                      f"(평균 {row['avg_return_252d'] * 100:+.1f}%, {int(row['events'])}건)")
 
     def generate_buy_signal(self):
         """Apple 매수 신호 생성 (거장들의 합체 의견)"""
@@ -160,12 +189,12 @@ class AppleStockAnalyst:
 
         # 기술적 지표
         hist = self.aapl.history(period="6mo")
-        current_price = hist['Close'].iloc[-1]
-        ma_50 = hist['Close'].rolling(50).mean().iloc[-1]
+        closes = indicators.as_matrix(hist['Close'])
+        current_price = closes[0, -1]
+        ma_50 = indicators.sma(closes, 50)[0, -1]
 
-        # 변동성 계산
-        returns = hist['Close'].pct_change().dropna()
-        volatility = returns.std() * np.sqrt(252) * 100  # 연율화 변동성
+        # 변동성 계산 (6개월 전체 일간 수익률)
+        volatility = indicators.realized_volatility(closes, closes.shape[1] - 1)[0, -1] * 100  # 연율화 변동성
 
         # 펀더멘털
         info = self.aapl.info
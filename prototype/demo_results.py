@@ -66,7 +66,7 @@ def main():
     print("="*60)
 
     # 거장 프로필
-    profile = processor.get_investor_profile('peter_ynch')
+    profile = processor.get_investor_profile('peter_lynch')
     print(f"\n👤 이름: {profile['name']}")
     print(f"📝 직책: {profile['title']}")
     print(f"💡 투자 철학: {profile['investment_philosophy']}")
@@ -75,7 +75,7 @@ def main():
         print(f"   {i}. \"{quote}\"")
 
     # 인사이트 분석 (2개만)
-    insights = processor.get_investor_insights('peter_ynch')
+    insights = processor.get_investor_insights('peter_lynch')
     print(f"\n📚 총 {len(insights)}개의 인사이트 발견")
     print("\n" + "-"*50)
     print("🔍 대표 인사이트 2개 분석 결과")
@@ -105,7 +105,7 @@ def main():
 
     total_insights = (
         len(processor.get_investor_insights('warren_buffett')) +
-        len(processor.get_investor_insights('peter_ynch')) +
+        len(processor.get_investor_insights('peter_lynch')) +
         len(processor.get_investor_insights('howard_marks'))
     )
 
@@ -113,7 +113,7 @@ def main():
     print(f"   • 총 분석한 거장: 3명")
     print(f"   • 총 인사이트 수: {total_insights}개")
     print(f"   • 워런 버핏: {len(processor.get_investor_insights('warren_buffett'))}개")
-    print(f"   • 피터 린치: {len(processor.get_investor_insights('peter_ynch'))}개")
+    print(f"   • 피터 린치: {len(processor.get_investor_insights('peter_lynch'))}개")
     print(f"   • 하워드 막스: {len(processor.get_investor_insights('howard_marks'))}개")
 
     print(f"\n🎯 주요 발견:")
@@ -6,6 +6,8 @@ Investor Insight Processing and Stock Matching Prototype
 
 import json
 import re
+import sys
+from pathlib import Path
 from typing import List, Dict, Any, Optional
 from dataclasses import dataclass
 from datetime import datetime
@@ -14,6 +16,16 @@ import yfinance as yf
 import pandas as pd
 from collections import defaultdict
 
+# advanced_ai 모듈 경로 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from advanced_ai.pattern_matcher import MultiPatternMatcher
+
+try:
+    from .symbol_master import SymbolMaster
+except ImportError:  # 스크립트로 직접 실행할 때
+    from symbol_master import SymbolMaster
+
 @dataclass
 class InvestorInsight:
     """거장 인사이트 데이터 클래스"""
@@ -43,13 +55,18 @@ class StockMatch:
 class InvestorInsightProcessor:
     """거장 인사이트 처리기"""
 
-    def __init__(self, data_dir: str = "data/investors"):
+    def __init__(self, data_dir: str = "data/investors", symbol_file: Optional[str] = None):
         self.data_dir = data_dir
+        self.symbol_file = symbol_file  # 종목 마스터 CSV/Parquet (없으면 내장 사전)
         self.investors_data = {}
         self.load_investor_data()
 
-        # 종목명-티커 매핑 사전
-        self.stock_name_to_ticker = self.build_stock_mapping()
+        # 종목 마스터 (티커 <-> 회사명 양방향)
+        self.symbol_master = self.build_stock_mapping()
+        self.stock_name_to_ticker = self.symbol_master.as_dict()
+
+        # 종목명 매칭 오토마톤 (한 번만 구축)
+        self.stock_matcher = self.build_stock_matcher()
 
         # 투자 주제별 관련 키워드
         self.theme_keywords = {
@@ -77,8 +94,11 @@ class InvestorInsightProcessor:
 
         print(f"✅ {len(self.investors_data)}명의 거장 데이터 로드 완료")
 
-    def build_stock_mapping(self) -> Dict[str, str]:
-        """주요 기업명-티커 매핑 사전 구축"""
+    def build_stock_mapping(self) -> SymbolMaster:
+        """종목 마스터 구축 (symbol_file이 있으면 파일에서, 없으면 주요 기업 사전)"""
+        if self.symbol_file:
+            return SymbolMaster.load(self.symbol_file)
+
         mapping = {
             # 기술주
             'Apple': 'AAPL', 'Microsoft': 'MSFT', 'Amazon': 'AMZN', 'Google': 'GOOGL',
@@ -110,7 +130,15 @@ class InvestorInsightProcessor:
             'Dunkin\' Donuts': 'DNKN', 'Dunkin\' Brands': 'DNKN'
         }
 
-        return mapping
+        return SymbolMaster.from_mapping(mapping)
+
+    def build_stock_matcher(self) -> MultiPatternMatcher:
+        """종목명 사전 전체를 단어 경계 인식 오토마톤으로 구축"""
+        matcher = MultiPatternMatcher(word_boundary=True)
+        for company_name, ticker in self.symbol_master.items():
+            matcher.add(company_name, 'stock', ticker)
+        matcher.build()
+        return matcher
 
     def get_investor_insights(self, investor_slug: str) -> List[InvestorInsight]:
         """특정 거장의 모든 인사이트 가져오기"""
@@ -142,10 +170,9 @@ class InvestorInsightProcessor:
         """텍스트에서 언급된 종목 추출"""
         mentioned_stocks = []
 
-        # 1. 직접 회사명 매칭
-        for company_name, ticker in self.stock_name_to_ticker.items():
-            if company_name.lower() in text.lower():
-                mentioned_stocks.append(ticker)
+        # 1. 직접 회사명 매칭 (텍스트를 한 번만 훑음)
+        for match in self.stock_matcher.find_all(text):
+            mentioned_stocks.append(match.value)
 
         # 2. 티커 패턴 찾기 (대문자 1-5자)
         ticker_pattern = r'\b[A-Z]{1,5}\b'
@@ -210,14 +237,7 @@ class InvestorInsightProcessor:
         direct_mentions = self.extract_stock_mentions(insight.content)
         for ticker in direct_mentions:
             # 회사명 찾기 (티커 -> 회사명)
-            company_name = None
-            for name, t in self.stock_name_to_ticker.items():
-                if t == ticker:
-                    company_name = name
-                    break
-
-            if not company_name:
-                company_name = ticker  # 티커만 있는 경우
+            company_name = self.symbol_master.name_for(ticker) or ticker  # 티커만 있는 경우
 
             match = StockMatch(
                 ticker=ticker,
@@ -278,7 +298,7 @@ def main():
         print("\n" + "=" * 50)
         print("분석할 거장을 선택하세요:")
         print("1. Warren Buffett (warren_buffett)")
-        print("2. Peter Lynch (peter_ynch)")
+        print("2. Peter Lynch (peter_lynch)")
         print("3. Howard Marks (howard_marks)")
         print("q. 종료")
 
@@ -289,7 +309,7 @@ def main():
 
         investor_map = {
             '1': 'warren_buffett',
-            '2': 'peter_ynch',
+            '2': 'peter_lynch',
             '3': 'howard_marks'
         }
 
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+종목 마스터 (티커 ↔ 회사명/별칭 양방향 색인)
+Symbol Master: bidirectional ticker <-> company name/alias index
+"""
+
+import csv
+import sys
+from array import array
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+class SymbolMaster:
+    """양방향 종목 마스터
+
+    티커와 이름은 각각 한 번만 (intern 하여) 저장하고, 이름 → 티커 / 티커 → 대표 이름
+    연결은 정수 배열로 보관한다. 두 방향 조회 모두 사전 한 번 + 배열 인덱싱이다.
+    이름 조회는 대소문자를 무시하며, 같은 이름이 다시 나오면 처음 등록이 유지된다.
+    """
+
+    def __init__(self):
+        self._tickers: List[str] = []
+        self._ticker_index: Dict[str, int] = {}
+        self._names: List[str] = []  # 원래 표기
+        self._name_index: Dict[str, int] = {}  # 소문자 이름 -> 이름 번호
+        self._name_ticker = array('i')  # 이름 번호 -> 티커 번호
+        self._primary_name = array('i')  # 티커 번호 -> 대표 이름 번호 (-1 = 없음)
+
+    def add(self, ticker: str, name: str, aliases: Iterable[str] = ()) -> None:
+        """종목 등록 (name이 대표 이름, aliases는 추가 별칭)"""
+        ticker = sys.intern(ticker.strip())
+        ticker_idx = self._ticker_index.get(ticker)
+        if ticker_idx is None:
+            ticker_idx = len(self._tickers)
+            self._tickers.append(ticker)
+            self._ticker_index[ticker] = ticker_idx
+            self._primary_name.append(-1)
+
+        for alias in (name, *aliases):
+            alias = alias.strip()
+            key = alias.lower()
+            if not alias or key in self._name_index:
+                continue
+            name_idx = len(self._names)
+            self._names.append(sys.intern(alias))
+            self._name_index[key] = name_idx
+            self._name_ticker.append(ticker_idx)
+            if self._primary_name[ticker_idx] < 0:
+                self._primary_name[ticker_idx] = name_idx
+
+    def ticker_for(self, name: str) -> Optional[str]:
+        """이름/별칭 -> 티커"""
+        name_idx = self._name_index.get(name.lower())
+        return None if name_idx is None else self._tickers[self._name_ticker[name_idx]]
+
+    def name_for(self, ticker: str) -> Optional[str]:
+        """티커 -> 대표 이름"""
+        ticker_idx = self._ticker_index.get(ticker)
+        if ticker_idx is None or self._primary_name[ticker_idx] < 0:
+            return None
+        return self._names[self._primary_name[ticker_idx]]
+
+    def aliases_for(self, ticker: str) -> List[str]:
+        """티커의 모든 이름 (등록 순서, 전체 순회이므로 빈번한 조회용은 아님)"""
+        ticker_idx = self._ticker_index.get(ticker)
+        if ticker_idx is None:
+            return []
+        return [self._names[i] for i, t in enumerate(self._name_ticker) if t == ticker_idx]
+
+    def items(self) -> Iterator[Tuple[str, str]]:
+        """(이름, 티커) 순회"""
+        for name, ticker_idx in zip(self._names, self._name_ticker):
+            yield name, self._tickers[ticker_idx]
+
+    def as_dict(self) -> Dict[str, str]:
+        """이름 -> 티커 사전"""
+        return dict(self.items())
+
+    def __contains__(self, ticker: str) -> bool:
+        return ticker in self._ticker_index
+
+    def __len__(self) -> int:
+        return len(self._tickers)
+
+    @classmethod
+    def from_mapping(cls, mapping: Dict[str, str]) -> 'SymbolMaster':
+        """이름 -> 티커 사전으로 생성"""
+        master = cls()
+        for name, ticker in mapping.items():
+            master.add(ticker, name)
+        return master
+
+    @classmethod
+    def from_records(cls, records: Iterable[Dict]) -> 'SymbolMaster':
+        """ticker, name, aliases('|' 구분) 레코드로 생성"""
+        master = cls()
+        for record in records:
+            aliases = record.get('aliases') or ''
+            if isinstance(aliases, str):
+                aliases = aliases.split('|')
+            master.add(str(record['ticker']), str(record['name']), aliases)
+        return master
+
+    @classmethod
+    def from_csv(cls, path: str) -> 'SymbolMaster':
+        """CSV 파일 (ticker,name,aliases 열)에서 로드"""
+        with open(path, 'r', encoding='utf-8', newline='') as f:
+            return cls.from_records(csv.DictReader(f))
+
+    @classmethod
+    def from_parquet(cls, path: str) -> 'SymbolMaster':
+        """Parquet 파일 (ticker,name,aliases 열)에서 로드"""
+        import pandas as pd
+
+        frame = pd.read_parquet(path)
+        if 'aliases' not in frame.columns:
+            frame['aliases'] = ''
+        return cls.from_records(frame[['ticker', 'name', 'aliases']].fillna('').to_dict('records'))
+
+    @classmethod
+    def load(cls, path: str) -> 'SymbolMaster':
+        """확장자에 따라 CSV/Parquet 로드"""
+        if Path(path).suffix.lower() == '.parquet':
+            return cls.from_parquet(path)
+        return cls.from_csv(path)
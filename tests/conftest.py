@@ -0,0 +1,5 @@
+import sys
+from pathlib import Path
+
+# 저장소 루트를 import 경로에 추가 (advanced_ai, backend, market_data 패키지)
+sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -0,0 +1,92 @@
+import json
+import time
+
+import pytest
+
+pytest.importorskip('fastapi')
+pytest.importorskip('httpx')
+
+from fastapi.testclient import TestClient
+
+from advanced_ai.investor_brain import WarrenBuffettBrain
+from backend import main
+
+COMPANY = {
+    'ticker': 'CACHE',
+    'name': 'Cache Test Co',
+    'sector': 'Technology',
+    'pe_ratio': 18.0,
+    'pb_ratio': 3.0,
+    'roe': 0.22,
+    'debt_equity': 0.4,
+    'revenue_growth': 0.12
+}
+
+@pytest.fixture
+def client():
+    main.analysis_cache.clear()
+    with TestClient(main.app) as client:
+        yield client
+
+def _analyze(client):
+    response = client.post('/api/analyze', json={'company': COMPANY, 'investors': ['warren_buffett']})
+    assert response.status_code == 200
+    return response.json()
+
+def _stats(client):
+    return client.get('/api/cache/stats').json()
+
+def test_repeated_request_is_served_from_cache(client):
+    first = _analyze(client)
+    before = _stats(client)
+    assert _analyze(client) == first
+    assert _stats(client)['hits'] == before['hits'] + 1
+
+def test_learn_invalidates_cached_analysis(client):
+    first = _analyze(client)
+    _analyze(client)
+
+    learned = client.post('/api/learn', json={
+        'investor': 'warren_buffett',
+        'action': first['decisions'][0]['action'],
+        'confidence': 0.95,
+        'actual_outcome': -0.5
+    })
+    assert learned.status_code == 200
+    assert learned.json()['version'] > 0
+
+    before = _stats(client)
+    after = _analyze(client)
+    stats = _stats(client)
+    assert stats['hits'] == before['hits']
+    assert stats['misses'] == before['misses'] + 1
+
+    # 새 버전으로 다시 채워진 결과는 다시 캐시에서 나온다
+    assert _analyze(client) == after
+    assert _stats(client)['hits'] == stats['hits'] + 1
+
+def test_stream_caches_decisions_in_investor_order(client, monkeypatch):
+    # 버핏이 가장 늦게 끝나도록 (완료 순서 != 거장 순서)
+    original = WarrenBuffettBrain.analyze_company
+
+    def slow(self, company, context):
+        time.sleep(0.05)
+        return original(self, company, context)
+
+    monkeypatch.setattr(WarrenBuffettBrain, 'analyze_company', slow)
+    investors = ['warren_buffett', 'peter_lynch', 'george_soros']
+
+    streamed = client.post('/api/analyze/stream', json={'companies': [COMPANY], 'investors': investors})
+    events = [json.loads(line) for line in streamed.text.splitlines()]
+    assert [e['decision']['investor'] for e in events if e['type'] == 'decision'][-1] == 'Warren Buffett'
+    consensus = next(e for e in events if e['type'] == 'consensus')
+
+    before = _stats(client)
+    cached = client.post('/api/analyze', json={'company': COMPANY, 'investors': investors}).json()
+    assert _stats(client)['hits'] == before['hits'] + 1
+
+    main.analysis_cache.clear()
+    cold = client.post('/api/analyze', json={'company': COMPANY, 'investors': investors}).json()
+    assert cached == cold
+    assert [d['investor'] for d in cold['decisions']] == ['Warren Buffett', 'Peter Lynch', 'George Soros']
+    assert consensus['consensus_confidence'] == cold['consensus_confidence']
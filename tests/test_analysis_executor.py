@@ -0,0 +1,69 @@
+import threading
+import time
+
+import pytest
+
+pytest.importorskip('fastapi')
+pytest.importorskip('httpx')
+
+from fastapi.testclient import TestClient
+
+from advanced_ai.investor_brain import WarrenBuffettBrain
+from backend import main
+
+COMPANY = {
+    'ticker': 'HANG',
+    'name': 'Hung Brain Co',
+    'sector': 'Technology',
+    'pe_ratio': 18.0,
+    'pb_ratio': 3.0,
+    'roe': 22.0,
+    'debt_equity': 0.4,
+    'revenue_growth': 12.0
+}
+
+@pytest.fixture
+def blocked_client(monkeypatch):
+    """작업자 하나, 짧은 제한 시간, 풀어줄 때까지 멈추는 버핏 뇌"""
+    release = threading.Event()
+
+    def hang(self, company, context):
+        release.wait(10)
+        raise RuntimeError("released")
+
+    monkeypatch.setattr(main, 'ANALYSIS_MAX_WORKERS', 1)
+    monkeypatch.setattr(main, 'ANALYSIS_INVESTOR_TIMEOUT', 0.2)
+    monkeypatch.setattr(WarrenBuffettBrain, 'analyze_company', hang)
+    main.analysis_cache.clear()
+    try:
+        with TestClient(main.app) as client:
+            yield client
+    finally:
+        release.set()
+
+def _analyze(client, investors):
+    return client.post('/api/analyze', json={'company': COMPANY, 'investors': investors})
+
+def test_requests_fail_fast_when_all_workers_hang(blocked_client):
+    # 첫 요청의 작업이 유일한 작업자를 붙잡은 채 시간 초과
+    assert _analyze(blocked_client, ['warren_buffett']).status_code == 503
+
+    started = time.perf_counter()
+    response = _analyze(blocked_client, ['warren_buffett', 'george_soros'])
+    elapsed = time.perf_counter() - started
+
+    assert response.status_code == 503
+    assert elapsed < 2.0
+    metrics = blocked_client.get('/metrics').text
+    assert 'stockoracle_investors_skipped_total{investor="george_soros",reason="saturated"}' in metrics
+
+def test_failing_brain_is_skipped(monkeypatch):
+    def boom(self, company, context):
+        raise RuntimeError("boom")
+
+    monkeypatch.setattr(WarrenBuffettBrain, 'analyze_company', boom)
+    main.analysis_cache.clear()
+    with TestClient(main.app) as client:
+        response = _analyze(client, ['warren_buffett', 'george_soros'])
+        assert response.status_code == 200
+        assert [d['investor'] for d in response.json()['decisions']] == ['George Soros']
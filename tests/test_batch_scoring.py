@@ -0,0 +1,107 @@
+import dataclasses
+
+import numpy as np
+import pytest
+
+from advanced_ai.investor_brain import (
+    Company,
+    MarketContext,
+    MarketPhase,
+    create_investor_brain,
+    registered_brains
+)
+
+# 린치 observable_sectors, 소로스 macro_sectors 키 전부 + 어디에도 없는 섹터, 대소문자 혼용
+SECTORS = [
+    'consumer_staples', 'retail', 'restaurants', 'Technology', 'healthcare', 'finance',
+    'industrial', 'Energy', 'real_estate', 'utilities', 'materials', 'biotech'
+]
+NUMERIC_FIELDS = [
+    'pe_ratio', 'pb_ratio', 'roe', 'debt_equity', 'revenue_growth', 'business_complexity', 'moat_strength'
+]
+STAGES = ['early', 'growth', 'mature', 'declining']
+
+def _companies(n=300, seed=3):
+    rng = np.random.default_rng(seed)
+    return [
+        Company(
+            ticker=f'T{i}',
+            name=f'Company {i}',
+            sector=SECTORS[i % len(SECTORS)],
+            # 뇌의 임계값과 같은 퍼센트 단위 (roe > 15, growth > 20 등)
+            pe_ratio=float(rng.uniform(-5, 80)),
+            pb_ratio=float(rng.uniform(0.3, 15)),
+            roe=float(rng.uniform(-20, 60)),
+            debt_equity=float(rng.uniform(0, 3)),
+            revenue_growth=float(rng.uniform(-30, 80)),
+            business_complexity=float(rng.uniform(0, 0.8)),
+            moat_strength=float(rng.uniform(0, 1)),
+            growth_stage=STAGES[i % len(STAGES)]
+        )
+        for i in range(n)
+    ]
+
+def _companies_with_nan(n=300):
+    """기업마다 숫자 필드 하나씩을 NaN으로 (스칼라 max(0, nan)=0, np.maximum은 nan)"""
+    return [
+        dataclasses.replace(company, **{NUMERIC_FIELDS[i % len(NUMERIC_FIELDS)]: float('nan')})
+        for i, company in enumerate(_companies(n))
+    ]
+
+CONTEXTS = [
+    MarketContext(phase, volatility, sentiment, valuation, themes, ['rates'])
+    for phase, volatility, sentiment, valuation, themes in [
+        (MarketPhase.BULL_MARKET, 0.2, 0.7, 0.8, ['AI']),
+        (MarketPhase.BEAR_MARKET, 0.8, -0.9, 0.2, ['inflation', 'rates']),
+        (MarketPhase.TRANSITION, 0.5, 0.0, 0.5, ['AI', 'energy', 'china', 'policy']),
+        (MarketPhase.UNCERTAIN, 0.75, -0.2, 0.6, []),
+    ]
+]
+
+def _assert_batch_matches_scalar(investor_id, companies, context):
+    batch = create_investor_brain(investor_id).analyze_companies(companies, context)
+    scalar = [create_investor_brain(investor_id).analyze_company(c, context) for c in companies]
+
+    assert list(batch.actions) == [d.action for d in scalar]
+    np.testing.assert_allclose(batch.confidences, [d.confidence for d in scalar], rtol=1e-9, atol=1e-12)
+    return batch
+
+@pytest.mark.parametrize('investor_id', [spec.investor_id for spec in registered_brains()])
+@pytest.mark.parametrize('context', CONTEXTS, ids=lambda c: c.phase.value)
+def test_batch_matches_scalar(investor_id, context):
+    _assert_batch_matches_scalar(investor_id, _companies(), context)
+
+@pytest.mark.parametrize('investor_id', [spec.investor_id for spec in registered_brains()])
+@pytest.mark.parametrize('context', CONTEXTS, ids=lambda c: c.phase.value)
+def test_batch_matches_scalar_with_nan_inputs(investor_id, context):
+    _assert_batch_matches_scalar(investor_id, _companies_with_nan(), context)
+
+@pytest.mark.parametrize('investor_id', [spec.investor_id for spec in registered_brains()])
+def test_data_reaches_several_decisions(investor_id):
+    brain = create_investor_brain(investor_id)
+    actions = set()
+    for context in CONTEXTS:
+        actions.update(brain.analyze_companies(_companies(), context).actions.tolist())
+    assert len(actions) >= 2
+
+def test_data_reaches_percent_threshold_branches():
+    lynch = create_investor_brain('peter_lynch')
+    companies = _companies()
+    categories = {lynch.classify_growth_category(c)['name'] for c in companies}
+    assert categories == {'fast_grower', 'stalwart', 'slow_grower', 'other'}
+    assert {lynch.evaluate_growth_story(c) for c in companies} > {0.0}
+    assert any(c.roe > 20 for c in companies) and any(0 < c.roe < 5 for c in companies)
+
+@pytest.mark.parametrize('investor_id', [spec.investor_id for spec in registered_brains()])
+def test_prepared_context_matches_raw_context(investor_id):
+    companies = _companies(n=50)
+    brain = create_investor_brain(investor_id)
+    for context in CONTEXTS:
+        prepared = brain.prepare_context(context)
+        raw = brain.analyze_companies(companies, context)
+        reused = brain.analyze_companies(companies, prepared)
+        assert list(reused.actions) == list(raw.actions)
+        np.testing.assert_array_equal(reused.confidences, raw.confidences)
+
+        decision = brain.analyze_company(companies[0], prepared)
+        assert decision.action == brain.analyze_company(companies[0], context).action
@@ -0,0 +1,86 @@
+import threading
+
+import pytest
+
+from advanced_ai.brain_registry import BrainRegistry
+from advanced_ai.investor_brain import InvestorDecision, create_investor_brain
+
+def _decision(action='buy', confidence=0.8):
+    return InvestorDecision(action, confidence, 'test', 'calm', [], '1y')
+
+class CountingFactory:
+    def __init__(self):
+        self.calls = []
+        self._lock = threading.Lock()
+
+    def __call__(self, investor_id):
+        with self._lock:
+            self.calls.append(investor_id)
+        return create_investor_brain(investor_id)
+
+def test_brains_are_created_once_and_shared_across_aliases():
+    factory = CountingFactory()
+    registry = BrainRegistry(factory=factory)
+
+    brain = registry.get('warren_buffett')
+    assert registry.get('buffett') is brain
+    assert registry.get('Warren Buffett') is brain
+    assert registry.snapshot(['buffett', 'warren_buffett']).brains == {'warren_buffett': brain}
+    assert factory.calls == ['warren_buffett']
+
+def test_concurrent_first_use_creates_one_brain():
+    factory = CountingFactory()
+    registry = BrainRegistry(factory=factory)
+    barrier = threading.Barrier(8)
+    seen = []
+
+    def worker():
+        barrier.wait()
+        seen.append(registry.get('peter_lynch'))
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert factory.calls == ['peter_lynch']
+    assert all(brain is seen[0] for brain in seen)
+
+def test_unknown_investors_are_skipped_in_snapshots_and_rejected_by_get():
+    registry = BrainRegistry()
+
+    snapshot = registry.snapshot(['nobody', 'marks', 'howard_marks'])
+    assert list(snapshot.brains) == ['howard_marks']
+    with pytest.raises(ValueError):
+        registry.get('nobody')
+
+def test_learning_swaps_in_a_new_brain_and_leaves_snapshots_untouched():
+    registry = BrainRegistry()
+    before = registry.snapshot(['buffett'])
+    old_brain = before.brains['warren_buffett']
+    old_calibration = old_brain.confidence_calibration
+
+    calibration = registry.learn_from_outcome('buffett', _decision('buy'), 0.3)
+
+    after = registry.snapshot(['buffett'])
+    new_brain = after.brains['warren_buffett']
+    assert new_brain is not old_brain
+    assert new_brain.memory is not old_brain.memory
+    assert len(new_brain.memory) == 1 and len(old_brain.memory) == 0
+    assert old_brain.confidence_calibration == before.calibration['warren_buffett'] == old_calibration
+    assert calibration == new_brain.confidence_calibration == registry.calibrations()['warren_buffett']
+    assert calibration != old_calibration
+    assert after.version == before.version + 1
+
+def test_version_only_moves_when_calibration_changes():
+    registry = BrainRegistry()
+    # 실패한 결정을 반복해 보정값을 하한까지 내림
+    while registry.learn_from_outcome('marks', _decision('buy'), -0.5) > 0.1:
+        pass
+    version = registry.version
+
+    registry.learn_from_outcome('marks', _decision('buy'), -0.5)
+
+    assert registry.version == version
+    assert len(registry.get('marks').memory) > 1
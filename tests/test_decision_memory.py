@@ -0,0 +1,92 @@
+import copy
+from collections import deque
+
+import numpy as np
+import pytest
+
+from advanced_ai.investor_brain import ACTIONS, DecisionMemory, InvestorDecision, WarrenBuffettBrain
+
+def _history(n, seed=2):
+    rng = np.random.default_rng(seed)
+    actions = rng.choice(ACTIONS, n)
+    confidences = rng.uniform(0, 1, n)
+    outcomes = rng.normal(0, 0.1, n)
+    qualities = rng.uniform(0, 1, n)
+    return actions, confidences, outcomes, qualities
+
+def _rows(memory):
+    return [(m['action'], m['confidence'], m['outcome'], m['quality']) for m in memory]
+
+@pytest.mark.parametrize('n', [0, 3, 10, 25])
+def test_append_keeps_the_most_recent_capacity_entries_in_order(n):
+    memory = DecisionMemory(capacity=10)
+    reference = deque(maxlen=10)
+    for i, row in enumerate(zip(*_history(n))):
+        memory.append(*row, timestamp=float(i))
+        reference.append(tuple(row))
+
+    assert len(memory) == len(reference)
+    assert _rows(memory) == [(str(a), c, o, q) for a, c, o, q in reference]
+    if n:
+        assert memory[-1]['confidence'] == reference[-1][1]
+        assert memory[0]['outcome'] == reference[0][2]
+        assert memory.column('timestamps').tolist() == [float(i) for i in range(max(0, n - 10), n)]
+    with pytest.raises(IndexError):
+        memory[len(reference)]
+
+@pytest.mark.parametrize('sizes', [[4], [4, 3], [7, 6, 2], [25], [3, 25, 1]])
+def test_extend_matches_repeated_append(sizes):
+    appended, extended = DecisionMemory(capacity=10), DecisionMemory(capacity=10)
+    for seed, size in enumerate(sizes):
+        history = _history(size, seed)
+        for row in zip(*history):
+            appended.append(*row, timestamp=0.0)
+        extended.extend(*history, timestamp=0.0)
+
+    assert _rows(extended) == _rows(appended)
+    assert extended.summary() == appended.summary()
+
+def test_summary_matches_plain_statistics():
+    actions, confidences, outcomes, qualities = _history(30)
+    memory = DecisionMemory(capacity=20)
+    memory.extend(actions, confidences, outcomes, qualities)
+
+    summary = memory.summary()
+    assert summary['count'] == 20
+    assert summary['mean_outcome'] == pytest.approx(outcomes[-20:].mean())
+    assert summary['mean_quality'] == pytest.approx(qualities[-20:].mean())
+    assert summary['hit_rate'] == pytest.approx((qualities[-20:] > 0.7).mean())
+    assert summary['actions'] == {action: int((actions[-20:] == action).sum()) for action in ACTIONS}
+    assert DecisionMemory().summary() == {'count': 0}
+
+def test_zero_capacity_and_unknown_actions():
+    empty = DecisionMemory(capacity=0)
+    empty.append('buy', 0.5, 0.1, 1.0)
+    empty.extend(*_history(5))
+    assert len(empty) == 0
+
+    memory = DecisionMemory(capacity=2)
+    memory.append('short', 0.5, 0.1, 1.0)
+    assert memory[0]['action'] == 'unknown'
+
+def test_copy_does_not_share_storage():
+    memory = DecisionMemory(capacity=3)
+    memory.extend(*_history(3))
+    clone = copy.copy(memory)
+
+    clone.append('sell', 0.1, -0.2, 1.0)
+
+    assert _rows(memory) != _rows(clone)
+    assert _rows(memory) == _rows(copy.copy(memory))
+
+def test_learning_in_batches_matches_one_at_a_time():
+    actions, confidences, outcomes, _ = _history(150)
+    one_by_one, batched = WarrenBuffettBrain(), WarrenBuffettBrain()
+
+    for action, confidence, outcome in zip(actions, confidences, outcomes):
+        one_by_one.learn_from_outcome(InvestorDecision(str(action), confidence, '', 'calm', [], '1y'), outcome)
+    batched.learn_from_outcomes(actions, confidences, outcomes)
+
+    assert len(batched.memory) == len(one_by_one.memory) == batched.memory.capacity
+    assert batched.confidence_calibration == pytest.approx(one_by_one.confidence_calibration)
+    assert _rows(batched.memory) == _rows(one_by_one.memory)
@@ -0,0 +1,46 @@
+import numpy as np
+
+from market_data.indicators import IndicatorState, ema, sma
+
+def _prices(n_tickers=3, n_days=800, seed=11):
+    rng = np.random.default_rng(seed)
+    prices = 75 * np.exp(np.cumsum(rng.normal(0, 0.01, (n_tickers, n_days)), axis=1))
+    # 거래정지 구간 (단일 결측 봉과 연속 결측)
+    prices[0, 550] = np.nan
+    prices[1, 300:305] = np.nan
+    prices[2, 100] = np.nan
+    return prices
+
+def test_incremental_matches_batch_with_nan_gaps():
+    prices = _prices()
+    warmup = 260
+    state = IndicatorState(prices[:, :warmup], sma_windows=(20, 50), ema_spans=(12,))
+    batch_sma = {window: sma(prices, window) for window in (20, 50)}
+    batch_ema = ema(prices, 12)
+
+    for t in range(warmup, prices.shape[1]):
+        state.update(prices[:, t])
+        values = state.snapshot()
+        for window in (20, 50):
+            np.testing.assert_allclose(values[f'sma_{window}'], batch_sma[window][:, t], rtol=1e-9, equal_nan=True)
+        np.testing.assert_allclose(values['ema_12'], batch_ema[:, t], rtol=1e-9, equal_nan=True)
+
+def test_sma_is_nan_while_gap_in_window():
+    prices = _prices()
+    state = IndicatorState(prices[:, :540], sma_windows=(50,), ema_spans=(12,))
+    for t in range(540, 560):
+        state.update(prices[:, t])
+    assert np.isnan(state.snapshot()['sma_50'][0])
+    assert not np.isnan(state.snapshot()['sma_50'][1])
+
+    for t in range(560, 700):
+        state.update(prices[:, t])
+    assert not np.isnan(state.snapshot()['sma_50'][0])
+
+def test_incremental_from_short_history():
+    prices = _prices()[:, :120]
+    state = IndicatorState(prices[:, :5], sma_windows=(20,), ema_spans=(12,))
+    batch = sma(prices, 20)
+    for t in range(5, prices.shape[1]):
+        state.update(prices[:, t])
+        np.testing.assert_allclose(state.snapshot()['sma_20'], batch[:, t], rtol=1e-9, equal_nan=True)
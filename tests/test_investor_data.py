@@ -0,0 +1,58 @@
+import pytest
+
+pytest.importorskip('fastapi')
+pytest.importorskip('httpx')
+
+from fastapi.testclient import TestClient
+
+from backend import main
+
+@pytest.fixture
+def client():
+    with TestClient(main.app) as client:
+        yield client
+
+def test_every_listed_investor_has_data(client):
+    investors = client.get('/api/investors').json()['investors']
+    assert investors
+
+    for investor in investors:
+        response = client.get(f"/api/investors/{investor['id']}/data")
+        assert response.status_code == 200, investor['id']
+        assert response.json()['investor_info']['slug'] == investor['id']
+
+def test_investor_data_accepts_alias(client):
+    canonical = client.get('/api/investors/peter_lynch/data')
+    alias = client.get('/api/investors/lynch/data')
+
+    assert alias.status_code == 200
+    assert alias.headers['etag'] == canonical.headers['etag']
+
+def test_unknown_investor_data_is_404(client):
+    assert client.get('/api/investors/nobody/data').status_code == 404
+
+def test_investor_data_revalidates_with_etag(client):
+    first = client.get('/api/investors/warren_buffett/data')
+    etag = first.headers['etag']
+
+    cached = client.get('/api/investors/warren_buffett/data', headers={'If-None-Match': etag})
+    assert cached.status_code == 304
+    assert cached.content == b''
+    assert cached.headers['etag'] == etag
+
+    weak = client.get('/api/investors/warren_buffett/data', headers={'If-None-Match': f'"stale", W/{etag}'})
+    assert weak.status_code == 304
+
+    stale = client.get('/api/investors/warren_buffett/data', headers={'If-None-Match': '"stale"'})
+    assert stale.status_code == 200
+    assert stale.json() == first.json()
+
+def test_investor_data_is_gzipped_only_when_accepted(client):
+    plain = client.get('/api/investors/warren_buffett/data', headers={'Accept-Encoding': 'identity'})
+    zipped = client.get('/api/investors/warren_buffett/data', headers={'Accept-Encoding': 'gzip'})
+
+    assert 'content-encoding' not in plain.headers
+    assert zipped.headers['content-encoding'] == 'gzip'
+    assert 'Accept-Encoding' in zipped.headers['vary']
+    assert zipped.json() == plain.json()
+    assert zipped.headers['etag'] == plain.headers['etag']
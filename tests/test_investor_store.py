@@ -0,0 +1,64 @@
+import gzip
+import json
+import os
+
+from backend.investor_store import InvestorDataStore
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+def _write(path, data, mtime_ns):
+    path.write_text(json.dumps(data), encoding='utf-8')
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+
+def _store(tmp_path):
+    clock = FakeClock()
+    _write(tmp_path / 'buffett.json', {'name': 'Warren Buffett', 'quotes': ['Be fearful when others are greedy']}, 1_000)
+    store = InvestorDataStore(tmp_path, check_interval=5.0, clock=clock)
+    store.load_all()
+    return store, clock
+
+def test_documents_are_preserialized_with_gzip_and_stable_etag(tmp_path):
+    store, _ = _store(tmp_path)
+    document = store.get('buffett')
+
+    assert json.loads(document.body) == {'name': 'Warren Buffett', 'quotes': ['Be fearful when others are greedy']}
+    assert gzip.decompress(document.gzip_body) == document.body
+    assert document.etag.startswith('"') and document.etag.endswith('"')
+    assert store.get('buffett') is document
+    assert InvestorDataStore(tmp_path).get('buffett').etag == document.etag
+
+def test_changed_file_is_reloaded_only_after_check_interval(tmp_path):
+    store, clock = _store(tmp_path)
+    original = store.get('buffett')
+    _write(tmp_path / 'buffett.json', {'name': 'Warren Buffett', 'quotes': []}, 2_000)
+
+    clock.now = 4.9
+    assert store.get('buffett') is original
+
+    clock.now = 5.0
+    reloaded = store.get('buffett')
+    assert reloaded.etag != original.etag
+    assert json.loads(reloaded.body)['quotes'] == []
+
+def test_new_and_deleted_files_are_picked_up(tmp_path):
+    store, clock = _store(tmp_path)
+    _write(tmp_path / 'marks.json', {'name': 'Howard Marks'}, 1_000)
+    assert json.loads(store.get('marks').body) == {'name': 'Howard Marks'}
+
+    (tmp_path / 'buffett.json').unlink()
+    clock.now = 10.0
+    assert store.get('buffett') is None
+    assert store.ids() == ['marks']
+
+def test_unknown_and_unsafe_ids_are_not_tracked(tmp_path):
+    store, _ = _store(tmp_path)
+
+    assert store.get('../buffett') is None
+    for i in range(100):
+        assert store.get(f'missing_{i}') is None
+    assert set(store._checked_at) == {'buffett'}
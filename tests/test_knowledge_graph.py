@@ -0,0 +1,94 @@
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from advanced_ai.knowledge_graph_learner import (
+    ContinuousLearningSystem,
+    KnowledgeGraph,
+    KnowledgeTriple,
+    iter_investor_quotes
+)
+
+DATA_DIR = Path(__file__).resolve().parent.parent / 'data' / 'investors'
+
+def _edges(system):
+    return sorted(
+        (subject, target, data['predicate'], round(data['confidence'], 12), round(data['weight'], 12))
+        for subject, target, data in system.knowledge_graph.graph.edges(data=True)
+    )
+
+def _learn(tmp_path, name, **kwargs):
+    with ContinuousLearningSystem(db_path=str(tmp_path / name)) as system:
+        stats = system.learn_from_quotes(iter_investor_quotes(str(DATA_DIR)), **kwargs)
+        edges = _edges(system)
+        rows = system.store.conn.execute('SELECT COUNT(*) FROM knowledge_triples').fetchone()[0]
+    return stats, edges, rows
+
+def test_learn_from_quotes_defaults_to_in_process(tmp_path, monkeypatch):
+    import advanced_ai.knowledge_graph_learner as learner
+
+    def no_pool(*args, **kwargs):
+        raise AssertionError('default learn_from_quotes must not start a process pool')
+
+    monkeypatch.setattr(learner, 'ProcessPoolExecutor', no_pool)
+    stats, edges, _ = _learn(tmp_path, 'serial.db')
+    assert stats['quotes'] > 0 and edges
+
+def test_parallel_and_serial_learning_build_same_graph(tmp_path):
+    serial_stats, serial_edges, serial_rows = _learn(tmp_path, 'serial.db', chunk_size=3)
+    parallel_stats, parallel_edges, parallel_rows = _learn(tmp_path, 'parallel.db', workers=2, chunk_size=3)
+
+    assert serial_stats['quotes'] == parallel_stats['quotes'] > 3
+    assert serial_stats['triples'] == parallel_stats['triples'] == serial_rows == parallel_rows
+    assert parallel_edges == serial_edges
+
+THEMES = ['AI', 'rates', 'inflation', 'energy', 'china', 'consumer']
+PHASES = ['bull_market', 'bear_market', 'transition', None]
+
+def _random_graph(seed=5, n=400):
+    rng = np.random.default_rng(seed)
+    graph = KnowledgeGraph()
+    inserted = []
+    for _ in range(n):
+        subject, obj = f'entity_{rng.integers(30)}', f'entity_{rng.integers(30)}'
+        context = {'key_themes': list(rng.choice(THEMES, size=rng.integers(0, 4), replace=False))}
+        phase = PHASES[rng.integers(len(PHASES))]
+        if phase is not None:
+            context['market_phase'] = phase
+        graph.add_knowledge(KnowledgeTriple(
+            subject=subject, predicate='related_to', object=obj, confidence=float(rng.uniform(0.2, 1.0)),
+            source='test', timestamp=datetime(2024, 1, 1), context=context
+        ))
+        if (subject, obj) not in inserted:
+            inserted.append((subject, obj))
+    return graph, inserted
+
+def _brute_force(graph, inserted, current_context, top_k):
+    """색인 없이 모든 엣지를 훑는 기준 구현 (동점이면 먼저 추가된 엣지 우선)"""
+    current_keywords = set(current_context.get('key_themes', []))
+    scored = []
+    for order, (subject, obj) in enumerate(inserted):
+        context = graph.graph[subject][obj]['context']
+        overlap = len(current_keywords & set(context.get('key_themes', [])))
+        phase_match = 1.0 if context.get('market_phase') == current_context.get('market_phase') else 0.0
+        similarity = overlap * 0.7 + phase_match * 0.3
+        if similarity > 0.3:
+            scored.append((-similarity, order, subject, obj))
+    return [(subject, obj, -negative) for negative, _, subject, obj in sorted(scored)[:top_k]]
+
+@pytest.mark.parametrize('current_context', [
+    {'key_themes': ['AI'], 'market_phase': 'bull_market'},
+    {'key_themes': ['rates', 'inflation', 'energy'], 'market_phase': 'bear_market'},
+    {'key_themes': ['china', 'consumer', 'AI', 'rates']},
+    {'key_themes': [], 'market_phase': 'transition'},
+    {'key_themes': ['unseen']},
+])
+@pytest.mark.parametrize('top_k', [1, 5, 50, 1000])
+def test_indexed_similarity_search_matches_full_scan(current_context, top_k):
+    graph, inserted = _random_graph()
+
+    found = [(s['subject'], s['object'], s['similarity']) for s in graph.find_similar_situations(current_context, top_k)]
+
+    assert found == _brute_force(graph, inserted, current_context, top_k)
@@ -0,0 +1,90 @@
+import time
+from datetime import datetime
+
+import pytest
+
+from advanced_ai.knowledge_graph_learner import KnowledgeTriple
+from advanced_ai.learning_store import LearningStore
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+def _triple(i):
+    return KnowledgeTriple(f'subject_{i}', 'related_to', f'object_{i}', 0.5, 'test', datetime(2024, 1, 1), {'i': i})
+
+def _experience(i):
+    return ('warren_buffett', 'buy', str(i / 100), 0.8, '{}')
+
+def _count(store, table='knowledge_triples'):
+    return store.conn.execute(f'SELECT COUNT(*) FROM {table}').fetchone()[0]
+
+def test_rows_are_buffered_until_batch_size(tmp_path):
+    store = LearningStore(str(tmp_path / 'store.db'), batch_size=3, flush_interval=60, clock=FakeClock())
+    store.add_knowledge(_triple(0))
+    store.add_experience_rows([_experience(0)])
+    assert store.pending == 2 and _count(store) == 0
+
+    store.add_knowledge(_triple(1))
+    assert store.pending == 0
+    assert _count(store) == 2 and _count(store, 'learning_experiences') == 1
+    store.close()
+
+def test_next_write_after_flush_interval_flushes(tmp_path):
+    clock = FakeClock()
+    store = LearningStore(str(tmp_path / 'store.db'), batch_size=100, flush_interval=60, clock=clock)
+    store.add_knowledge(_triple(0))
+
+    clock.now = 60.0
+    store.add_knowledge(_triple(1))
+
+    assert store.pending == 0 and _count(store) == 2
+    store.close()
+
+def test_pending_rows_flush_after_interval_without_further_writes(tmp_path):
+    store = LearningStore(str(tmp_path / 'store.db'), batch_size=100, flush_interval=0.05)
+    store.add_knowledge_many([_triple(0), _triple(1)])
+    assert store.pending == 2
+
+    deadline = time.monotonic() + 5.0
+    while store.pending and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    assert store.pending == 0 and _count(store) == 2
+    store.close()
+
+def test_close_flushes_and_cancels_timer(tmp_path):
+    store = LearningStore(str(tmp_path / 'store.db'), batch_size=100, flush_interval=0.05)
+    store.add_knowledge(_triple(0))
+    store.close()
+    time.sleep(0.1)  # 취소된 타이머가 닫힌 연결에 쓰지 않음
+
+    reopened = LearningStore(str(tmp_path / 'store.db'))
+    assert _count(reopened) == 1
+    reopened.close()
+
+def test_synchronous_mode_is_validated_and_applied(tmp_path):
+    with pytest.raises(ValueError):
+        LearningStore(str(tmp_path / 'bad.db'), synchronous='sometimes')
+
+    store = LearningStore(str(tmp_path / 'store.db'), synchronous='full')
+    assert store.conn.execute('PRAGMA synchronous').fetchone()[0] == 2
+    assert store.conn.execute('PRAGMA journal_mode').fetchone()[0] == 'wal'
+    store.close()
+
+def test_rollback_to_high_water_removes_later_rows(tmp_path):
+    store = LearningStore(str(tmp_path / 'store.db'), batch_size=100, flush_interval=60, clock=FakeClock())
+    store.add_knowledge_many([_triple(i) for i in range(3)])
+    store.add_experience_rows([_experience(0)])
+    marks = store.high_water()
+    assert marks == {'knowledge_triples': 3, 'learning_experiences': 1}
+
+    store.add_knowledge_many([_triple(i) for i in range(3, 5)])
+    store.add_experience_rows([_experience(1), _experience(2)])
+
+    assert store.rollback_to(marks) == 4
+    assert _count(store) == 3 and _count(store, 'learning_experiences') == 1
+    store.close()
@@ -0,0 +1,162 @@
+import threading
+import time
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from market_data import (
+    CachedMarketData,
+    FixtureProvider,
+    MarketDataCache,
+    MarketDataProvider,
+    MarketDataUnavailable,
+    create_market_data
+)
+from market_data.cache import decode_history, encode_history
+from market_data.record import FIXTURE_HISTORIES, FIXTURE_INFOS, synthetic_history
+
+FIXTURE_DIR = Path(__file__).resolve().parent.parent / 'data' / 'market_fixtures'
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1_000.0
+
+    def __call__(self):
+        return self.now
+
+class GatedProvider(MarketDataProvider):
+    """release 될 때까지 조회를 붙잡아 두는 제공자 (호출 수 기록)"""
+
+    def __init__(self, fail=False):
+        self.calls = []
+        self.release = threading.Event()
+        self.fail = fail
+
+    def history(self, ticker, period='1y', interval='1d'):
+        self.calls.append(('history', ticker, period, interval))
+        self.release.wait(5)
+        if self.fail:
+            raise MarketDataUnavailable(ticker)
+        return synthetic_history('AAPL', '6mo')
+
+    def info(self, ticker):
+        self.calls.append(('info', ticker))
+        return {'symbol': ticker}
+
+def _concurrently(fn, n=8):
+    results, errors = [None] * n, [None] * n
+
+    def worker(i):
+        try:
+            results[i] = fn()
+        except Exception as e:
+            errors[i] = e
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(n)]
+    for thread in threads:
+        thread.start()
+    return threads, results, errors
+
+def _wait_for(condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not condition() and time.monotonic() < deadline:
+        time.sleep(0.005)
+    assert condition()
+
+def test_history_round_trips_with_timezone():
+    hist = synthetic_history('AAPL', '6mo')
+    decoded = decode_history(encode_history(hist))
+
+    assert str(decoded.index.tz) == 'America/New_York'
+    pd.testing.assert_frame_equal(decoded, hist, check_freq=False, check_index_type=False)
+
+def test_cache_entries_expire_after_ttl(tmp_path):
+    clock = FakeClock()
+    cache = MarketDataCache(str(tmp_path / 'cache.db'), history_ttl=60, info_ttl=120, clock=clock)
+    cache.put_history('AAPL', '6mo', '1d', synthetic_history('AAPL', '6mo'))
+    cache.put_info('AAPL', {'symbol': 'AAPL'})
+
+    clock.now += 60
+    assert cache.get_history('AAPL', '6mo', '1d') is not None
+    assert cache.get_history('AAPL', '1y', '1d') is None
+    clock.now += 1
+    assert cache.get_history('AAPL', '6mo', '1d') is None
+    assert cache.get_info('AAPL') == {'symbol': 'AAPL'}
+    clock.now += 60
+    assert cache.get_info('AAPL') is None
+    cache.close()
+
+def test_concurrent_history_calls_reach_provider_once(tmp_path):
+    provider = GatedProvider()
+    cached = CachedMarketData(provider, MarketDataCache(str(tmp_path / 'cache.db')))
+
+    threads, results, errors = _concurrently(lambda: cached.history('AAPL', period='6mo'))
+    _wait_for(lambda: cached.coalesced == 7)
+    provider.release.set()
+    for thread in threads:
+        thread.join()
+
+    assert errors == [None] * 8
+    assert provider.calls == [('history', 'AAPL', '6mo', '1d')]
+    assert cached.stats() == {'hits': 0, 'fetches': 1, 'coalesced': 7}
+    # 호출자마다 독립된 사본
+    results[0].loc[:, 'Close'] = 0.0
+    assert (results[1]['Close'] > 0).all()
+
+    cached.history('AAPL', period='6mo')
+    assert len(provider.calls) == 1 and cached.hits == 1
+
+def test_failed_fetch_reaches_every_waiter_and_is_retried(tmp_path):
+    provider = GatedProvider(fail=True)
+    cached = CachedMarketData(provider, MarketDataCache(str(tmp_path / 'cache.db')))
+
+    threads, _, errors = _concurrently(lambda: cached.history('AAPL'), n=4)
+    _wait_for(lambda: cached.coalesced == 3)
+    provider.release.set()
+    for thread in threads:
+        thread.join()
+
+    assert all(isinstance(error, MarketDataUnavailable) for error in errors)
+    assert len(provider.calls) == 1
+
+    with pytest.raises(MarketDataUnavailable):
+        cached.history('AAPL')
+    assert len(provider.calls) == 2
+
+def test_expired_entries_are_fetched_again(tmp_path):
+    clock = FakeClock()
+    provider = GatedProvider()
+    provider.release.set()
+    cached = CachedMarketData(provider, MarketDataCache(str(tmp_path / 'cache.db'), info_ttl=10, clock=clock))
+
+    assert cached.info('MSFT') == {'symbol': 'MSFT'}
+    assert cached.info('MSFT') == {'symbol': 'MSFT'}
+    clock.now += 11
+    cached.info('MSFT')
+
+    assert provider.calls == [('info', 'MSFT'), ('info', 'MSFT')]
+
+def test_record_mode_writes_fixtures_that_offline_mode_reads(tmp_path):
+    provider = GatedProvider()
+    provider.release.set()
+    recorder = FixtureProvider(str(tmp_path / 'fixtures'))
+    cached = CachedMarketData(provider, MarketDataCache(str(tmp_path / 'cache.db')), recorder=recorder)
+
+    live = cached.history('^VIX', period='6mo')
+    offline = create_market_data('offline', fixture_dir=str(tmp_path / 'fixtures'))
+
+    replayed = offline.history('^VIX', period='6mo')
+    assert replayed.index.equals(live.index.tz_convert('UTC'))  # 픽스처는 UTC로 읽힘
+    pd.testing.assert_frame_equal(replayed.reset_index(drop=True), live.reset_index(drop=True), check_dtype=False)
+    with pytest.raises(MarketDataUnavailable):
+        offline.info('^VIX')
+
+def test_shipped_fixtures_cover_recorded_keys():
+    offline = create_market_data('offline', fixture_dir=str(FIXTURE_DIR))
+
+    for ticker, period, interval in FIXTURE_HISTORIES:
+        hist = offline.ticker(ticker).history(period=period, interval=interval)
+        assert len(hist) > 0 and {'Open', 'High', 'Low', 'Close', 'Volume'} <= set(hist.columns)
+    for ticker in FIXTURE_INFOS:
+        assert offline.ticker(ticker).info['symbol'] == ticker
@@ -0,0 +1,58 @@
+import pytest
+
+pytest.importorskip('fastapi')
+pytest.importorskip('httpx')
+
+from fastapi.testclient import TestClient
+
+from backend import main
+from backend.metrics import MetricsRegistry
+
+COMPANY = {
+    'ticker': 'METR',
+    'name': 'Metrics Co',
+    'sector': 'Technology',
+    'pe_ratio': 18.0,
+    'pb_ratio': 3.0,
+    'roe': 22.0,
+    'debt_equity': 0.4,
+    'revenue_growth': 12.0
+}
+
+@pytest.fixture
+def client():
+    main.analysis_cache.clear()
+    with TestClient(main.app) as client:
+        yield client
+
+def test_analyze_validation_errors_keep_fastapi_contract(client):
+    company = {key: value for key, value in COMPANY.items() if key != 'name'}
+    response = client.post('/api/analyze', json={'company': company})
+
+    assert response.status_code == 422
+    assert response.json()['detail'][0]['loc'] == ['body', 'company', 'name']
+
+    operation = client.get('/openapi.json').json()['paths']['/api/analyze']['post']
+    assert '422' in operation['responses']
+    assert operation['requestBody']['content']['application/json']['schema']['$ref'].endswith('/AnalysisRequest')
+
+def test_analyze_records_stage_timings(client):
+    assert client.post('/api/analyze', json={'company': COMPANY}).status_code == 200
+
+    text = client.get('/metrics').text
+    for stage in ('parse', 'build_inputs', 'investors', 'consensus', 'serialize'):
+        assert f'stockoracle_analysis_stage_seconds_count{{stage="{stage}"}}' in text
+    assert 'route="/api/analyze"' in text
+
+def test_histogram_render():
+    registry = MetricsRegistry()
+    histogram = registry.histogram('demo_seconds', 'Demo', ('stage',), buckets=(0.1, 1.0))
+    histogram.observe(0.05, 'a')
+    histogram.observe(0.5, 'a')
+    histogram.observe(5.0, 'a')
+
+    text = registry.render()
+    assert 'demo_seconds_bucket{stage="a",le="0.1"} 1' in text
+    assert 'demo_seconds_bucket{stage="a",le="1.0"} 2' in text
+    assert 'demo_seconds_bucket{stage="a",le="+Inf"} 3' in text
+    assert 'demo_seconds_count{stage="a"} 3' in text
@@ -0,0 +1,48 @@
+import random
+
+from advanced_ai.pattern_matcher import MultiPatternMatcher
+
+def _brute_force(text, patterns):
+    """모든 위치에서 모든 패턴을 비교하는 기준 구현 (경계 검사 없음)"""
+    lowered = text.lower()
+    found = set()
+    for pattern in patterns:
+        key = pattern.lower()
+        start = lowered.find(key)
+        while start != -1:
+            found.add((start, start + len(key), pattern))
+            start = lowered.find(key, start + 1)
+    return found
+
+def _matches(matcher, text):
+    return [(m.start, m.end, m.value) for m in matcher.find_all(text)]
+
+def test_matches_brute_force_on_random_text():
+    rng = random.Random(7)
+    alphabet = 'abcd'
+    patterns = sorted({''.join(rng.choice(alphabet) for _ in range(rng.randint(1, 4))) for _ in range(40)})
+    matcher = MultiPatternMatcher(word_boundary=False)
+    matcher.add_many(patterns, 'k')
+
+    for _ in range(50):
+        text = ''.join(rng.choice(alphabet) for _ in range(rng.randint(0, 60)))
+        found = _matches(matcher, text)
+        assert len(found) == len(set(found))
+        assert set(found) == _brute_force(text, patterns)
+
+def test_add_after_build_does_not_duplicate_outputs():
+    matcher = MultiPatternMatcher(word_boundary=False)
+    matcher.add_many(['he', 'she', 'hers'], 'k')
+    matcher.build()
+    matcher.add('us', 'k')
+
+    found = _matches(matcher, 'ushers')
+    assert sorted(found) == sorted(_brute_force('ushers', ['he', 'she', 'hers', 'us']))
+    assert [value for _, _, value in found].count('he') == 1
+
+def test_word_boundary_and_case():
+    matcher = MultiPatternMatcher()
+    matcher.add('Apple', 'company', 'AAPL')
+
+    assert [m.value for m in matcher.find_all('APPLE beats')] == ['AAPL']
+    assert matcher.find_all('pineapples') == []
@@ -0,0 +1,118 @@
+import numpy as np
+import pytest
+
+from advanced_ai.investor_brain import (
+    ACTIONS,
+    Company,
+    InvestorBrain,
+    InvestorDecision,
+    MarketPhase,
+    create_investor_brain,
+    registered_brains
+)
+from advanced_ai.scenarios import ScenarioEngine, ScenarioSet
+
+SECTORS = ['consumer_staples', 'retail', 'Technology', 'finance', 'energy', 'utilities', 'biotech']
+STAGES = ['early', 'growth', 'mature', 'declining']
+
+def _companies(n=40, seed=8):
+    rng = np.random.default_rng(seed)
+    return [
+        Company(
+            ticker=f'T{i}', name=f'Company {i}', sector=SECTORS[i % len(SECTORS)],
+            pe_ratio=float(rng.uniform(-5, 60)), pb_ratio=float(rng.uniform(0.3, 12)),
+            roe=float(rng.uniform(-10, 50)), debt_equity=float(rng.uniform(0, 2.5)),
+            revenue_growth=float(rng.uniform(-20, 60)), business_complexity=float(rng.uniform(0, 0.6)),
+            moat_strength=float(rng.uniform(0, 1)), growth_stage=STAGES[i % len(STAGES)]
+        )
+        for i in range(n)
+    ]
+
+def _grid():
+    return ScenarioSet.grid(
+        phase=list(MarketPhase),
+        volatility=np.linspace(0.1, 0.9, 3),
+        sentiment_score=np.linspace(-1, 1, 3),
+        valuation_level=[0.3, 0.8]
+    )
+
+class VolatilityBrain(InvestorBrain):
+    """context_terms를 오버라이드하지 않아 시나리오별로 평가되어야 하는 뇌"""
+
+    def analyze_company(self, company, context):
+        context = self.prepare_context(context).context
+        action = 'buy' if company.moat_strength > context.volatility else 'hold'
+        return InvestorDecision(action, context.volatility, '', 'calm', [], '1y')
+
+def test_grid_orders_contexts_with_last_axis_fastest():
+    grid = ScenarioSet.grid(phase=['bull_market', 'bear_market'], volatility=[0.2, 0.4, 0.6])
+
+    assert grid.shape == (2, 3) and len(grid) == 6
+    assert [(c.phase.value, c.volatility) for c in grid.contexts[:4]] == [
+        ('bull_market', 0.2), ('bull_market', 0.4), ('bull_market', 0.6), ('bear_market', 0.2)
+    ]
+    assert grid.parameters()['volatility'][1].tolist() == [0.2, 0.4, 0.6]
+    with pytest.raises(ValueError):
+        ScenarioSet.grid(interest_rate=[0.01])
+
+def test_monte_carlo_is_seeded_and_within_ranges():
+    first = ScenarioSet.monte_carlo(50, seed=4, volatility=(0.2, 0.3))
+    again = ScenarioSet.monte_carlo(50, seed=4, volatility=(0.2, 0.3))
+
+    assert first.contexts == again.contexts and first.shape == (50,)
+    assert all(0.2 <= c.volatility <= 0.3 for c in first.contexts)
+
+def test_grouped_sweep_matches_analyze_company_everywhere():
+    companies, grid = _companies(), _grid()
+    result = ScenarioEngine().run(grid, companies)
+
+    assert result.action_codes.shape == (len(registered_brains()),) + grid.shape + (len(companies),)
+    for b, investor_id in enumerate(result.investors):
+        brain = create_investor_brain(investor_id)
+        codes = result.action_codes[b].reshape(len(grid), -1)
+        confidences = result.confidences[b].reshape(len(grid), -1)
+        for s, context in enumerate(grid.contexts):
+            decisions = [brain.analyze_company(company, context) for company in companies]
+            assert [ACTIONS[code] for code in codes[s]] == [d.action for d in decisions], (investor_id, context)
+            np.testing.assert_allclose(confidences[s], [d.confidence for d in decisions], rtol=1e-6)
+
+def test_scenarios_sharing_context_terms_are_evaluated_once():
+    grid = _grid()
+    result = ScenarioEngine().run(grid, _companies(n=5))
+
+    # 버핏의 시장 상황 조정값은 1.2(약세장), 0.6(고평가 강세장), 1.0 세 가지뿐
+    assert result.evaluations['warren_buffett'] == 3
+    # 린치는 약세장 여부만 본다
+    assert result.evaluations['peter_lynch'] == 2
+    assert all(count <= len(grid) for count in result.evaluations.values())
+
+def test_brains_without_context_terms_are_evaluated_per_scenario():
+    companies, grid = _companies(n=10), ScenarioSet.grid(volatility=np.linspace(0.1, 0.9, 5))
+    brain = VolatilityBrain('Volatility')
+    result = ScenarioEngine({'volatility': brain}).run(grid, companies)
+
+    assert result.evaluations == {'volatility': 5}
+    for s, context in enumerate(grid.contexts):
+        expected = [brain.analyze_company(company, context).action for company in companies]
+        assert result.actions('volatility')[s].tolist() == expected
+
+def test_boundaries_and_stability_agree_with_the_action_tensor():
+    companies = _companies(n=10)
+    grid = ScenarioSet.grid(volatility=np.linspace(0.1, 0.9, 5))
+    result = ScenarioEngine({'volatility': VolatilityBrain('Volatility')}).run(grid, companies)
+    actions = result.actions('volatility')
+
+    rates = [t['flip_rate'] for t in result.boundaries('volatility')['volatility']]
+    assert rates == pytest.approx([(actions[i] != actions[i + 1]).mean() for i in range(4)])
+
+    stability = result.company_stability('volatility')
+    for j in range(len(companies)):
+        values, counts = np.unique(actions[:, j], return_counts=True)
+        assert stability['stability'][j] == counts.max() / len(grid)
+        assert stability['distinct_actions'][j] == len(values)
+
+    summary = result.boundary_summary()['volatility']
+    assert sum(summary['action_share'].values()) == pytest.approx(1.0)
+    assert summary['axes']['volatility']['sharpest']['flip_rate'] == max(rates)
+    with pytest.raises(ValueError):
+        result.boundaries('phase')
@@ -0,0 +1,88 @@
+import numpy as np
+import pytest
+
+pytest.importorskip('fastapi')
+pytest.importorskip('httpx')
+
+from fastapi.testclient import TestClient
+
+from backend import main
+
+# 기본 4명이면 합의가 거의 HOLD로 모이므로, 필터/정렬 테스트는 결과가 갈리는 두 명으로
+MIXED_INVESTORS = ['warren_buffett', 'peter_lynch']
+SECTORS = ['Technology', 'consumer_staples', 'retail', 'finance', 'energy', 'utilities', 'biotech']
+
+def _columns(n=40, seed=11):
+    rng = np.random.default_rng(seed)
+    return {
+        'ticker': [f'S{i}' for i in range(n)],
+        'name': [f'Screen Co {i}' for i in range(n)],
+        'sector': [SECTORS[i % len(SECTORS)] for i in range(n)],
+        'pe_ratio': rng.uniform(-5, 60, n).round(2).tolist(),
+        'pb_ratio': rng.uniform(0.3, 12, n).round(2).tolist(),
+        'roe': rng.uniform(-10, 50, n).round(2).tolist(),
+        'debt_equity': rng.uniform(0, 2.5, n).round(2).tolist(),
+        'revenue_growth': rng.uniform(-20, 60, n).round(2).tolist(),
+        'moat_strength': rng.uniform(0, 1, n).round(2).tolist()
+    }
+
+def _row(columns, i):
+    return {field: values[i] for field, values in columns.items()}
+
+@pytest.fixture
+def client():
+    main.analysis_cache.clear()
+    with TestClient(main.app) as client:
+        yield client
+
+def _screen(client, columns, **kwargs):
+    response = client.post('/api/screen', json={'companies': columns, **kwargs})
+    assert response.status_code == 200, response.text
+    return response.json()
+
+def test_screen_matches_per_company_analysis(client):
+    columns = _columns()
+    screen = _screen(client, columns, page_size=len(columns['ticker']))
+
+    assert screen['total'] == len(columns['ticker'])
+    for result in screen['results']:
+        i = columns['ticker'].index(result['ticker'])
+        single = client.post('/api/analyze', json={'company': _row(columns, i)}).json()
+
+        assert result['consensus'] == single['consensus']
+        assert result['consensus_confidence'] == pytest.approx(single['consensus_confidence'])
+        assert [(d['investor'], d['action'], pytest.approx(d['confidence'])) for d in result['decisions']] == \
+            [(d['investor'], d['action'], d['confidence']) for d in single['decisions']]
+
+def test_screen_ranks_by_score_then_confidence(client):
+    results = _screen(client, _columns(), investors=MIXED_INVESTORS, page_size=100)['results']
+
+    keys = [(r['consensus_score'], r['consensus_confidence']) for r in results]
+    assert keys == sorted(keys, reverse=True)
+    assert [r['rank'] for r in results] == list(range(1, len(results) + 1))
+
+def test_screen_pages_filter_and_top_n(client):
+    columns = _columns()
+    everything = _screen(client, columns, investors=MIXED_INVESTORS, page_size=100)['results']
+    assert {r['consensus'] for r in everything} == {'HOLD', 'AVOID'}
+
+    pages = [
+        _screen(client, columns, investors=MIXED_INVESTORS, page=page, page_size=7)['results']
+        for page in range(1, 8)
+    ]
+    assert [r['ticker'] for page in pages for r in page] == [r['ticker'] for r in everything]
+
+    top = _screen(client, columns, investors=MIXED_INVESTORS, top_n=5, page_size=100)
+    assert top['total'] == 5
+    assert [r['ticker'] for r in top['results']] == [r['ticker'] for r in everything[:5]]
+
+    for consensus in ('hold', 'AVOID'):
+        filtered = _screen(client, columns, investors=MIXED_INVESTORS, consensus=consensus, page_size=100)
+        expected = [r['ticker'] for r in everything if r['consensus'] == consensus.upper()]
+        assert filtered['total'] == len(expected)
+        assert [r['ticker'] for r in filtered['results']] == expected
+
+def test_screen_rejects_bad_page_and_unknown_investors(client):
+    columns = _columns(n=3)
+    assert client.post('/api/screen', json={'companies': columns, 'page': 0}).status_code == 400
+    assert client.post('/api/screen', json={'companies': columns, 'investors': ['nobody']}).status_code == 400
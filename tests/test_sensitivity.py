@@ -0,0 +1,116 @@
+import dataclasses
+
+import numpy as np
+import pytest
+
+from advanced_ai.investor_brain import (
+    ACTIONS,
+    COMPANY_NUMERIC_FIELDS,
+    Company,
+    MarketContext,
+    MarketPhase,
+    company_columns
+)
+from advanced_ai.sensitivity import FIELD_BOUNDS, SensitivityAnalyzer
+
+SECTORS = ['consumer_staples', 'retail', 'Technology', 'finance', 'energy', 'utilities', 'biotech']
+STAGES = ['early', 'growth', 'mature', 'declining']
+STEPS = 32
+CONTEXT = MarketContext(MarketPhase.TRANSITION, 0.5, 0.0, 0.5, ['AI'], ['rates'])
+
+def _companies(n=30, seed=12):
+    rng = np.random.default_rng(seed)
+    return [
+        Company(
+            ticker=f'T{i}', name=f'Company {i}', sector=SECTORS[i % len(SECTORS)],
+            pe_ratio=float(rng.uniform(-5, 60)), pb_ratio=float(rng.uniform(0.3, 12)),
+            roe=float(rng.uniform(-10, 50)), debt_equity=float(rng.uniform(0, 2.5)),
+            revenue_growth=float(rng.uniform(-20, 60)), business_complexity=float(rng.uniform(0, 0.6)),
+            moat_strength=float(rng.uniform(0, 1)), growth_stage=STAGES[i % len(STAGES)]
+        )
+        for i in range(n)
+    ]
+
+def _scan(brain, columns, base, field, sign, span):
+    """격자의 모든 칸을 한 번에 평가하는 기준 구현 -> 기업별 (전환 직전 거리, 처음 전환한 칸 거리)"""
+    x = columns[field]
+    size = len(x)
+    low, high = FIELD_BOUNDS.get(field, (-np.inf, np.inf))
+    limit = np.maximum(high, x) - x if sign > 0 else x - np.minimum(low, x)
+    offsets = np.minimum((span * np.arange(1, STEPS + 1) / STEPS)[:, None], limit[None, :])  # (칸, 기업)
+
+    grid = {name: np.tile(column, STEPS) for name, column in columns.items()}
+    grid[field] = np.tile(x, STEPS) + sign * offsets.ravel()
+    changed = (brain.analyze_companies(grid, CONTEXT).actions.reshape(STEPS, size) != base) & (offsets > 0)
+
+    hit = changed.any(axis=0)
+    first = changed.argmax(axis=0)
+    cols = np.arange(size)
+    before = np.where(first > 0, offsets[np.maximum(first - 1, 0), cols], 0.0)
+    return np.where(hit, before, np.nan), np.where(hit, offsets[first, cols], np.nan)
+
+@pytest.fixture(scope='module')
+def analysis():
+    companies = _companies()
+    analyzer = SensitivityAnalyzer(steps=STEPS, tolerance=1e-6)
+    return companies, analyzer, analyzer.analyze(companies, CONTEXT)
+
+def test_base_actions_match_analyze_company(analysis):
+    companies, analyzer, result = analysis
+    for b, (investor_id, brain) in enumerate(analyzer.brains.items()):
+        expected = [brain.analyze_company(company, CONTEXT).action for company in companies]
+        assert [ACTIONS[code] for code in result.base_actions[b]] == expected, investor_id
+
+def test_margins_match_full_grid_scan(analysis):
+    companies, analyzer, result = analysis
+    columns = company_columns(companies)
+    tolerance = analyzer.tolerance * 2
+
+    flips = 0
+    for b, (investor_id, brain) in enumerate(analyzer.brains.items()):
+        base = brain.analyze_companies(columns, CONTEXT).actions
+        for f, field in enumerate(result.fields):
+            for sign, distances in ((1.0, result.up), (-1.0, result.down)):
+                before, after = _scan(brain, columns, base, field, sign, analyzer.spans[field])
+                found = np.isfinite(distances[b, f])
+
+                np.testing.assert_array_equal(found, ~np.isnan(before), err_msg=f'{investor_id} {field} {sign}')
+                assert np.all(distances[b, f][found] > before[found] - tolerance)
+                assert np.all(distances[b, f][found] <= after[found] + tolerance)
+                flips += int(found.sum())
+    assert flips > 0
+
+def test_reported_flip_is_real_in_the_scalar_path(analysis):
+    companies, analyzer, result = analysis
+    for b, (investor_id, brain) in enumerate(analyzer.brains.items()):
+        for f, field in enumerate(result.fields):
+            for sign, distances, actions in ((1.0, result.up, result.up_actions), (-1.0, result.down, result.down_actions)):
+                for j in np.flatnonzero(np.isfinite(distances[b, f])):
+                    company = companies[j]
+                    value = getattr(company, field)
+                    moved = dataclasses.replace(company, **{field: value + sign * distances[b, f, j]})
+                    before = dataclasses.replace(company, **{field: value + sign * max(0.0, distances[b, f, j] - 1e-5)})
+
+                    flipped = brain.analyze_company(moved, CONTEXT).action
+                    assert flipped != ACTIONS[result.base_actions[b, j]]
+                    assert flipped == ACTIONS[actions[b, f, j]]
+                    assert brain.analyze_company(before, CONTEXT).action == ACTIONS[result.base_actions[b, j]]
+
+def test_nearest_flip_picks_smallest_relative_margin(analysis):
+    _, analyzer, result = analysis
+    nearest = result.nearest_flip('warren_buffett')
+    margins = result.margins('warren_buffett')
+
+    for j in range(len(result.tickers)):
+        relative = {field: margins[field][j] / result.spans[field] for field in result.fields}
+        best = min(relative.values())
+        if np.isfinite(best):
+            assert relative[nearest['field'][j]] == best
+            assert nearest['distance'][j] == margins[nearest['field'][j]][j]
+        else:
+            assert nearest['field'][j] == '' and nearest['flips_to'][j] == ''
+
+def test_unknown_fields_are_rejected():
+    with pytest.raises(ValueError):
+        SensitivityAnalyzer(fields=('sector',))
+    assert set(SensitivityAnalyzer().fields) == set(COMPANY_NUMERIC_FIELDS)
@@ -0,0 +1,92 @@
+import sqlite3
+
+import numpy as np
+import pytest
+
+pd = pytest.importorskip('pandas')
+pytest.importorskip('networkx')
+
+from advanced_ai.investor_brain import Company, create_investor_brain
+from advanced_ai.knowledge_graph_learner import ContinuousLearningSystem
+from advanced_ai.simulation import WalkForwardSimulation
+
+TICKERS = ['AAA', 'BBB', 'CCC', 'DDD']
+
+def _prices(n_days=400, seed=5):
+    rng = np.random.default_rng(seed)
+    closes = 100 * np.exp(np.cumsum(rng.normal(0.0003, 0.015, (n_days, len(TICKERS))), axis=0))
+    prices = pd.DataFrame(closes, index=pd.bdate_range('2020-01-01', periods=n_days), columns=TICKERS)
+    # DDD는 300일째 상장폐지
+    prices.iloc[300:, 3] = np.nan
+    return prices
+
+def _universe():
+    return [
+        Company(ticker, ticker, 'technology', 15 + 5 * i, 2.0, 18.0 + i, 0.5, 12.0, 0.4, 0.7, 'growth')
+        for i, ticker in enumerate(TICKERS)
+    ]
+
+def _brains():
+    return {'warren_buffett': create_investor_brain('warren_buffett'),
+            'george_soros': create_investor_brain('george_soros')}
+
+def _simulation(**kwargs):
+    return WalkForwardSimulation(_brains(), _universe(), _prices(), horizon=10, step=10, lookback=60, **kwargs)
+
+def test_delisted_names_stay_in_decision_universe():
+    sim = _simulation()
+    history = sim.run(resume=False)
+
+    # 상장폐지 직전 결정도 빠지지 않고, 마지막 거래 가격으로 실현된다
+    last_decision = history[history['decision_date'] == str(sim.dates[290].date())]
+    assert (last_decision['decisions'] == len(TICKERS)).all()
+    assert (last_decision['delisted'] == 1).all()
+
+    after = history[history['decision_date'] > str(sim.dates[300].date())]
+    assert (after['decisions'] == len(TICKERS) - 1).all()
+    assert history['mean_quality'].notna().all()
+
+def _rows(db_path):
+    with sqlite3.connect(db_path) as conn:
+        return (conn.execute("SELECT COUNT(*) FROM learning_experiences").fetchone()[0],
+                conn.execute("SELECT COUNT(*) FROM knowledge_triples").fetchone()[0])
+
+def test_resume_after_crash_does_not_duplicate_learning_rows(tmp_path, monkeypatch):
+    reference_db = str(tmp_path / 'reference.db')
+    with ContinuousLearningSystem(reference_db, batch_size=1) as system:
+        reference = _simulation(learning_system=system).run(resume=False)
+        system.close()
+
+    db_path = str(tmp_path / 'resumed.db')
+    checkpoint = str(tmp_path / 'sim.pkl')
+    system = ContinuousLearningSystem(db_path, batch_size=1)
+    crashing = _simulation(learning_system=system, checkpoint_path=checkpoint, checkpoint_every=4)
+
+    original_decide = WalkForwardSimulation._decide
+    calls = {'n': 0}
+
+    def crash_on_sixth(self, state, row):
+        calls['n'] += 1
+        if calls['n'] == 6:
+            raise RuntimeError('simulated crash')
+        return original_decide(self, state, row)
+
+    monkeypatch.setattr(WalkForwardSimulation, '_decide', crash_on_sixth)
+    with pytest.raises(RuntimeError):
+        crashing.run(resume=False)
+    system.close()
+    monkeypatch.setattr(WalkForwardSimulation, '_decide', original_decide)
+
+    # 5번째 스텝의 실현 행은 체크포인트(4스텝) 뒤에 이미 기록됨
+    assert _rows(db_path)[0] > 0
+
+    system = ContinuousLearningSystem(db_path, batch_size=1)
+    resumed = _simulation(learning_system=system, checkpoint_path=checkpoint, checkpoint_every=4).run(resume=True)
+    system.close()
+
+    assert _rows(db_path) == _rows(reference_db)
+    assert len(resumed) == len(reference)
+    pd.testing.assert_frame_equal(
+        resumed.drop(columns=['calibration_before', 'calibration_after']).reset_index(drop=True),
+        reference.drop(columns=['calibration_before', 'calibration_after']).reset_index(drop=True))
+    assert resumed['calibration_after'].tolist() == pytest.approx(reference['calibration_after'].tolist())
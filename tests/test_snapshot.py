@@ -0,0 +1,93 @@
+import threading
+import time
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from market_data import MarketDataProvider, MarketDataUnavailable, SnapshotEngine
+from market_data.record import synthetic_history
+from market_data.snapshot import YTD_OFFSET, align_closes, compute_changes
+
+def _reference_changes(close: pd.Series):
+    """티커 하나씩 계산하던 원래 규칙"""
+    values = close.dropna().to_numpy()
+    current = values[-1]
+    year_change = (current / values[0] - 1) * 100
+    ytd_change = (current / values[YTD_OFFSET] - 1) * 100 if len(values) > YTD_OFFSET else 0.0
+    return current, year_change, ytd_change
+
+class FakeProvider(MarketDataProvider):
+    def __init__(self, barrier=None, hang=()):
+        self.barrier = barrier
+        self.hang = set(hang)
+        self.release = threading.Event()
+
+    def history(self, ticker, period='1y', interval='1d'):
+        if self.barrier is not None:
+            self.barrier.wait(5)
+        if ticker in self.hang:
+            self.release.wait(5)
+        if ticker == 'BROKEN':
+            raise MarketDataUnavailable('no data')
+        if ticker == 'EMPTY':
+            return synthetic_history('AAPL', '1y').iloc[:0]
+        return synthetic_history(ticker, period)
+
+def test_changes_match_per_ticker_calculation():
+    rng = np.random.default_rng(1)
+    index = pd.bdate_range('2022-01-03', periods=300)
+    closes = {}
+    for name, length in [('long', 300), ('exact', YTD_OFFSET + 1), ('short', YTD_OFFSET), ('tiny', 1)]:
+        closes[name] = pd.Series(100 * np.exp(np.cumsum(rng.normal(0, 0.01, length))), index=index[-length:])
+    # 거래일이 다른 시장 (일부 날짜 빠짐)
+    closes['gappy'] = closes['long'].iloc[::3]
+
+    prices = align_closes(closes)
+    current, year_change, ytd_change = compute_changes(prices)
+
+    for i, name in enumerate(prices.columns):
+        np.testing.assert_allclose((current[i], year_change[i], ytd_change[i]), _reference_changes(closes[name]))
+
+def test_align_closes_merges_time_zones_by_calendar_day():
+    ny = synthetic_history('^GSPC', '1y')['Close']
+    utc = ny.tz_convert('UTC')
+
+    prices = align_closes({'ny': ny, 'utc': utc.iloc[:-5]})
+
+    assert prices.index.tz is None and len(prices) == len(ny)
+    assert prices['utc'].isna().sum() == 5
+    np.testing.assert_array_equal(prices['ny'].to_numpy()[:-5], prices['utc'].to_numpy()[:-5])
+
+def test_empty_snapshot():
+    current, year_change, ytd_change = compute_changes(align_closes({}))
+    assert len(current) == len(year_change) == len(ytd_change) == 0
+
+def test_fetch_runs_sources_concurrently_in_request_order():
+    tickers = {'VIX': '^VIX', 'S&P 500': '^GSPC', 'NASDAQ': '^IXIC', 'Apple': 'AAPL'}
+    engine = SnapshotEngine(FakeProvider(barrier=threading.Barrier(len(tickers))), max_workers=len(tickers))
+    try:
+        snapshot = engine.fetch(tickers)
+    finally:
+        engine.close()
+
+    assert snapshot.failures == {}
+    assert snapshot.names == list(tickers)
+    assert snapshot.as_dict()['Apple']['current'] == pytest.approx(synthetic_history('AAPL', '1y')['Close'].iloc[-1])
+
+def test_failures_are_collected_and_slow_sources_time_out():
+    provider = FakeProvider(hang={'^VIX'})
+    engine = SnapshotEngine(provider, max_workers=4, timeout=0.2)
+    try:
+        started = time.monotonic()
+        snapshot = engine.fetch(['AAPL', 'BROKEN', '^VIX', 'EMPTY', '^GSPC'])
+        elapsed = time.monotonic() - started
+    finally:
+        provider.release.set()
+        engine.close()
+
+    assert elapsed < 2.0
+    assert snapshot.names == ['AAPL', '^GSPC']
+    assert set(snapshot.failures) == {'BROKEN', '^VIX', 'EMPTY'}
+    assert snapshot.failures['BROKEN'].startswith('MarketDataUnavailable')
+    assert '0.2' in snapshot.failures['^VIX']
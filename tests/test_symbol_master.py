@@ -0,0 +1,51 @@
+from pathlib import Path
+
+import pytest
+
+from prototype.symbol_master import SymbolMaster
+
+DATA_DIR = Path(__file__).resolve().parent.parent / 'data' / 'investors'
+
+def test_lookup_both_directions_ignoring_case():
+    master = SymbolMaster()
+    master.add('KO', 'Coca-Cola', aliases=('Coke',))
+
+    assert master.ticker_for('coca-cola') == 'KO'
+    assert master.ticker_for('COKE') == 'KO'
+    assert master.name_for('KO') == 'Coca-Cola'
+    assert master.ticker_for('Pepsi') is None
+    assert master.name_for('PEP') is None
+
+def test_first_registration_of_a_name_wins():
+    master = SymbolMaster.from_mapping({'Google': 'GOOGL', 'Alphabet': 'GOOGL'})
+    master.add('GOOG', 'Google')
+
+    assert master.ticker_for('Google') == 'GOOGL'
+    assert master.name_for('GOOGL') == 'Google'
+    assert master.aliases_for('GOOGL') == ['Google', 'Alphabet']
+    assert 'GOOG' in master and master.name_for('GOOG') is None
+    assert len(master) == 2
+
+def test_load_csv_with_aliases(tmp_path):
+    path = tmp_path / 'symbols.csv'
+    path.write_text('ticker,name,aliases\nBRK-A,Berkshire Hathaway,Berkshire|BRK\nWMT,Walmart,\n', encoding='utf-8')
+
+    master = SymbolMaster.load(str(path))
+
+    assert master.ticker_for('berkshire') == 'BRK-A'
+    assert master.ticker_for('BRK') == 'BRK-A'
+    assert master.as_dict() == {'Berkshire Hathaway': 'BRK-A', 'Berkshire': 'BRK-A', 'BRK': 'BRK-A', 'Walmart': 'WMT'}
+
+def test_processor_imports_as_package_module_and_uses_symbol_file(tmp_path):
+    pytest.importorskip('requests')
+    pytest.importorskip('yfinance')
+    from prototype import investor_insight_processor as processor_module
+
+    assert processor_module.SymbolMaster is SymbolMaster
+
+    path = tmp_path / 'symbols.csv'
+    path.write_text('ticker,name,aliases\nKO,Coca-Cola,Coke\n', encoding='utf-8')
+    processor = processor_module.InvestorInsightProcessor(data_dir=str(DATA_DIR), symbol_file=str(path))
+
+    assert processor.stock_name_to_ticker == {'Coca-Cola': 'KO', 'Coke': 'KO'}
+    assert 'KO' in processor.extract_stock_mentions('I still drink a Coke every day.')
@@ -0,0 +1,63 @@
+import numpy as np
+import pytest
+
+from advanced_ai.investor_brain import Company, MarketContext, MarketPhase, company_columns, create_investor_brain
+from advanced_ai.universe import CompanyUniverse, encode_categories
+
+def _companies():
+    sectors = ['technology', 'finance', 'retail', 'technology', 'energy']
+    stages = ['growth', 'mature', 'early', 'declining', 'mature']
+    return [
+        Company(f'T{i}', f'Company {i}', sectors[i], 10.0 + i * 7, 1.5 + i, 8.0 + i * 5, 0.3 * i,
+                5.0 + i * 6, 0.1 * i, 0.9 - 0.1 * i, stages[i])
+        for i in range(5)
+    ]
+
+def test_encode_categories_round_trip():
+    values = ['b', 'a', 'c', 'a', 'b']
+    codes, categories = encode_categories(values)
+    assert categories.tolist() == ['a', 'b', 'c']
+    assert categories[codes].tolist() == values
+
+    # 주어진 범주 순서(정렬 안 됨)로도 같은 값으로 복원
+    codes, categories = encode_categories(values, np.array(['c', 'a', 'b']))
+    assert categories[codes].tolist() == values
+
+def test_encode_categories_unknown_and_empty():
+    with pytest.raises(ValueError):
+        encode_categories(['a', 'z'], ['a', 'b'])
+    with pytest.raises(ValueError):
+        encode_categories(['a'], [])
+
+    codes, categories = encode_categories([], [])
+    assert len(codes) == 0 and len(categories) == 0
+    codes, categories = encode_categories([])
+    assert len(codes) == 0 and len(categories) == 0
+
+def test_universe_round_trip_to_companies():
+    companies = _companies()
+    universe = CompanyUniverse.from_companies(companies)
+    assert universe.to_companies() == companies
+    assert universe[1].sector == 'finance'
+    assert universe.filter(universe.is_sector('technology')).ticker.tolist() == ['T0', 'T3']
+    assert universe[1:3].to_companies() == companies[1:3]
+
+def test_universe_columns_keep_fixed_width_categories():
+    universe = CompanyUniverse.from_companies(_companies())
+    columns = company_columns(universe)
+
+    assert columns['sector'].dtype.kind == 'U'
+    assert columns['growth_stage'].dtype.kind == 'U'
+    expected = company_columns(_companies())
+    for field, values in expected.items():
+        assert columns[field].tolist() == values.tolist()
+
+def test_universe_scores_like_company_list():
+    context = MarketContext(MarketPhase.BEAR_MARKET, 0.6, -0.4, 0.3, ['rates'], [])
+    universe = CompanyUniverse.from_companies(_companies())
+    for investor_id in ('warren_buffett', 'peter_lynch', 'howard_marks', 'george_soros'):
+        brain = create_investor_brain(investor_id)
+        from_universe = brain.analyze_companies(universe, context)
+        from_list = brain.analyze_companies(_companies(), context)
+        assert from_universe.actions.tolist() == from_list.actions.tolist()
+        np.testing.assert_array_equal(from_universe.confidences, from_list.confidences)